@@ -0,0 +1,108 @@
+"""
+Chunk Memory Benchmark
+Compares peak memory of per-chunk metadata copies with shared-metadata ChunkRecords.
+
+Chunk texts are drawn from a small shared pool so the numbers show the
+per-chunk overhead of each representation rather than the text itself.
+
+Usage:
+    python benchmarks/bench_chunk_memory.py --chunks 1000000
+"""
+
+import sys
+import gc
+import time
+import hashlib
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain.schema import Document
+from chunk_records import ChunkRecord
+
+def file_metadata(file_index: int) -> dict:
+    """Build file-level metadata shaped like process_document output."""
+    file_name = f"Company{file_index}2021.pdf"
+    return {
+        "file_name": file_name,
+        "file_type": "pdf",
+        "file_path": f"Data/{file_name}",
+        "pages": 24,
+        "page_extractors": {"pdfplumber": 24},
+        "character_count": 48211,
+        "word_count": 7930,
+        "company_name": f"Company{file_index}",
+        "industry": "Technology",
+        "funding_amount": "5",
+        "founding_year": "2021",
+        "document_id": hashlib.md5(file_name.encode()).hexdigest()
+    }
+
+def build_documents(num_chunks: int, chunks_per_file: int, texts: list) -> list:
+    """Previous representation: one metadata.copy() and Document per chunk."""
+    documents = []
+    for start in range(0, num_chunks, chunks_per_file):
+        metadata = file_metadata(start // chunks_per_file)
+        count = min(chunks_per_file, num_chunks - start)
+        for i in range(count):
+            chunk_metadata = metadata.copy()
+            chunk_metadata["chunk_id"] = f"{metadata['document_id']}_{i}"
+            chunk_metadata["chunk_index"] = i
+            chunk_metadata["total_chunks"] = count
+            documents.append(Document(page_content=texts[i % len(texts)], metadata=chunk_metadata))
+    return documents
+
+def build_records(num_chunks: int, chunks_per_file: int, texts: list) -> list:
+    """Compact representation: one shared metadata dict per file."""
+    records = []
+    for start in range(0, num_chunks, chunks_per_file):
+        metadata = file_metadata(start // chunks_per_file)
+        count = min(chunks_per_file, num_chunks - start)
+        for i in range(count):
+            records.append(ChunkRecord(metadata, i, count, texts[i % len(texts)]))
+    return records
+
+def measure(builder, *args) -> tuple:
+    """
+    Run a builder under tracemalloc.
+
+    Returns:
+        Tuple of (result, peak_bytes, seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, seconds
+
+def main():
+    """Run the benchmark and print peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=1_000_000, help="Number of chunks to build")
+    parser.add_argument("--chunks-per-file", type=int, default=200, help="Chunks per synthetic file")
+    args = parser.parse_args()
+
+    texts = [f"chunk text {i} " * 50 for i in range(1000)]
+    mb = 1024 * 1024
+
+    documents, doc_peak, doc_seconds = measure(build_documents, args.chunks, args.chunks_per_file, texts)
+    sample = [(doc.page_content, doc.metadata) for doc in documents[:args.chunks_per_file]]
+    del documents
+
+    records, rec_peak, rec_seconds = measure(build_records, args.chunks, args.chunks_per_file, texts)
+    identical = sample == [(doc.page_content, doc.metadata)
+                           for doc in (r.to_document() for r in records[:args.chunks_per_file])]
+
+    print(f"Chunks: {args.chunks:,} ({args.chunks_per_file} per file)")
+    print(f"Documents:    peak {doc_peak / mb:8.1f} MB, {doc_peak / args.chunks:6.0f} B/chunk, built in {doc_seconds:.2f}s")
+    print(f"ChunkRecords: peak {rec_peak / mb:8.1f} MB, {rec_peak / args.chunks:6.0f} B/chunk, built in {rec_seconds:.2f}s")
+    print(f"Memory saved: {1 - rec_peak / doc_peak:.1%}")
+    print(f"Identical Documents on conversion: {identical}")
+
+if __name__ == "__main__":
+    main()
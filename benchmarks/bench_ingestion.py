@@ -0,0 +1,241 @@
+"""
+Ingestion Benchmark Suite
+Measures throughput and peak RSS of each DocumentProcessor stage on a reproducible synthetic corpus.
+
+Stages:
+    extract  - PDF/PPTX parsing (extract_text_from_pdf/pptx minus cleaning)
+    clean    - _clean_text calls made during extraction
+    company  - extract_company_info
+    split    - text_splitter.split_text
+
+Results are written as JSON (one file per run) so runs can be compared
+across versions with --compare.
+
+Usage:
+    python benchmarks/bench_ingestion.py --pdfs 10 --pptx 10 --pages 30
+    python benchmarks/bench_ingestion.py --compare benchmarks/results/ingestion-<old>.json
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import argparse
+import logging
+import platform
+import tempfile
+import threading
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from document_processor import DocumentProcessor, EXTRACTOR_VERSION, get_rss_bytes
+from synthetic_docs import generate_corpus
+
+STAGES = ("extract", "clean", "company", "split")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+class RssSampler:
+    """Context manager that samples RSS in a background thread and keeps the peak."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, get_rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = get_rss_bytes()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, get_rss_bytes())
+
+def git_commit() -> str:
+    """Return the current git commit, or an empty string outside a checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def run_stages(processor: DocumentProcessor, corpus_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every stage over the corpus and collect raw totals.
+
+    Args:
+        processor: DocumentProcessor to benchmark
+        corpus_dir: Folder with the synthetic corpus
+
+    Returns:
+        Dictionary of stage -> totals (seconds, input_bytes, pages, chunks, peak_rss_bytes)
+    """
+    totals = {stage: {"seconds": 0.0, "input_bytes": 0, "pages": 0, "chunks": 0, "peak_rss_bytes": 0}
+              for stage in STAGES}
+
+    # Time cleaning inside extraction by wrapping the bound method
+    clean_text = processor._clean_text
+    clean_seconds = [0.0]
+
+    def timed_clean(text: str) -> str:
+        start = time.perf_counter()
+        try:
+            return clean_text(text)
+        finally:
+            clean_seconds[0] += time.perf_counter() - start
+
+    processor._clean_text = timed_clean
+
+    for file_path in processor.iter_files():
+        is_pdf = file_path.suffix.lower() == '.pdf'
+        file_bytes = file_path.stat().st_size
+
+        clean_seconds[0] = 0.0
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            if is_pdf:
+                text, metadata = processor.extract_text_from_pdf(file_path)
+            else:
+                text, metadata = processor.extract_text_from_pptx(file_path)
+            elapsed = time.perf_counter() - start
+        pages = metadata.get("pages") or metadata.get("slides") or 0
+        text_bytes = len(text.encode('utf-8'))
+
+        totals["extract"]["seconds"] += elapsed - clean_seconds[0]
+        totals["extract"]["input_bytes"] += file_bytes
+        totals["clean"]["seconds"] += clean_seconds[0]
+        totals["clean"]["input_bytes"] += text_bytes
+        for stage in ("extract", "clean"):
+            totals[stage]["pages"] += pages
+            totals[stage]["peak_rss_bytes"] = max(totals[stage]["peak_rss_bytes"], rss.peak)
+
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            processor.extract_company_info(text, file_path.name)
+            elapsed = time.perf_counter() - start
+        totals["company"]["seconds"] += elapsed
+        totals["company"]["input_bytes"] += text_bytes
+        totals["company"]["pages"] += pages
+        totals["company"]["peak_rss_bytes"] = max(totals["company"]["peak_rss_bytes"], rss.peak)
+
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            chunks = processor.text_splitter.split_text(text)
+            elapsed = time.perf_counter() - start
+        totals["split"]["seconds"] += elapsed
+        totals["split"]["input_bytes"] += text_bytes
+        totals["split"]["pages"] += pages
+        totals["split"]["peak_rss_bytes"] = max(totals["split"]["peak_rss_bytes"], rss.peak)
+        for stage in STAGES:
+            totals[stage]["chunks"] += len(chunks)
+
+    processor._clean_text = clean_text
+    return totals
+
+def summarize(runs: list) -> Dict[str, Dict[str, Any]]:
+    """
+    Turn per-run totals into rates, keeping the fastest run of each stage.
+
+    Args:
+        runs: List of run_stages results
+
+    Returns:
+        Dictionary of stage -> seconds, pages_per_sec, mb_per_sec, chunks_per_sec, peak_rss_mb
+    """
+    stages = {}
+    for stage in STAGES:
+        best = min((run[stage] for run in runs), key=lambda totals: totals["seconds"])
+        seconds = max(best["seconds"], 1e-9)
+        stages[stage] = {
+            "seconds": round(best["seconds"], 4),
+            "pages_per_sec": round(best["pages"] / seconds, 2),
+            "mb_per_sec": round(best["input_bytes"] / 1024 / 1024 / seconds, 3),
+            "chunks_per_sec": round(best["chunks"] / seconds, 2),
+            "peak_rss_mb": round(max(run[stage]["peak_rss_bytes"] for run in runs) / 1024 / 1024, 1)
+        }
+    return stages
+
+def print_results(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """Print a stage table, with speedups when a baseline result is given."""
+    print(f"{'stage':<10}{'seconds':>10}{'pages/s':>12}{'MB/s':>10}{'chunks/s':>12}{'peak RSS MB':>13}"
+          + (f"{'vs base':>10}" if baseline else ""))
+    for stage, metrics in result["stages"].items():
+        line = (f"{stage:<10}{metrics['seconds']:>10.3f}{metrics['pages_per_sec']:>12.1f}"
+                f"{metrics['mb_per_sec']:>10.2f}{metrics['chunks_per_sec']:>12.1f}{metrics['peak_rss_mb']:>13.1f}")
+        if baseline and stage in baseline.get("stages", {}):
+            line += f"{baseline['stages'][stage]['seconds'] / max(metrics['seconds'], 1e-9):>9.2f}x"
+        print(line)
+
+def main():
+    """Generate the corpus, run the stages and save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pdfs", type=int, default=5, help="Number of synthetic PDFs")
+    parser.add_argument("--pptx", type=int, default=5, help="Number of synthetic PPTX decks")
+    parser.add_argument("--pages", type=int, default=20, help="Pages per PDF")
+    parser.add_argument("--slides", type=int, default=15, help="Slides per PPTX")
+    parser.add_argument("--lines", type=int, default=30, help="Text lines per page")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the fastest is reported")
+    parser.add_argument("--mode", choices=["accurate", "adaptive"], default="accurate", help="PDF extraction mode")
+    parser.add_argument("--pptx-fast-path", action="store_true", help="Use the streaming PPTX extractor")
+    parser.add_argument("--corpus-dir", help="Keep the generated corpus here instead of a temp dir")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/ingestion-<time>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    corpus_dir = Path(args.corpus_dir or tempfile.mkdtemp(prefix="bench_corpus_"))
+    try:
+        corpus = generate_corpus(corpus_dir, args.pdfs, args.pptx, args.pages, args.slides, args.lines, args.seed)
+        print(f"Corpus: {corpus['files']} files, {corpus['pages']} pages, {corpus['bytes'] / 1024 / 1024:.1f} MB")
+
+        processor = DocumentProcessor(str(corpus_dir), pdf_extraction_mode=args.mode,
+                                      pptx_fast_path=args.pptx_fast_path)
+        runs = [run_stages(processor, corpus_dir) for _ in range(args.repeat)]
+    finally:
+        if not args.corpus_dir:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    result = {
+        "benchmark": "ingestion",
+        "timestamp": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "extractor_version": EXTRACTOR_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "corpus_dir")},
+        "corpus": corpus,
+        "stages": summarize(runs)
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("config") != result["config"]:
+            print("Warning: baseline was run with a different configuration")
+    print_results(result, baseline)
+
+    output = Path(args.output) if args.output else \
+        RESULTS_DIR / f"ingestion-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Page-Parallel PDF Benchmark
+Times extraction of one large synthetic PDF sequentially and split into page ranges across worker processes.
+
+Usage:
+    python benchmarks/bench_page_parallel.py --pages 800 --workers 2 4 8
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from document_processor import DocumentProcessor
+from synthetic_docs import deck_pages, write_pdf
+
+def extract(processor: DocumentProcessor, file_path: Path) -> tuple:
+    """
+    Extract every page of a PDF.
+
+    Returns:
+        Tuple of (pages, seconds)
+    """
+    start = time.perf_counter()
+    pages = list(processor.iter_pages(file_path))
+    return pages, time.perf_counter() - start
+
+def main():
+    """Run the benchmark and print wall-clock timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=800, help="Pages in the synthetic PDF")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4], help="Worker counts to try")
+    parser.add_argument("--mode", choices=["accurate", "adaptive"], default="accurate", help="PDF extraction mode")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "Huge2024.pdf"
+        write_pdf(file_path, deck_pages(args.pages))
+        print(f"PDF: {args.pages} pages, {file_path.stat().st_size / 1024 / 1024:.1f} MB, {os.cpu_count()} CPUs")
+
+        baseline, sequential = extract(DocumentProcessor(tmp, pdf_extraction_mode=args.mode), file_path)
+        print(f"Sequential:          {sequential:7.2f}s")
+
+        for workers in args.workers:
+            processor = DocumentProcessor(tmp, pdf_extraction_mode=args.mode,
+                                          page_parallel_threshold=1, page_workers=workers)
+            pages, seconds = extract(processor, file_path)
+            print(f"{workers:2d} workers:          {seconds:7.2f}s  speedup {sequential / seconds:4.2f}x  "
+                  f"identical: {pages == baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Text Cleaning Micro-Benchmark
+Compares the two-pass text cleaner and precompiled, priority-ordered funding patterns with the previous uncompiled regex code.
+
+This is not a single-pass scanner: cleaning still collapses whitespace and
+then strips special characters, and funding extraction still tries up to
+five patterns in order, stopping at the first match.
+
+Usage:
+    python benchmarks/bench_text_scanner.py --size-mb 20
+"""
+
+import sys
+import re
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from document_processor import DocumentProcessor
+
+WORDS = [
+    "market", "growth", "customers", "platform", "revenue", "team", "product", "traction",
+    "we", "raise", "funding", "million", "the", "and", "for", "users", "SaaS", "B2B",
+    "©", "•", "—", "→", "€", "50%", "Q3", "2021", "(ARR)", "[beta]", "contact@acme.com"
+]
+
+def legacy_clean_text(text: str) -> str:
+    """Three-regex cleaner used before the compiled version."""
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'\/\%\$\&\@\#]', ' ', text)
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    return text.strip()
+
+def legacy_funding(text: str) -> str:
+    """Uncompiled funding search used before the precompiled patterns."""
+    funding_patterns = [
+        r'\$(\d+(?:\.\d+)?)\s*(?:million|M|mil)',
+        r'\$(\d+(?:\.\d+)?)\s*(?:billion|B|bil)',
+        r'(\d+(?:\.\d+)?)\s*(?:million|M|mil)',
+        r'raise\s*\$?(\d+(?:\.\d+)?)',
+        r'funding\s*\$?(\d+(?:\.\d+)?)'
+    ]
+    for pattern in funding_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(1)
+    return ""
+
+def make_corpus(size_mb: float, seed: int = 42) -> list:
+    """
+    Generate synthetic deck texts.
+
+    Args:
+        size_mb: Approximate total size in megabytes
+        seed: Random seed for reproducibility
+
+    Returns:
+        List of raw document texts
+    """
+    rng = random.Random(seed)
+    documents = []
+    total = 0
+    while total < size_mb * 1024 * 1024:
+        lines = []
+        for page in range(1, rng.randint(10, 40)):
+            lines.append(f"\n--- Page {page} ---\n")
+            for _ in range(rng.randint(5, 30)):
+                lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 15))) + "\n")
+        # Funding mention, usually near the end of the deck
+        if rng.random() < 0.8:
+            lines.append(f"We are raising ${rng.randint(1, 20)} million\n")
+        text = "".join(lines)
+        documents.append(text)
+        total += len(text)
+    return documents
+
+def main():
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=20.0, help="Synthetic corpus size in MB")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    documents = make_corpus(args.size_mb, args.seed)
+    processor = DocumentProcessor()
+    print(f"Corpus: {len(documents)} documents, {sum(map(len, documents)) / 1024 / 1024:.1f} MB")
+
+    start = time.perf_counter()
+    legacy = []
+    for text in documents:
+        cleaned = legacy_clean_text(text)
+        legacy.append((cleaned, legacy_funding(cleaned)))
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = []
+    for text in documents:
+        cleaned = processor._clean_text(text)
+        info = processor.extract_company_info(cleaned, "Deck2021.pdf")
+        current.append((cleaned, info["funding_amount"]))
+    current_seconds = time.perf_counter() - start
+
+    mb = sum(map(len, documents)) / 1024 / 1024
+    print(f"Legacy:      {legacy_seconds:.3f}s ({mb / legacy_seconds:.1f} MB/s)")
+    print(f"Current:     {current_seconds:.3f}s ({mb / current_seconds:.1f} MB/s)")
+    print(f"Speedup:     {legacy_seconds / current_seconds:.2f}x")
+    print(f"Identical output: {legacy == current}")
+
+if __name__ == "__main__":
+    main()
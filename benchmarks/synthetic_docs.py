@@ -0,0 +1,150 @@
+"""
+Synthetic Document Generator
+Writes reproducible pitch-deck-like PDF (minimal writer) and PPTX (python-pptx) files for benchmarks.
+"""
+
+import random
+from pathlib import Path
+from typing import List, Dict, Any
+from pptx import Presentation
+from pptx.util import Inches
+
+WORDS = [
+    "market", "growth", "customers", "platform", "revenue", "team", "product", "traction",
+    "we", "raise", "funding", "million", "the", "and", "for", "users", "SaaS", "B2B",
+    "retention", "pipeline", "margin", "pilot", "enterprise", "launch", "roadmap", "partners"
+]
+
+def deck_pages(num_pages: int, lines_per_page: int = 40, seed: int = 42) -> List[List[str]]:
+    """
+    Generate page texts for a synthetic deck.
+
+    Args:
+        num_pages: Number of pages
+        lines_per_page: Text lines per page
+        seed: Random seed for reproducibility
+
+    Returns:
+        List of pages, each a list of text lines
+    """
+    rng = random.Random(seed)
+    pages = []
+    for page in range(1, num_pages + 1):
+        lines = [f"Section {page}: we raise ${rng.randint(1, 20)} million"]
+        for _ in range(lines_per_page - 1):
+            lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))))
+        pages.append(lines)
+    return pages
+
+def _escape(line: str) -> str:
+    """Escape a line for a PDF string literal."""
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path: Path, pages: List[List[str]]):
+    """
+    Write a minimal, valid PDF with one Helvetica text block per page.
+
+    Args:
+        path: Output file path
+        pages: Page texts from deck_pages
+    """
+    num_pages = len(pages)
+    font_id = 3 + 2 * num_pages
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(num_pages))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>"
+    ]
+    for i, lines in enumerate(pages):
+        stream = "BT /F1 10 Tf 40 760 Td 13 TL " + " ".join(f"({_escape(line)}) '" for line in lines) + " ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+
+    Path(path).write_bytes(bytes(out))
+
+def write_pptx(path: Path, slides: List[List[str]], table_every: int = 5):
+    """
+    Write a PPTX deck with a title and a bullet text box per slide.
+
+    Every table_every-th slide also gets a small metrics table so the
+    table extraction path is exercised.
+
+    Args:
+        path: Output file path
+        slides: Slide texts from deck_pages (first line becomes the title)
+        table_every: Add a table on every n-th slide (0 disables tables)
+    """
+    presentation = Presentation()
+    layout = presentation.slide_layouts[5]  # Title only
+
+    for number, lines in enumerate(slides, 1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = lines[0]
+
+        body = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(4)).text_frame
+        body.text = lines[1] if len(lines) > 1 else ""
+        for line in lines[2:]:
+            body.add_paragraph().text = line
+
+        if table_every and number % table_every == 0:
+            table = slide.shapes.add_table(3, 3, Inches(0.5), Inches(5.5), Inches(9), Inches(1)).table
+            for row in range(3):
+                for col in range(3):
+                    table.cell(row, col).text = f"Q{col + 1} metric {row}" if row else f"Year {2020 + col}"
+
+    presentation.save(str(path))
+
+def generate_corpus(out_dir: Path, num_pdfs: int = 5, num_pptx: int = 5, pdf_pages: int = 20,
+                    pptx_slides: int = 15, lines_per_page: int = 30, seed: int = 42) -> Dict[str, Any]:
+    """
+    Write a reproducible mixed corpus of synthetic decks.
+
+    File names follow the "<Company><Year>" pattern of the real Data folder.
+
+    Args:
+        out_dir: Directory to write into (created if missing)
+        num_pdfs: Number of PDF decks
+        num_pptx: Number of PPTX decks
+        pdf_pages: Pages per PDF
+        pptx_slides: Slides per PPTX
+        lines_per_page: Text lines per page or slide
+        seed: Random seed; the same arguments always produce the same text
+
+    Returns:
+        Dictionary with "files", "pages" and "bytes" totals
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+
+    for i in range(num_pdfs):
+        path = out_dir / f"Synth{i:03d}Pdf{2015 + i % 10}.pdf"
+        write_pdf(path, deck_pages(pdf_pages, lines_per_page, seed + i))
+        files.append(path)
+
+    for i in range(num_pptx):
+        # Slides hold less text than a page
+        slides = deck_pages(pptx_slides, max(2, lines_per_page // 3), seed + 10000 + i)
+        path = out_dir / f"Synth{i:03d}Deck{2015 + i % 10}.pptx"
+        write_pptx(path, slides)
+        files.append(path)
+
+    return {
+        "files": len(files),
+        "pages": num_pdfs * pdf_pages + num_pptx * pptx_slides,
+        "bytes": sum(path.stat().st_size for path in files)
+    }
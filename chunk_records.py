@@ -0,0 +1,74 @@
+"""
+Compact Chunk Records
+Slotted chunk records that share one file-level metadata dict instead of copying it per chunk.
+"""
+
+from typing import List, Dict, Any, Optional, Iterable
+from langchain.schema import Document
+
+class ChunkRecord:
+    """
+    One text chunk plus only its own fields.
+
+    File-level metadata (file name, path, pages, company info, word counts,
+    document ID) lives in a single dict shared by every chunk of the file and
+    must not be mutated through a record. The full per-chunk metadata dict is
+    only built when the record is converted to a Document. Pickling a file's
+    records writes the shared dict once, so they are also cheaper to return
+    from worker processes.
+    """
+
+    __slots__ = ("file_metadata", "chunk_index", "total_chunks", "text", "token_count")
+
+    def __init__(self, file_metadata: Dict[str, Any], chunk_index: int, total_chunks: int,
+                 text: str, token_count: Optional[int] = None):
+        """
+        Initialize the record.
+
+        Args:
+            file_metadata: Shared file-level metadata
+            chunk_index: Position of the chunk in its file
+            total_chunks: Number of chunks in the file
+            text: Chunk text
+            token_count: Token count, set when chunking by tokens
+        """
+        self.file_metadata = file_metadata
+        self.chunk_index = chunk_index
+        self.total_chunks = total_chunks
+        self.text = text
+        self.token_count = token_count
+
+    def __repr__(self) -> str:
+        return f"ChunkRecord('{self.chunk_id}', {len(self.text)} chars)"
+
+    @property
+    def chunk_id(self) -> str:
+        """Vector ID of the chunk, derived from the document ID."""
+        return f"{self.file_metadata['document_id']}_{self.chunk_index}"
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Build the per-chunk metadata dict exactly as process_document used to."""
+        metadata = dict(self.file_metadata)
+        metadata["chunk_id"] = self.chunk_id
+        metadata["chunk_index"] = self.chunk_index
+        metadata["total_chunks"] = self.total_chunks
+        if self.token_count is not None:
+            metadata["token_count"] = self.token_count
+        return metadata
+
+    def to_document(self) -> Document:
+        """Convert the record to a LangChain Document."""
+        return Document(page_content=self.text, metadata=self.metadata)
+
+def to_documents(records: Iterable[ChunkRecord]) -> List[Document]:
+    """
+    Convert chunk records to LangChain Documents.
+
+    Args:
+        records: Chunk records
+
+    Returns:
+        List of Document objects
+    """
+    return [record.to_document() for record in records]
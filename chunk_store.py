@@ -0,0 +1,324 @@
+"""
+Columnar Chunk Store
+Persists chunk text, IDs and metadata as memory-mapped NumPy columns so later stages can reload chunks without re-extracting.
+"""
+
+import os
+import json
+import shutil
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
+import numpy as np
+import pandas as pd
+from langchain.schema import Document
+from chunk_records import ChunkRecord
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Per-chunk fields; everything else in a chunk's metadata is file-level
+_CHUNK_FIELDS = ("chunk_id", "chunk_index", "total_chunks", "token_count")
+_INT_COLUMNS = ("file_index", "chunk_index", "total_chunks", "token_count")
+_STRING_COLUMNS = ("chunk_id", "text")
+
+def _encode_strings(values: List[str]) -> tuple:
+    """
+    Pack strings into one UTF-8 blob plus an offsets array.
+
+    Returns:
+        Tuple of (blob, offsets) where string i is blob[offsets[i]:offsets[i + 1]]
+    """
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return b"".join(encoded), offsets
+
+class ChunkStore:
+    """
+    Read access to a chunk store directory.
+
+    Layout: one .npy file per integer column, a UTF-8 blob plus offsets per
+    string column (chunk_id, text), files.json with the file-level metadata
+    of each file stored once, and store.json with the format version and
+    row count. Columns are memory-mapped on open, so opening is O(files)
+    and only the rows and columns a caller asks for are ever decoded.
+    """
+
+    def __init__(self, store_dir: str):
+        """
+        Open an existing chunk store.
+
+        Args:
+            store_dir: Directory written by ChunkStore.write
+        """
+        self.store_dir = Path(store_dir)
+
+        with open(self.store_dir / "store.json", 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        if info.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported chunk store format {info.get('format_version')} in {store_dir}")
+
+        self.num_chunks = info["num_chunks"]
+        with open(self.store_dir / "files.json", 'r', encoding='utf-8') as f:
+            self._file_metadata: List[Dict[str, Any]] = json.load(f)
+        with open(self.store_dir / "extras.json", 'r', encoding='utf-8') as f:
+            self._extras = {int(row): extra for row, extra in json.load(f).items()}
+
+        self._ints = {name: self._load_array(f"{name}.npy") for name in _INT_COLUMNS}
+        self._offsets = {name: self._load_array(f"{name}.offsets.npy") for name in _STRING_COLUMNS}
+        self._blobs = {name: self._load_blob(f"{name}.bin") for name in _STRING_COLUMNS}
+        self._files_frame: Optional[pd.DataFrame] = None
+
+    def _load_array(self, name: str) -> np.ndarray:
+        """Memory-map a column array (empty arrays cannot be mapped)."""
+        try:
+            return np.load(self.store_dir / name, mmap_mode='r')
+        except ValueError:
+            return np.load(self.store_dir / name)
+
+    def _load_blob(self, name: str) -> Union[np.ndarray, bytes]:
+        """Memory-map a string blob."""
+        path = self.store_dir / name
+        if path.stat().st_size == 0:
+            return b""
+        return np.memmap(path, dtype=np.uint8, mode='r')
+
+    def __len__(self) -> int:
+        return self.num_chunks
+
+    @classmethod
+    def write(cls, store_dir: str, chunks: Iterable[Union[Document, ChunkRecord]]) -> "ChunkStore":
+        """
+        Write chunks to a new store, replacing any existing one atomically.
+
+        File-level metadata is stored once per document_id. A chunk whose
+        non-chunk fields differ from its file's (e.g. fields added by a caller
+        after processing) keeps the difference as a per-row extra.
+
+        Args:
+            store_dir: Target directory
+            chunks: Documents from process_document or ChunkRecords
+
+        Returns:
+            ChunkStore opened on the written directory
+        """
+        store_dir = Path(store_dir)
+        file_metadata: List[Dict[str, Any]] = []
+        file_lookup: Dict[Any, int] = {}
+        extras: Dict[int, Dict[str, Any]] = {}
+        columns = {name: [] for name in _INT_COLUMNS + _STRING_COLUMNS}
+
+        for row, chunk in enumerate(chunks):
+            if isinstance(chunk, ChunkRecord):
+                text, file_level = chunk.text, chunk.file_metadata
+                chunk_id, chunk_index, total_chunks, token_count = (
+                    chunk.chunk_id, chunk.chunk_index, chunk.total_chunks, chunk.token_count)
+            else:
+                metadata, text = chunk.metadata, chunk.page_content
+                file_level = {key: value for key, value in metadata.items() if key not in _CHUNK_FIELDS}
+                chunk_id = metadata.get("chunk_id", "")
+                chunk_index = metadata.get("chunk_index", 0)
+                total_chunks = metadata.get("total_chunks", 0)
+                token_count = metadata.get("token_count")
+
+            file_key = file_level.get("document_id") or file_level.get("file_path", "")
+            if file_key not in file_lookup:
+                file_lookup[file_key] = len(file_metadata)
+                file_metadata.append(dict(file_level))
+            shared = file_metadata[file_lookup[file_key]]
+            if file_level is not shared and file_level != shared:
+                extras[row] = {key: value for key, value in file_level.items() if shared.get(key) != value}
+
+            columns["file_index"].append(file_lookup[file_key])
+            columns["chunk_index"].append(chunk_index)
+            columns["total_chunks"].append(total_chunks)
+            columns["token_count"].append(-1 if token_count is None else token_count)
+            columns["chunk_id"].append(chunk_id)
+            columns["text"].append(text)
+
+        num_chunks = len(columns["text"])
+        tmp_dir = store_dir.with_name(f"{store_dir.name}.tmp-{os.getpid()}")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        for name in _INT_COLUMNS:
+            dtype = np.int64 if name == "token_count" else np.int32
+            np.save(tmp_dir / f"{name}.npy", np.asarray(columns[name], dtype=dtype))
+        for name in _STRING_COLUMNS:
+            blob, offsets = _encode_strings(columns[name])
+            with open(tmp_dir / f"{name}.bin", 'wb') as f:
+                f.write(blob)
+            np.save(tmp_dir / f"{name}.offsets.npy", offsets)
+
+        with open(tmp_dir / "files.json", 'w', encoding='utf-8') as f:
+            json.dump(file_metadata, f, default=str)
+        with open(tmp_dir / "extras.json", 'w', encoding='utf-8') as f:
+            json.dump(extras, f, default=str)
+        with open(tmp_dir / "store.json", 'w', encoding='utf-8') as f:
+            json.dump({"format_version": FORMAT_VERSION, "num_chunks": num_chunks,
+                       "num_files": len(file_metadata)}, f)
+
+        # Swap the finished store into place
+        if store_dir.exists():
+            old_dir = store_dir.with_name(f"{store_dir.name}.old-{os.getpid()}")
+            os.replace(store_dir, old_dir)
+            os.replace(tmp_dir, store_dir)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        else:
+            os.replace(tmp_dir, store_dir)
+
+        logger.info(f"Wrote {num_chunks} chunks from {len(file_metadata)} files to {store_dir}")
+        return cls(store_dir)
+
+    @property
+    def files(self) -> pd.DataFrame:
+        """File-level metadata, one row per stored file, indexed by file_index."""
+        if self._files_frame is None:
+            self._files_frame = pd.DataFrame(self._file_metadata)
+            self._files_frame.index.name = "file_index"
+        return self._files_frame
+
+    def select(self, **filters) -> np.ndarray:
+        """
+        Find rows matching equality filters without decoding any text.
+
+        Filters on file-level fields (company_name, file_name, document_id,
+        industry, ...) are resolved against the files table; filters on
+        chunk_index, total_chunks and token_count against the integer columns.
+        A list or tuple value matches any of its elements.
+
+        Args:
+            **filters: Field name -> value or list of values
+
+        Returns:
+            Sorted array of matching row numbers
+        """
+        mask = np.ones(self.num_chunks, dtype=bool)
+
+        for field, value in filters.items():
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if field in _INT_COLUMNS:
+                mask &= np.isin(self._ints[field], values)
+            elif field in self.files.columns:
+                matching_files = self.files.index[self.files[field].isin(values)].to_numpy()
+                mask &= np.isin(self._ints["file_index"], matching_files)
+            else:
+                raise KeyError(f"Unknown chunk store field: {field}")
+
+        return np.flatnonzero(mask)
+
+    def _strings(self, name: str, rows: np.ndarray) -> List[str]:
+        """Decode a string column for the given rows."""
+        offsets = self._offsets[name]
+        blob = self._blobs[name]
+        starts = offsets[rows]
+        ends = offsets[rows + 1]
+        return [bytes(blob[start:end]).decode('utf-8') for start, end in zip(starts.tolist(), ends.tolist())]
+
+    def _rows(self, rows: Optional[Iterable[int]], filters: Dict[str, Any]) -> np.ndarray:
+        """Combine explicit row numbers and filters into an integer array."""
+        if rows is None:
+            selected = np.arange(self.num_chunks)
+        else:
+            selected = np.asarray(rows, dtype=np.int64).reshape(-1)
+        if filters:
+            selected = selected[np.isin(selected, self.select(**filters))]
+        return selected
+
+    def to_frame(self, columns: Optional[List[str]] = None, rows: Optional[Iterable[int]] = None,
+                 **filters) -> pd.DataFrame:
+        """
+        Load a projection of the store as a DataFrame.
+
+        Only the requested columns are read; text is not decoded unless
+        "text" is among them.
+
+        Args:
+            columns: Chunk columns (chunk_id, text, chunk_index, total_chunks,
+                token_count) and/or file-level fields; defaults to all
+            rows: Optional explicit row numbers
+            **filters: Equality filters (see select)
+
+        Returns:
+            DataFrame indexed by row number
+        """
+        rows = self._rows(rows, filters)
+        if columns is None:
+            columns = list(_STRING_COLUMNS) + [name for name in _INT_COLUMNS if name != "file_index"] + \
+                list(self.files.columns)
+
+        data = {}
+        file_index = self._ints["file_index"][rows]
+        for column in columns:
+            if column in _STRING_COLUMNS:
+                data[column] = self._strings(column, rows)
+            elif column in _INT_COLUMNS:
+                data[column] = np.asarray(self._ints[column][rows])
+            elif column in self.files.columns:
+                data[column] = self.files[column].to_numpy()[file_index]
+            else:
+                raise KeyError(f"Unknown chunk store column: {column}")
+
+        return pd.DataFrame(data, index=pd.Index(rows, name="row"))
+
+    def iter_records(self, rows: Optional[Iterable[int]] = None, **filters) -> Iterator[ChunkRecord]:
+        """
+        Yield stored chunks as ChunkRecords sharing per-file metadata.
+
+        Args:
+            rows: Optional explicit row numbers
+            **filters: Equality filters (see select)
+
+        Yields:
+            ChunkRecord objects (rows with per-row extras get their own metadata dict)
+        """
+        rows = self._rows(rows, filters)
+
+        texts = self._strings("text", rows)
+        file_index = self._ints["file_index"][rows].tolist()
+        chunk_index = self._ints["chunk_index"][rows].tolist()
+        total_chunks = self._ints["total_chunks"][rows].tolist()
+        token_count = self._ints["token_count"][rows].tolist()
+
+        for i, row in enumerate(rows.tolist()):
+            metadata = self._file_metadata[file_index[i]]
+            if row in self._extras:
+                metadata = {**metadata, **self._extras[row]}
+            yield ChunkRecord(metadata, chunk_index[i], total_chunks[i], texts[i],
+                              None if token_count[i] < 0 else token_count[i])
+
+    def to_documents(self, rows: Optional[Iterable[int]] = None, **filters) -> List[Document]:
+        """
+        Load stored chunks as LangChain Documents.
+
+        Args:
+            rows: Optional explicit row numbers
+            **filters: Equality filters (see select)
+
+        Returns:
+            List of Document objects with the same content and metadata as were written
+        """
+        rows = self._rows(rows, filters)
+        texts = self._strings("text", rows)
+        chunk_ids = self._strings("chunk_id", rows)
+        file_index = self._ints["file_index"][rows].tolist()
+        chunk_index = self._ints["chunk_index"][rows].tolist()
+        total_chunks = self._ints["total_chunks"][rows].tolist()
+        token_count = self._ints["token_count"][rows].tolist()
+
+        documents = []
+        for i, row in enumerate(rows.tolist()):
+            metadata = dict(self._file_metadata[file_index[i]])
+            metadata["chunk_id"] = chunk_ids[i]
+            metadata["chunk_index"] = chunk_index[i]
+            metadata["total_chunks"] = total_chunks[i]
+            if token_count[i] >= 0:
+                metadata["token_count"] = token_count[i]
+            metadata.update(self._extras.get(row, {}))
+            documents.append(Document(page_content=texts[i], metadata=metadata))
+        return documents
@@ -0,0 +1,174 @@
+"""
+Corpus Discovery Module
+Lazily walks the Data folder (optionally recursively) and exposes documents inside .zip bundles.
+"""
+
+import io
+import os
+import logging
+import zipfile
+from datetime import datetime
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Sequence, Union, BinaryIO
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ArchiveStat:
+    """Minimal stat result for a zip member (size and modification time)."""
+
+    def __init__(self, st_size: int, st_mtime: float):
+        self.st_size = st_size
+        self.st_mtime = st_mtime
+
+class ArchiveMember:
+    """A document stored inside a .zip archive, addressed as "<archive>!/<member>"."""
+
+    def __init__(self, archive_path: Path, member_name: str, file_size: int, mtime: float):
+        """
+        Initialize the archive member reference.
+
+        Args:
+            archive_path: Path to the .zip file on disk
+            member_name: Name of the member inside the archive
+            file_size: Uncompressed member size in bytes
+            mtime: Member modification time as a timestamp
+        """
+        self.archive_path = Path(archive_path)
+        self.member_name = member_name
+        self.file_size = file_size
+        self.mtime = mtime
+
+        member = PurePosixPath(member_name)
+        self.name = member.name
+        self.suffix = member.suffix
+
+    def __str__(self) -> str:
+        return f"{self.archive_path}!/{self.member_name}"
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember('{self}')"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ArchiveMember) and str(self) == str(other)
+
+    def __lt__(self, other) -> bool:
+        return str(self) < str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def stat(self) -> ArchiveStat:
+        """Return the member's size and modification time."""
+        return ArchiveStat(self.file_size, self.mtime)
+
+    def read_bytes(self) -> bytes:
+        """Read the decompressed member contents."""
+        with zipfile.ZipFile(self.archive_path) as archive:
+            return archive.read(self.member_name)
+
+DocumentSource = Union[Path, ArchiveMember]
+
+def open_binary(source: DocumentSource) -> BinaryIO:
+    """
+    Open a document source for binary reading.
+
+    Archive members are decompressed into memory, never onto disk.
+
+    Args:
+        source: Path on disk or ArchiveMember
+
+    Returns:
+        Readable, seekable binary file object
+    """
+    if isinstance(source, ArchiveMember):
+        return io.BytesIO(source.read_bytes())
+    return open(source, 'rb')
+
+def as_parser_input(source: DocumentSource) -> Union[Path, BinaryIO]:
+    """
+    Return something pdfplumber, PyPDF2, python-pptx and zipfile can open.
+
+    Args:
+        source: Path on disk or ArchiveMember
+
+    Returns:
+        The path itself, or an in-memory stream for archive members
+    """
+    if isinstance(source, ArchiveMember):
+        return io.BytesIO(source.read_bytes())
+    return source
+
+def _matches(name: str, patterns: Sequence[str]) -> bool:
+    """Check a file name against glob patterns, skipping hidden files like glob does."""
+    return not name.startswith('.') and any(fnmatchcase(name, pattern) for pattern in patterns)
+
+def iter_archive_members(archive_path: Path, patterns: Sequence[str]) -> Iterator[ArchiveMember]:
+    """
+    Yield supported documents inside a zip archive, in member-name order.
+
+    Args:
+        archive_path: Path to the .zip file
+        patterns: Glob patterns for supported documents
+
+    Yields:
+        ArchiveMember references
+    """
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            infos = sorted(archive.infolist(), key=lambda info: info.filename)
+    except (zipfile.BadZipFile, OSError) as e:
+        logger.warning(f"Skipping unreadable archive {archive_path}: {e}")
+        return
+
+    for info in infos:
+        if info.is_dir() or not _matches(PurePosixPath(info.filename).name, patterns):
+            continue
+        try:
+            mtime = datetime(*info.date_time).timestamp()
+        except ValueError:
+            mtime = 0.0
+        yield ArchiveMember(archive_path, info.filename, info.file_size, mtime)
+
+def iter_corpus_files(root: Path, patterns: Sequence[str], recursive: bool = False,
+                      include_archives: bool = False) -> Iterator[DocumentSource]:
+    """
+    Lazily yield documents under a folder in a stable, sorted order.
+
+    Each directory is listed with os.scandir and sorted on its own, so files
+    are yielded as soon as their directory has been read rather than after
+    the whole tree has been listed. A subdirectory's files are yielded at the
+    subdirectory's place among its siblings (depth-first), so the order is
+    stable between runs but differs from sorting full path strings: "a/x.pdf"
+    comes before "a.pdf".
+
+    Args:
+        root: Folder to scan
+        patterns: Glob patterns for supported documents (e.g. "*.pdf")
+        recursive: Descend into subdirectories
+        include_archives: Yield supported documents inside .zip files
+
+    Yields:
+        Paths on disk and ArchiveMember references
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError as e:
+        logger.warning(f"Cannot list {root}: {e}")
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not entry.name.startswith('.'):
+                    yield from iter_corpus_files(Path(entry.path), patterns, recursive, include_archives)
+            elif entry.is_file():
+                if _matches(entry.name, patterns):
+                    yield Path(entry.path)
+                elif include_archives and entry.name.lower().endswith('.zip'):
+                    yield from iter_archive_members(Path(entry.path), patterns)
+        except OSError as e:
+            logger.warning(f"Skipping {entry.path}: {e}")
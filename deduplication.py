@@ -0,0 +1,213 @@
+"""
+Chunk Deduplication Module
+Detects exact and near-duplicate chunks with MinHash + LSH so repeated deck content is embedded once.
+"""
+
+import re
+import zlib
+import hashlib
+import logging
+from typing import List, Dict, Any, Tuple, Optional
+import numpy as np
+from langchain.schema import Document
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Prime just above 2**32 for the universal hash family
+_MERSENNE_PRIME = np.uint64(4294967311)
+
+class ChunkDeduplicator:
+    """
+    Near-duplicate detector for document chunks.
+
+    Duplicates are dropped: only the first occurrence of a chunk is
+    embedded. Chunks are only compared within a scope: "document" (the
+    default) compares chunks of the same file, so deleting or filtering one
+    file never hides another file's content; "company" compares all decks
+    of one company_name (chunks without one fall back to their document), so
+    searches filtered by company still find everything, but deleting the
+    deck that holds the kept copy removes the content until the others are
+    re-ingested.
+
+    The signature index lives in memory for the lifetime of the instance,
+    not in the vector index, so an incremental run that only processes
+    changed files is only deduplicated within those files.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64, shingle_size: int = 5,
+                 embedding_dimension: int = 1536, seed: int = 1, scope: str = "document"):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            threshold: Estimated Jaccard similarity at or above which chunks are duplicates
+            num_perm: Number of MinHash permutations
+            shingle_size: Number of consecutive words per shingle
+            embedding_dimension: Vector dimension, used to estimate index space saved
+            seed: Seed for the hash permutations (fixed so signatures are stable across runs)
+            scope: "document" or "company"; chunks are only compared within the same scope
+        """
+        if scope not in ("document", "company"):
+            raise ValueError(f"Unknown dedup scope: {scope}")
+
+        self.scope = scope
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.embedding_dimension = embedding_dimension
+
+        rng = np.random.RandomState(seed)
+        self._perm_a = rng.randint(1, 2 ** 31, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.randint(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self.bands, self.rows = self._choose_bands(num_perm, threshold)
+
+        # Index state, kept across calls; exact and bucket keys are prefixed with the scope
+        self._exact: Dict[str, str] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+        """
+        Pick the LSH band/row split whose S-curve threshold is closest to the target.
+
+        Args:
+            num_perm: Number of MinHash permutations
+            threshold: Target similarity threshold
+
+        Returns:
+            Tuple of (bands, rows)
+        """
+        best = (num_perm, 1)
+        best_error = float("inf")
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+            if error < best_error:
+                best, best_error = (bands, rows), error
+        return best
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase and collapse whitespace for comparison."""
+        return re.sub(r'\s+', ' ', text.lower()).strip()
+
+    def _signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a normalized text.
+
+        Args:
+            text: Normalized text
+
+        Returns:
+            Array of num_perm minimum hash values
+        """
+        words = text.split()
+        if len(words) <= self.shingle_size:
+            shingles = {" ".join(words)}
+        else:
+            shingles = {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._perm_a) + self._perm_b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+    def _scope_key(self, doc: Document) -> str:
+        """Get the scope a chunk is deduplicated within."""
+        metadata = doc.metadata
+        document = str(metadata.get("document_id") or metadata.get("file_path") or "")
+        if self.scope == "company" and metadata.get("company_name"):
+            return "company:" + str(metadata["company_name"]).lower()
+        return "document:" + document
+
+    def _find_near_duplicate(self, scope: str, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        """
+        Look up LSH buckets for an indexed chunk similar to the signature.
+
+        Args:
+            scope: Scope key from _scope_key
+            signature: MinHash signature
+
+        Returns:
+            Tuple of (chunk_id, estimated_similarity) or None
+        """
+        prefix = scope.encode() + b"\0"
+        candidates = set()
+        for band in range(self.bands):
+            key = prefix + signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best = None
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+        return best
+
+    def _index(self, scope: str, chunk_id: str, signature: np.ndarray):
+        """Add a canonical chunk's signature to the LSH buckets of its scope."""
+        prefix = scope.encode() + b"\0"
+        self._signatures[chunk_id] = signature
+        for band in range(self.bands):
+            key = prefix + signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            self._buckets[band].setdefault(key, []).append(chunk_id)
+
+    def deduplicate(self, documents: List[Document]) -> Tuple[List[Document], Dict[str, Any]]:
+        """
+        Remove chunks that duplicate an earlier chunk in the same scope.
+
+        The first occurrence of each chunk is kept as the canonical copy.
+        Exact duplicates are caught by a content hash before MinHash runs.
+
+        Args:
+            documents: Chunks in ingestion order
+
+        Returns:
+            Tuple of (documents_to_embed, report)
+        """
+        unique = []
+        duplicates = []
+        chars_saved = 0
+
+        for i, doc in enumerate(documents):
+            chunk_id = doc.metadata.get("chunk_id") or f"chunk_{len(self._signatures)}_{i}"
+            scope = self._scope_key(doc)
+            normalized = self._normalize(doc.page_content)
+            digest = scope + "\0" + hashlib.sha1(normalized.encode()).hexdigest()
+
+            match = None
+            if digest in self._exact:
+                match = (self._exact[digest], 1.0)
+            else:
+                signature = self._signature(normalized)
+                match = self._find_near_duplicate(scope, signature)
+                if match is None:
+                    self._exact[digest] = chunk_id
+                    self._index(scope, chunk_id, signature)
+
+            if match is None:
+                unique.append(doc)
+                continue
+
+            duplicates.append({"chunk_id": chunk_id, "duplicate_of": match[0], "similarity": round(match[1], 3)})
+            chars_saved += len(doc.page_content)
+
+        report = {
+            "input_chunks": len(documents),
+            "unique_chunks": len(unique),
+            "duplicate_chunks": len(duplicates),
+            "embedding_calls_saved": len(duplicates),
+            "characters_saved": chars_saved,
+            "index_bytes_saved": len(duplicates) * self.embedding_dimension * 4,
+            "duplicates": duplicates
+        }
+
+        logger.info(
+            f"Deduplication: {len(duplicates)}/{len(documents)} chunks are duplicates "
+            f"({len(duplicates)} embedding calls saved)"
+        )
+        return unique, report
@@ -4,9 +4,15 @@ Extracts text from PDFs and PowerPoint files, processes them into chunks for vec
 """
 
 import os
+import sys
+import gc
 import logging
 import re
-from typing import List, Dict, Any, Tuple
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional, Iterator, Iterable, Callable
 from pathlib import Path
 import PyPDF2
 import pdfplumber
@@ -14,141 +20,839 @@ from pptx import Presentation
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 import hashlib
+from collections import Counter
+from functools import partial
+from ingestion_manifest import IngestionManifest
+from extraction_cache import ExtractionCache
+from deduplication import ChunkDeduplicator
+from chunk_records import ChunkRecord, to_documents
+from ingest_telemetry import reset_peak_rss, get_peak_rss_bytes, summarize_telemetry, write_telemetry
+import pptx_fast_extractor
+from shard_coordinator import LeaseCoordinator
+from corpus_discovery import DocumentSource, as_parser_input, iter_corpus_files, open_binary
+from tokenization import EMBEDDING_ENCODING, count_tokens, count_tokens_batch, pack_token_batches
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump when extraction, cleaning or chunking output changes so manifests reprocess files
+EXTRACTOR_VERSION = "4"
+
+# Characters outside word chars, whitespace and basic punctuation
+_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'\/\%\$\&\@\#]')
+
+_NAME_PATTERNS = [
+    re.compile(r'^([a-zA-Z]+)'),  # First word in filename
+    re.compile(r'([A-Z][a-z]+)'),  # Capitalized words
+]
+
+_YEAR_PATTERN = re.compile(r'(20\d{2})')
+
+# Funding patterns in priority order
+_FUNDING_PATTERNS = [
+    re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:million|M|mil)', re.IGNORECASE),
+    re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:billion|B|bil)', re.IGNORECASE),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(?:million|M|mil)', re.IGNORECASE),
+    re.compile(r'raise\s*\$?(\d+(?:\.\d+)?)', re.IGNORECASE),
+    re.compile(r'funding\s*\$?(\d+(?:\.\d+)?)', re.IGNORECASE)
+]
+
+# Set in file-level worker processes; page-range splitting is disabled there
+# so a pool of file workers never multiplies into file workers x page workers
+_IN_FILE_WORKER = False
+
+class MemoryLimitExceeded(Exception):
+    """Raised when extraction pushes the worker's RSS past the configured ceiling."""
+
+def get_rss_bytes() -> int:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        RSS in bytes (peak RSS where /proc is unavailable)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource  # Unix only; imported lazily so Windows can still load this module
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return usage if sys.platform == "darwin" else usage * 1024
+
+def _mark_file_worker():
+    """Process initializer for file-level workers (disables page-range splitting)."""
+    global _IN_FILE_WORKER
+    _IN_FILE_WORKER = True
+
+def _deadline_worker(processor: "DocumentProcessor", file_path: Path, conn):
+    """
+    Child-process entry point for deadline-bounded processing.
+
+    Page-range splitting is disabled here: terminating the child on timeout
+    would otherwise orphan its page workers.
+
+    Args:
+        processor: DocumentProcessor to run
+        file_path: Path to the document
+        conn: Pipe connection used to send back (documents, telemetry)
+    """
+    _mark_file_worker()
+    try:
+        conn.send(processor._timed_process_document(file_path))
+    finally:
+        conn.close()
+
+def _pdf_range_worker(processor: "DocumentProcessor", file_path: Path,
+                      page_range: Tuple[int, int]) -> Tuple[List[Tuple[int, str]], List[str]]:
+    """
+    Worker entry point for extracting one page range of a PDF.
+
+    Args:
+        processor: DocumentProcessor to run
+        file_path: Path to the PDF file
+        page_range: (first, last) page numbers, inclusive
+
+    Returns:
+        Tuple of (cleaned pages, page_extractors for the range)
+    """
+    metadata = {}
+    pages = list(processor._iter_pdf_pages(file_path, metadata, page_range))
+    return pages, metadata["page_extractors"]
+
 class DocumentProcessor:
     """Handles extraction and processing of documents from the Data folder."""
     
-    def __init__(self, data_folder: str = "Data", chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, data_folder: str = "Data", chunk_size: int = 1000, chunk_overlap: int = 200,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 2 * 1024 ** 3,
+                 pdf_extraction_mode: str = "accurate", min_page_chars: int = 30,
+                 max_garbled_ratio: float = 0.1, length_unit: str = "chars",
+                 encoding_name: str = EMBEDDING_ENCODING, memory_limit_mb: Optional[int] = None,
+                 page_window: int = 50, pptx_fast_path: bool = False, recursive: bool = False,
+                 include_archives: bool = False, page_parallel_threshold: Optional[int] = None,
+                 page_workers: int = 0, page_range_size: Optional[int] = None,
+                 telemetry_path: Optional[str] = None):
         """
         Initialize the document processor.
         
         Args:
             data_folder: Path to the folder containing documents
-            chunk_size: Size of text chunks for vector storage
-            chunk_overlap: Overlap between chunks
+            chunk_size: Size of text chunks for vector storage (in length_unit)
+            chunk_overlap: Overlap between chunks (in length_unit)
+            cache_dir: Optional directory for the extraction cache; when set,
+                cleaned pages are reused across runs and chunking settings
+            cache_max_bytes: Size cap for the extraction cache
+            pdf_extraction_mode: "accurate" runs pdfplumber on every page;
+                "adaptive" uses PyPDF2 first and escalates individual pages
+                to pdfplumber when they fail the quality check
+            min_page_chars: Minimum non-whitespace characters for fast-path page text
+            max_garbled_ratio: Maximum share of garbled characters for fast-path page text
+            length_unit: "chars" measures chunks with len(); "tokens" measures
+                them with the tiktoken encoding used for embeddings
+            encoding_name: tiktoken encoding for token counts
+            memory_limit_mb: Optional per-worker RSS ceiling. When set, pdfplumber
+                reads PDFs in windows of page_window pages, releasing page caches
+                as it goes; a file that breaks the ceiling is finished in a
+                low-memory PyPDF2 mode
+            page_window: Pages per pdfplumber window in memory-bounded mode
+            pptx_fast_path: Stream slide XML out of the .pptx zip instead of
+                loading the python-pptx object model (falls back per deck)
+            recursive: Discover documents in subfolders of data_folder
+            include_archives: Ingest PDFs/PPTX inside .zip bundles in memory
+            page_parallel_threshold: Optional page count at or above which a PDF
+                is split into page ranges extracted by a process pool. Only
+                applies when files are processed sequentially without a
+                file_timeout; it pays off only on multi-core machines
+            page_workers: Worker processes per split PDF (0 uses one per CPU core)
+            page_range_size: Pages per range (defaults to an even split over page_workers)
+            telemetry_path: Optional JSON-lines file that per-file telemetry
+                records are appended to after every run
         """
+        if length_unit not in ("chars", "tokens"):
+            raise ValueError(f"Unknown length_unit: {length_unit}")
+        if pdf_extraction_mode not in ("accurate", "adaptive"):
+            raise ValueError(f"Unknown pdf_extraction_mode: {pdf_extraction_mode}")
+
         self.data_folder = Path(data_folder)
+        self.file_timings: Dict[str, float] = {}
+        self.file_telemetry: Dict[str, Dict[str, Any]] = {}
+        self.telemetry_path = telemetry_path
+        self._last_telemetry: Dict[str, Any] = {}
+        self.failed_files: Dict[str, str] = {}
+        self.throughput: Dict[str, Any] = {}
+        self.deduplicator: Optional[ChunkDeduplicator] = None
+        self.dedup_report: Dict[str, Any] = {}
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.pdf_extraction_mode = pdf_extraction_mode
+        self.min_page_chars = min_page_chars
+        self.max_garbled_ratio = max_garbled_ratio
+        self.length_unit = length_unit
+        self.memory_limit_mb = memory_limit_mb
+        self.page_window = page_window
+        self.pptx_fast_path = pptx_fast_path
+        self.recursive = recursive
+        self.include_archives = include_archives
+        self.page_parallel_threshold = page_parallel_threshold
+        self.page_workers = page_workers
+        self.page_range_size = page_range_size
+        self.encoding_name = encoding_name
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            length_function=len,
+            length_function=len if length_unit == "chars" else partial(count_tokens, encoding_name=encoding_name),
             separators=["\n\n", "\n", " ", ""]
         )
+        self.extraction_cache = None
+        if cache_dir:
+            self.extraction_cache = ExtractionCache(
+                cache_dir, f"{EXTRACTOR_VERSION}-{pdf_extraction_mode}{'-xml' if pptx_fast_path else ''}",
+                cache_max_bytes
+            )
         
-    def extract_text_from_pdf(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+    def _iter_pdf_pages(self, file_path: Path, metadata: Dict[str, Any],
+                        page_range: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[int, str]]:
         """
-        Extract text from PDF file using multiple methods for better accuracy.
-        
+        Yield cleaned PDF pages one at a time.
+
+        Dispatches on pdf_extraction_mode. If adaptive extraction fails
+        part-way through, the accurate path (pdfplumber, then PyPDF2) finishes
+        the file from the first page not yet yielded. The extractor that
+        produced each page is recorded in metadata["page_extractors"]. PDFs with at least
+        page_parallel_threshold pages are split into page ranges extracted
+        in parallel (see _iter_pdf_pages_parallel), except inside file-level
+        workers (max_workers > 1 or file_timeout), which already use the cores.
+
         Args:
             file_path: Path to the PDF file
-            
+            metadata: Metadata dict, updated with the page count
+            page_range: Optional (first, last) page numbers, inclusive, to extract
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        metadata["page_extractors"] = []
+
+        if page_range is None and self.page_parallel_threshold:
+            total_pages = self._count_pdf_pages(file_path)
+            if total_pages >= self.page_parallel_threshold and not _IN_FILE_WORKER:
+                yield from self._iter_pdf_pages_parallel(file_path, metadata, total_pages)
+                return
+
+        if self.pdf_extraction_mode == "adaptive":
+            try:
+                yield from self._iter_pdf_pages_adaptive(file_path, metadata, page_range)
+                return
+            except Exception as e:
+                # One entry is recorded per page handled, so this counts the pages already yielded
+                done = len(metadata["page_extractors"])
+                if not done:
+                    logger.warning(f"Adaptive extraction failed for {file_path}, using pdfplumber: {e}")
+                else:
+                    first_page, last_page = page_range or (1, metadata.get("pages") or self._count_pdf_pages(file_path))
+                    resume_page = first_page + done
+                    logger.warning(f"Adaptive extraction failed for {file_path} at page {resume_page}, "
+                                   f"finishing with pdfplumber: {e}")
+                    if resume_page <= last_page:
+                        resumed = {"page_extractors": []}
+                        yield from self._iter_pdf_pages_accurate(file_path, resumed, (resume_page, last_page))
+                        metadata["page_extractors"].extend(resumed["page_extractors"])
+                    return
+
+        yield from self._iter_pdf_pages_accurate(file_path, metadata, page_range)
+
+    @staticmethod
+    def _count_pdf_pages(file_path: Path) -> int:
+        """
+        Count the pages of a PDF without extracting any text.
+
+        Args:
+            file_path: Path to the PDF file
+
         Returns:
-            Tuple of (extracted_text, metadata)
+            Number of pages, or 0 if the file cannot be parsed
         """
-        text = ""
-        metadata = {
-            "file_name": file_path.name,
-            "file_type": "pdf",
-            "file_path": str(file_path),
-            "pages": 0
-        }
-        
         try:
-            # Try pdfplumber first (better for complex layouts)
-            with pdfplumber.open(file_path) as pdf:
+            with open_binary(file_path) as file:
+                return len(PyPDF2.PdfReader(file).pages)
+        except Exception as e:
+            logger.debug(f"Could not count pages of {file_path}: {e}")
+            return 0
+
+    def _iter_pdf_pages_parallel(self, file_path: Path, metadata: Dict[str, Any],
+                                 total_pages: int) -> Iterator[Tuple[int, str]]:
+        """
+        Extract page ranges of one large PDF in a process pool and yield them in order.
+
+        Each worker runs the normal extraction path (including the PyPDF2
+        fallback) on its range, so the output matches sequential extraction.
+        A range whose worker fails is re-extracted in this process.
+
+        Args:
+            file_path: Path to the PDF file
+            metadata: Metadata dict, updated with the page count
+            total_pages: Number of pages in the PDF
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        workers = self.page_workers or os.cpu_count() or 1
+        range_size = self.page_range_size or -(-total_pages // workers)
+        ranges = [(first, min(first + range_size - 1, total_pages))
+                  for first in range(1, total_pages + 1, range_size)]
+        logger.info(f"Splitting {file_path} ({total_pages} pages) into {len(ranges)} ranges over {workers} workers")
+
+        metadata["pages"] = total_pages
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            futures = [executor.submit(_pdf_range_worker, self, file_path, page_range) for page_range in ranges]
+            for page_range, future in zip(ranges, futures):
+                try:
+                    pages, page_extractors = future.result()
+                except Exception as e:
+                    logger.warning(f"Page range {page_range} of {file_path} failed in a worker, retrying here: {e}")
+                    pages, page_extractors = _pdf_range_worker(self, file_path, page_range)
+                metadata["page_extractors"].extend(page_extractors)
+                yield from pages
+
+    def _iter_pdf_pages_accurate(self, file_path: Path, metadata: Dict[str, Any],
+                                 page_range: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield cleaned PDF pages using pdfplumber for every page.
+
+        pdfplumber is tried first (better for complex layouts). If it fails
+        part-way through, PyPDF2 resumes from the first page that was not
+        yet yielded. Those pages are recorded as "pypdf2_fallback" so the
+        degraded text is not written to the extraction cache.
+
+        Args:
+            file_path: Path to the PDF file
+            metadata: Metadata dict, updated with the page count
+            page_range: Optional (first, last) page numbers, inclusive, to extract
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        page_extractors = metadata["page_extractors"]
+        first_page = page_range[0] if page_range else 1
+        next_page = first_page
+        low_memory = False
+
+        try:
+            for page_num, page_text in self._iter_pdfplumber_text(file_path, metadata, page_range):
+                next_page = page_num + 1
+                page_extractors.append("pdfplumber" if page_text else "empty")
+                if page_text:
+                    yield page_num, self._clean_text(f"\n--- Page {page_num} ---\n{page_text}\n")
+            return
+
+        except MemoryLimitExceeded as e:
+            logger.warning(f"{e}; finishing {file_path} from page {next_page} in low-memory mode")
+            low_memory = True
+
+        except Exception as e:
+            logger.warning(f"pdfplumber failed for {file_path} at page {next_page}, trying PyPDF2: {e}")
+
+        # Fallback to PyPDF2
+        gc.collect()
+        with open_binary(file_path) as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            metadata["pages"] = len(pdf_reader.pages)
+            last_page = page_range[1] if page_range else len(pdf_reader.pages)
+            del page_extractors[next_page - first_page:]
+
+            for page_num in range(next_page, last_page + 1):
+                page_text = pdf_reader.pages[page_num - 1].extract_text()
+                page_extractors.append("pypdf2_fallback" if page_text else "empty")
+                if low_memory:
+                    # Drop the parsed page so memory doesn't grow with page count
+                    pdf_reader.flattened_pages[page_num - 1] = None
+                    gc.collect()
+                if page_text:
+                    yield page_num, self._clean_text(f"\n--- Page {page_num} ---\n{page_text}\n")
+
+    def _iter_pdfplumber_text(self, file_path: Path, metadata: Dict[str, Any],
+                              page_range: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield raw page text from pdfplumber, closing each page after use.
+
+        Without a memory limit the whole document is opened once. With
+        memory_limit_mb set, the document is reopened for every window of
+        page_window pages so pdfminer's document-level caches are released,
+        and RSS is checked after every page.
+
+        Args:
+            file_path: Path to the PDF file
+            metadata: Metadata dict, updated with the page count
+            page_range: Optional (first, last) page numbers, inclusive, to extract
+
+        Yields:
+            Tuples of (page_number, raw_page_text)
+
+        Raises:
+            MemoryLimitExceeded: If RSS goes above memory_limit_mb
+        """
+        if not self.memory_limit_mb and page_range is None:
+            with pdfplumber.open(as_parser_input(file_path)) as pdf:
                 metadata["pages"] = len(pdf.pages)
                 for page_num, page in enumerate(pdf.pages, 1):
                     page_text = page.extract_text()
+                    page.close()
+                    yield page_num, page_text
+            return
+
+        with pdfplumber.open(as_parser_input(file_path)) as pdf:
+            total_pages = len(pdf.pages)
+        metadata["pages"] = total_pages
+        first_page, last_page = page_range or (1, total_pages)
+
+        if not self.memory_limit_mb:
+            with pdfplumber.open(as_parser_input(file_path), pages=range(first_page, last_page + 1)) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    page.close()
+                    yield page.page_number, page_text
+            return
+
+        limit_bytes = self.memory_limit_mb * 1024 * 1024
+        for start in range(first_page, last_page + 1, self.page_window):
+            end = min(start + self.page_window - 1, last_page)
+            with pdfplumber.open(as_parser_input(file_path), pages=range(start, end + 1)) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    page.close()
+                    rss = get_rss_bytes()
+                    if rss > limit_bytes:
+                        raise MemoryLimitExceeded(
+                            f"RSS {rss // (1024 * 1024)} MB exceeded {self.memory_limit_mb} MB "
+                            f"at page {page.page_number}"
+                        )
+                    yield page.page_number, page_text
+            gc.collect()
+
+    def _iter_pdf_pages_adaptive(self, file_path: Path, metadata: Dict[str, Any],
+                                 page_range: Optional[Tuple[int, int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield cleaned PDF pages using PyPDF2 first and pdfplumber only where needed.
+
+        Pages with neither a font resource nor a Form XObject (image-only
+        scans) are skipped without extracting. Pages whose fast text fails _is_usable_page_text are
+        re-extracted with pdfplumber, which is opened lazily on first use.
+
+        Args:
+            file_path: Path to the PDF file
+            metadata: Metadata dict, updated with the page count
+            page_range: Optional (first, last) page numbers, inclusive, to extract
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        page_extractors = metadata["page_extractors"]
+        plumber_pdf = None
+
+        try:
+            with open_binary(file_path) as file:
+                pdf_reader = PyPDF2.PdfReader(file)
+                metadata["pages"] = len(pdf_reader.pages)
+                first_page, last_page = page_range or (1, len(pdf_reader.pages))
+
+                for page_num in range(first_page, last_page + 1):
+                    page = pdf_reader.pages[page_num - 1]
+                    if not self._page_has_text_layer(page):
+                        page_extractors.append("skipped")
+                        continue
+
+                    try:
+                        page_text = page.extract_text()
+                        extractor = "pypdf2"
+                    except Exception as e:
+                        logger.debug(f"PyPDF2 failed on page {page_num} of {file_path}: {e}")
+                        page_text = ""
+                        extractor = ""
+
+                    if not self._is_usable_page_text(page_text):
+                        # Escalate this page only to the layout-aware extractor
+                        if plumber_pdf is None:
+                            plumber_pdf = pdfplumber.open(as_parser_input(file_path))
+                        plumber_page = plumber_pdf.pages[page_num - 1]
+                        plumber_text = plumber_page.extract_text()
+                        plumber_page.close()
+                        if plumber_text or not page_text:
+                            page_text = plumber_text
+                            extractor = "pdfplumber"
+
+                    page_extractors.append(extractor if page_text else "empty")
                     if page_text:
-                        text += f"\n--- Page {page_num} ---\n{page_text}\n"
-                        
-        except Exception as e:
-            logger.warning(f"pdfplumber failed for {file_path}, trying PyPDF2: {e}")
-            
-            # Fallback to PyPDF2
+                        yield page_num, self._clean_text(f"\n--- Page {page_num} ---\n{page_text}\n")
+        finally:
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+
+    @staticmethod
+    def _page_has_text_layer(page) -> bool:
+        """
+        Check whether a PyPDF2 page can contain text.
+
+        Text can be drawn with the page's own fonts or from inside a Form
+        XObject (which carries its own resources), so a page is only treated
+        as image-only when it has neither.
+
+        Args:
+            page: PyPDF2 page object
+
+        Returns:
+            False for pages with no font resources and no Form XObjects (e.g. scanned images)
+        """
+        try:
+            resources = page.get("/Resources")
+            if resources is None:
+                return False
+            resources = resources.get_object()
+            if "/Font" in resources:
+                return True
+            xobjects = resources.get("/XObject")
+            if xobjects is None:
+                return False
+            return any(xobject.get_object().get("/Subtype") == "/Form"
+                       for xobject in xobjects.get_object().values())
+        except Exception:
+            # Be conservative and extract when the resources can't be read
+            return True
+
+    def _is_usable_page_text(self, text: str) -> bool:
+        """
+        Quality check for fast-path page text.
+
+        Text fails the check when it has fewer than min_page_chars
+        non-whitespace characters or when more than max_garbled_ratio of
+        them are replacement, private-use, control or (cid:N) glyphs.
+
+        Args:
+            text: Raw page text
+
+        Returns:
+            True if the text can be used as-is
+        """
+        if not text:
+            return False
+
+        visible = len(text) - sum(1 for ch in text if ch.isspace())
+        if visible < self.min_page_chars:
+            return False
+
+        garbled = text.count("(cid:") * 6
+        garbled += sum(
+            1 for ch in text
+            if ch == "\ufffd" or "\ue000" <= ch <= "\uf8ff" or (ord(ch) < 32 and ch not in "\n\r\t")
+        )
+        return garbled / visible <= self.max_garbled_ratio
+
+    def _iter_pptx_slides(self, file_path: Path, metadata: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield cleaned PowerPoint slides one at a time.
+
+        With pptx_fast_path enabled the slide XML is streamed straight out of
+        the zip package; python-pptx takes over from the first slide the fast
+        path cannot handle.
+
+        Args:
+            file_path: Path to the PPTX file
+            metadata: Metadata dict, updated with the slide count
+
+        Yields:
+            Tuples of (slide_number, cleaned_slide_text)
+        """
+        next_slide = 1
+
+        if self.pptx_fast_path:
             try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    metadata["pages"] = len(pdf_reader.pages)
-                    
-                    for page_num, page in enumerate(pdf_reader.pages, 1):
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += f"\n--- Page {page_num} ---\n{page_text}\n"
-                            
-            except Exception as e2:
-                logger.error(f"Both PDF extraction methods failed for {file_path}: {e2}")
-                return "", metadata
-        
-        # Clean and normalize text
-        text = self._clean_text(text)
-        metadata["character_count"] = len(text)
-        metadata["word_count"] = len(text.split())
-        
-        return text, metadata
-    
-    def extract_text_from_pptx(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+                source = as_parser_input(file_path)
+                metadata["slides"] = pptx_fast_extractor.count_slides(source)
+                metadata["pptx_extractor"] = "xml"
+                for slide_num, slide_text in pptx_fast_extractor.iter_slide_texts(source):
+                    next_slide = slide_num + 1
+                    yield slide_num, self._clean_text(slide_text)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Fast PPTX extraction failed for {file_path} at slide {next_slide}, using python-pptx: {e}"
+                )
+
+        metadata["pptx_extractor"] = "python-pptx"
+        yield from self._iter_pptx_slides_object_model(file_path, metadata, next_slide)
+
+    def _iter_pptx_slides_object_model(self, file_path: Path, metadata: Dict[str, Any],
+                                       start_slide: int = 1) -> Iterator[Tuple[int, str]]:
         """
-        Extract text from PowerPoint file.
-        
+        Yield cleaned PowerPoint slides using the python-pptx object model.
+
         Args:
             file_path: Path to the PPTX file
-            
+            metadata: Metadata dict, updated with the slide count
+            start_slide: First slide number to yield
+
+        Yields:
+            Tuples of (slide_number, cleaned_slide_text)
+        """
+        presentation = Presentation(as_parser_input(file_path))
+        metadata["slides"] = len(presentation.slides)
+
+        for slide_num, slide in enumerate(presentation.slides, 1):
+            if slide_num < start_slide:
+                continue
+
+            parts = [f"\n--- Slide {slide_num} ---\n"]
+
+            # Extract text from shapes
+            for shape in slide.shapes:
+                if hasattr(shape, "text") and shape.text:
+                    parts.append(shape.text + "\n")
+
+                # Extract text from tables
+                if shape.has_table:
+                    for row in shape.table.rows:
+                        row_text = []
+                        for cell in row.cells:
+                            if cell.text:
+                                row_text.append(cell.text.strip())
+                        if row_text:
+                            parts.append(" | ".join(row_text) + "\n")
+
+            yield slide_num, self._clean_text("".join(parts))
+
+    def compare_pptx_extractors(self) -> Dict[str, Any]:
+        """
+        Benchmark the streaming XML and python-pptx extractors on the PPTX files in the data folder.
+
+        Returns:
+            Dictionary with per-file timings, whether both produced identical
+            text, and overall totals and speedup
+        """
+        results = {"files": {}, "xml_seconds": 0.0, "python_pptx_seconds": 0.0, "mismatches": []}
+
+        for file_path in self._discover_files():
+            if file_path.suffix.lower() != '.pptx':
+                continue
+
+            try:
+                start = time.perf_counter()
+                source = as_parser_input(file_path)
+                fast = [self._clean_text(text) for _, text in pptx_fast_extractor.iter_slide_texts(source)]
+                xml_seconds = time.perf_counter() - start
+            except Exception as e:
+                logger.warning(f"Fast PPTX extraction failed for {file_path}: {e}")
+                fast, xml_seconds = None, 0.0
+
+            start = time.perf_counter()
+            slow = [text for _, text in self._iter_pptx_slides_object_model(file_path, {})]
+            object_seconds = time.perf_counter() - start
+
+            results["files"][self.relative_name(file_path)] = {
+                "slides": len(slow),
+                "xml_seconds": round(xml_seconds, 4),
+                "python_pptx_seconds": round(object_seconds, 4),
+                "identical": fast == slow
+            }
+            results["xml_seconds"] += xml_seconds
+            results["python_pptx_seconds"] += object_seconds
+            if fast != slow:
+                results["mismatches"].append(self.relative_name(file_path))
+
+        if results["xml_seconds"]:
+            results["speedup"] = round(results["python_pptx_seconds"] / results["xml_seconds"], 2)
+        return results
+
+    def _base_metadata(self, file_path: Path, page_iterator: Optional[Callable] = None) -> Dict[str, Any]:
+        """
+        Build the file-level metadata dict for a document.
+
+        Args:
+            file_path: Path to the document
+            page_iterator: Page generator that will be used (defaults to choosing by suffix)
+
+        Returns:
+            Metadata dictionary with file name, type, path and page/slide count
+        """
+        if page_iterator is None:
+            is_pdf = file_path.suffix.lower() == '.pdf'
+        else:
+            is_pdf = page_iterator == self._iter_pdf_pages
+        if is_pdf:
+            return {"file_name": file_path.name, "file_type": "pdf", "file_path": str(file_path), "pages": 0}
+        return {"file_name": file_path.name, "file_type": "pptx", "file_path": str(file_path), "slides": 0}
+
+    def _cached_pages(self, file_path: Path, page_iterator: Callable,
+                      metadata: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield pages from the extraction cache, or parse and cache them on a miss.
+
+        Files where pdfplumber failed or hit the memory limit and PyPDF2
+        finished the job are not cached, so the next run retries pdfplumber
+        instead of serving the degraded text forever.
+
+        Args:
+            file_path: Path to the document
+            page_iterator: Page generator method used on a cache miss
+            metadata: Metadata dict, updated with the page/slide count
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        if self.extraction_cache is None:
+            yield from page_iterator(file_path, metadata)
+            return
+
+        content_hash = IngestionManifest.compute_file_hash(file_path)
+        cached = self.extraction_cache.get(content_hash)
+        if cached is not None:
+            pages, cached_metadata = cached
+            metadata.update(cached_metadata)
+            yield from pages
+            return
+
+        pages = []
+        for page in page_iterator(file_path, metadata):
+            pages.append(page)
+            yield page
+
+        if "pypdf2_fallback" in metadata.get("page_extractors", ()):
+            return
+
+        base_keys = ("file_name", "file_type", "file_path")
+        self.extraction_cache.put(
+            content_hash, pages, {key: value for key, value in metadata.items() if key not in base_keys}
+        )
+
+    def prune_extraction_cache(self) -> int:
+        """
+        Drop extraction cache entries for files no longer in the data folder.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.extraction_cache is None:
+            return 0
+
+        hashes = [IngestionManifest.compute_file_hash(file_path) for file_path in self._discover_files()]
+        return self.extraction_cache.prune(hashes)
+
+    def iter_pages(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Stream cleaned pages (PDF) or slides (PPTX) as they are parsed.
+
+        Only the current page is held in memory, so callers can start
+        downstream work before a large document has been fully read.
+
+        Args:
+            file_path: Path to the document
+            metadata: Optional dict that receives the page/slide count
+
+        Yields:
+            Tuples of (page_number, cleaned_page_text)
+        """
+        if metadata is None:
+            metadata = {}
+
+        suffix = file_path.suffix.lower()
+        if suffix == '.pdf':
+            yield from self._cached_pages(file_path, self._iter_pdf_pages, metadata)
+        elif suffix in ['.pptx', '.ppt']:
+            yield from self._cached_pages(file_path, self._iter_pptx_slides, metadata)
+        else:
+            raise ValueError(f"Unsupported file type: {file_path}")
+
+    def iter_chunks(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Stream text chunks as pages are parsed.
+
+        Pages are buffered until the buffer exceeds a few chunk sizes; all
+        chunks but the last are then emitted and the last one is carried over
+        so chunks can still span page boundaries. Memory stays bounded by a
+        few chunks regardless of document length.
+
+        Args:
+            file_path: Path to the document
+            metadata: Optional dict that receives the page/slide count
+
+        Yields:
+            Text chunks
+        """
+        buffer = ""
+        # Roughly four characters per token for English text
+        flush_at = self.chunk_size * (4 if self.length_unit == "chars" else 16)
+
+        for _, page_text in self.iter_pages(file_path, metadata):
+            if not page_text:
+                continue
+            buffer = f"{buffer} {page_text}" if buffer else page_text
+
+            if len(buffer) >= flush_at:
+                chunks = self.text_splitter.split_text(buffer)
+                yield from chunks[:-1]
+                buffer = chunks[-1] if chunks else ""
+
+        if buffer.strip():
+            yield from self.text_splitter.split_text(buffer)
+
+    def _extract_text(self, file_path: Path, page_iterator: Callable) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract and clean the full text of a document.
+
+        Pages are cleaned one at a time and joined with a single space, so
+        whitespace at page boundaries can differ from cleaning the whole
+        concatenated text (EXTRACTOR_VERSION was bumped for this).
+
+        Args:
+            file_path: Path to the document
+            page_iterator: Page generator method (_iter_pdf_pages or _iter_pptx_slides)
+
         Returns:
             Tuple of (extracted_text, metadata)
         """
-        text = ""
-        metadata = {
-            "file_name": file_path.name,
-            "file_type": "pptx",
-            "file_path": str(file_path),
-            "slides": 0
-        }
-        
+        metadata = self._base_metadata(file_path, page_iterator)
+
         try:
-            presentation = Presentation(file_path)
-            metadata["slides"] = len(presentation.slides)
-            
-            for slide_num, slide in enumerate(presentation.slides, 1):
-                slide_text = f"\n--- Slide {slide_num} ---\n"
-                
-                # Extract text from shapes
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        slide_text += shape.text + "\n"
-                    
-                    # Extract text from tables
-                    if shape.has_table:
-                        for row in shape.table.rows:
-                            row_text = []
-                            for cell in row.cells:
-                                if cell.text:
-                                    row_text.append(cell.text.strip())
-                            if row_text:
-                                slide_text += " | ".join(row_text) + "\n"
-                
-                text += slide_text
-                
+            text = " ".join(page_text for _, page_text in self._cached_pages(file_path, page_iterator, metadata)
+                            if page_text)
         except Exception as e:
             logger.error(f"Failed to extract text from {file_path}: {e}")
             return "", metadata
-        
-        # Clean and normalize text
-        text = self._clean_text(text)
+
         metadata["character_count"] = len(text)
         metadata["word_count"] = len(text.split())
-        
+
         return text, metadata
-    
+
+    def extract_text_from_pdf(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract text from PDF file using multiple methods for better accuracy.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            Tuple of (extracted_text, metadata)
+        """
+        return self._extract_text(file_path, self._iter_pdf_pages)
+
+    def extract_text_from_pptx(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract text from PowerPoint file.
+
+        Args:
+            file_path: Path to the PPTX file
+
+        Returns:
+            Tuple of (extracted_text, metadata)
+        """
+        return self._extract_text(file_path, self._iter_pptx_slides)
+
     def _clean_text(self, text: str) -> str:
         """
         Clean and normalize extracted text.
+
+        Whitespace runs are collapsed with str.split/join, then disallowed
+        special characters are replaced with spaces by one compiled regex.
         
         Args:
             text: Raw extracted text
@@ -159,23 +863,14 @@ class DocumentProcessor:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\'\/\%\$\&\@\#]', ' ', text)
-        
-        # Remove excessive newlines but preserve paragraph breaks
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        return text
-    
+        return _SPECIAL_CHARS_PATTERN.sub(' ', ' '.join(text.split())).strip()
+
     def extract_company_info(self, text: str, file_name: str) -> Dict[str, str]:
         """
         Extract company information from the document text.
+
+        All patterns are precompiled at import time; funding patterns are
+        searched in priority order and the search stops at the first hit.
         
         Args:
             text: Document text
@@ -193,33 +888,20 @@ class DocumentProcessor:
         }
         
         # Extract company name from filename (common pattern)
-        name_patterns = [
-            r'^([a-zA-Z]+)',  # First word in filename
-            r'([A-Z][a-z]+)',  # Capitalized words
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, file_name)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(file_name)
             if match:
                 company_info["company_name"] = match.group(1).lower().capitalize()
                 break
         
         # Extract year from filename
-        year_match = re.search(r'(20\d{2})', file_name)
+        year_match = _YEAR_PATTERN.search(file_name)
         if year_match:
             company_info["year"] = year_match.group(1)
         
         # Extract funding information from text
-        funding_patterns = [
-            r'\$(\d+(?:\.\d+)?)\s*(?:million|M|mil)',
-            r'\$(\d+(?:\.\d+)?)\s*(?:billion|B|bil)',
-            r'(\d+(?:\.\d+)?)\s*(?:million|M|mil)',
-            r'raise\s*\$?(\d+(?:\.\d+)?)',
-            r'funding\s*\$?(\d+(?:\.\d+)?)'
-        ]
-        
-        for pattern in funding_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _FUNDING_PATTERNS:
+            match = pattern.search(text)
             if match:
                 company_info["funding_amount"] = match.group(1)
                 break
@@ -236,88 +918,648 @@ class DocumentProcessor:
         Returns:
             List of Document objects with text chunks and metadata
         """
-        documents = []
+        return to_documents(self.process_document_records(file_path))
+
+    def process_document_records(self, file_path: Path) -> List[ChunkRecord]:
+        """
+        Process a single document into compact chunk records.
+
+        All chunks share one file-level metadata dict; use ChunkRecord.to_document
+        (or process_document) when LangChain Documents are needed.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            List of ChunkRecord objects
+        """
+        records = []
+        # Stage timings for _timed_process_document
+        telemetry = {"status": "failed", "stage_seconds": {}, "pages": 0, "extractor": "", "page_extractors": {}}
+        self._last_telemetry = telemetry
+        stages = telemetry["stage_seconds"]
 
         try:
             # Determine file type and extract text
+            stage_start = time.perf_counter()
             if file_path.suffix.lower() == '.pdf':
                 text, metadata = self.extract_text_from_pdf(file_path)
             elif file_path.suffix.lower() in ['.pptx', '.ppt']:
                 text, metadata = self.extract_text_from_pptx(file_path)
             else:
                 logger.warning(f"Unsupported file type: {file_path}")
-                return documents
+                telemetry["status"] = "unsupported"
+                return records
+            stages["extract"] = time.perf_counter() - stage_start
+            telemetry["pages"] = metadata.get("pages") or metadata.get("slides") or 0
+            telemetry.update(self._extractor_telemetry(metadata))
+            # Keep only the counts; the per-page list would be copied into every chunk
+            metadata.pop("page_extractors", None)
 
             if not text.strip():
                 logger.warning(f"No text extracted from {file_path}")
-                return documents
+                telemetry["status"] = "empty"
+                return records
 
             # Extract company information
+            stage_start = time.perf_counter()
             company_info = self.extract_company_info(text, file_path.name)
             metadata.update(company_info)
+            stages["company"] = time.perf_counter() - stage_start
 
             # Generate unique document ID
-            doc_id = hashlib.md5(str(file_path).encode()).hexdigest()
-            metadata["document_id"] = doc_id
+            metadata["document_id"] = self.document_id_for(file_path)
 
             # Split text into chunks
+            stage_start = time.perf_counter()
             text_chunks = self.text_splitter.split_text(text)
+            stages["split"] = time.perf_counter() - stage_start
+            token_counts = [None] * len(text_chunks)
+            if self.length_unit == "tokens":
+                stage_start = time.perf_counter()
+                token_counts = count_tokens_batch(text_chunks, self.encoding_name)
+                stages["tokens"] = time.perf_counter() - stage_start
 
-            # Create Document objects for each chunk
-            for i, chunk in enumerate(text_chunks):
-                chunk_metadata = metadata.copy()
-                chunk_metadata["chunk_id"] = f"{doc_id}_{i}"
-                chunk_metadata["chunk_index"] = i
-                chunk_metadata["total_chunks"] = len(text_chunks)
-
-                doc = Document(
-                    page_content=chunk,
-                    metadata=chunk_metadata
-                )
-                documents.append(doc)
+            # One shared metadata dict per file
+            records = [
+                ChunkRecord(metadata, i, len(text_chunks), chunk, token_counts[i])
+                for i, chunk in enumerate(text_chunks)
+            ]
 
+            telemetry["status"] = "ok"
             logger.info(f"Processed {file_path.name}: {len(text_chunks)} chunks created")
 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
+            telemetry["error"] = str(e)
 
-        return documents
+        return records
 
-    def process_all_documents(self) -> List[Document]:
+    @staticmethod
+    def document_id_for(file_path: DocumentSource) -> str:
         """
-        Process all documents in the data folder.
+        Get the document ID used for a file's chunks.
+
+        Args:
+            file_path: Path or ArchiveMember
 
         Returns:
-            List of all Document objects from all processed files
+            MD5 hex digest of the file path
         """
-        all_documents = []
+        return hashlib.md5(str(file_path).encode()).hexdigest()
+
+    @staticmethod
+    def _extractor_telemetry(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize which extractor produced a document.
+
+        Args:
+            metadata: Document metadata after extraction
+
+        Returns:
+            Dictionary with "extractor" (the PPTX extractor, or the PDF
+            extractor used for most pages) and "page_extractors" counts
+        """
+        if "pptx_extractor" in metadata:
+            return {"extractor": metadata["pptx_extractor"], "page_extractors": {}}
+
+        counts = Counter(metadata.get("page_extractors", []))
+        used = Counter({name: count for name, count in counts.items() if name not in ("empty", "skipped")})
+        return {
+            "extractor": used.most_common(1)[0][0] if used else "",
+            "page_extractors": dict(counts)
+        }
+
+    def _timed_process_document(self, file_path: Path) -> Tuple[List[Document], Dict[str, Any]]:
+        """
+        Process a single document and record its telemetry.
+
+        Peak RSS is reset before the file where the platform allows it, so
+        peak_rss_mb covers this file only; otherwise it is the process peak.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Tuple of (documents, telemetry record)
+        """
+        peak_is_per_file = reset_peak_rss()
+        rss_start = get_rss_bytes()
+        start = time.perf_counter()
+        documents = self.process_document(file_path)
+        elapsed = time.perf_counter() - start
+
+        try:
+            bytes_read = file_path.stat().st_size
+        except OSError:
+            bytes_read = 0
+
+        stages = self._last_telemetry
+        pages = stages.get("pages", 0)
+        mb = 1024 * 1024
+        telemetry = {
+            "file": str(file_path),
+            "file_name": file_path.name,
+            "file_type": file_path.suffix.lower().lstrip('.'),
+            "status": stages.get("status", "failed"),
+            "extractor": stages.get("extractor", ""),
+            "page_extractors": stages.get("page_extractors", {}),
+            "pages": pages,
+            "chunks": len(documents),
+            "bytes_read": bytes_read,
+            "stage_seconds": {stage: round(seconds, 4) for stage, seconds in stages.get("stage_seconds", {}).items()},
+            "total_seconds": round(elapsed, 4),
+            "pages_per_second": round(pages / elapsed, 2) if elapsed else 0.0,
+            "mb_per_second": round(bytes_read / mb / elapsed, 3) if elapsed else 0.0,
+            "peak_rss_mb": round(get_peak_rss_bytes() / mb, 1),
+            "peak_rss_scope": "file" if peak_is_per_file else "process",
+            "rss_delta_mb": round((get_rss_bytes() - rss_start) / mb, 1),
+            "pid": os.getpid()
+        }
+        if "error" in stages:
+            telemetry["error"] = stages["error"]
+        return documents, telemetry
+
+    def relative_name(self, file_path: DocumentSource) -> str:
+        """
+        Name a file by its path relative to the data folder.
+
+        Unlike the bare file name, this is unique within a recursive corpus,
+        so it is used to key per-file timings and summaries.
+
+        Args:
+            file_path: Path or ArchiveMember (or its string form)
+
+        Returns:
+            Relative path string (archive members as "archive.zip!/member")
+        """
+        return os.path.relpath(str(file_path), str(self.data_folder))
+
+    def _record_telemetry(self, file_path: DocumentSource, telemetry: Dict[str, Any]):
+        """Store a file's telemetry record and its processing time."""
+        self.file_timings[self.relative_name(file_path)] = telemetry["total_seconds"]
+        self.file_telemetry[str(file_path)] = telemetry
+
+    def _record_failure(self, file_path: DocumentSource, elapsed: float, reason: str):
+        """Store telemetry for a file that timed out or crashed its worker."""
+        self.failed_files[str(file_path)] = reason
+        self._record_telemetry(file_path, {
+            "file": str(file_path),
+            "file_name": file_path.name,
+            "file_type": file_path.suffix.lower().lstrip('.'),
+            "status": "failed",
+            "error": reason,
+            "stage_seconds": {},
+            "total_seconds": round(elapsed, 4)
+        })
+
+    def iter_files(self) -> Iterator[DocumentSource]:
+        """
+        Lazily yield the supported documents in the data folder.
+
+        Directories are listed one at a time, so callers can start processing
+        before a large tree has been fully scanned. With recursive set,
+        subfolders are included; with include_archives set, PDFs and decks
+        inside .zip bundles are yielded as ArchiveMember references and read
+        in memory without unpacking them to disk.
 
+        Yields:
+            Document paths (and archive members) in sorted path order
+        """
         if not self.data_folder.exists():
             logger.error(f"Data folder {self.data_folder} does not exist")
-            return all_documents
+            return
 
         # Get all PDF and PowerPoint files
         file_patterns = ['*.pdf', '*.pptx', '*.ppt']
-        files_to_process = []
+        yield from iter_corpus_files(self.data_folder, file_patterns, self.recursive, self.include_archives)
+
+    def _discover_files(self) -> List[DocumentSource]:
+        """
+        List the supported documents in the data folder.
 
-        for pattern in file_patterns:
-            files_to_process.extend(self.data_folder.glob(pattern))
+        Returns:
+            Sorted list of file paths (empty if the folder is missing)
+        """
+        return list(self.iter_files())
 
-        logger.info(f"Found {len(files_to_process)} files to process")
+    def _process_files(self, files_to_process: Iterable[DocumentSource], max_workers: Optional[int] = None,
+                       file_timeout: Optional[float] = None) -> List[Tuple[DocumentSource, List[Document]]]:
+        """
+        Process files, optionally across a process pool.
 
-        # Process each file
-        for file_path in files_to_process:
-            logger.info(f"Processing: {file_path.name}")
-            documents = self.process_document(file_path)
+        files_to_process may be a lazy iterator; work starts on the first
+        file while later ones are still being discovered. Files that time
+        out or crash a worker are left out of the results and recorded in
+        failed_files. Throughput figures for the run are stored in throughput.
+
+        Args:
+            files_to_process: Files to process
+            max_workers: Number of worker processes (None or 1 runs sequentially,
+                0 uses one worker per CPU core)
+            file_timeout: Optional wall-clock deadline in seconds per file; each
+                file then runs in its own process that is killed on expiry
+
+        Returns:
+            List of (file_path, documents) tuples in the order of files_to_process
+        """
+        results = []
+        attempted = []
+        self.file_timings = {}
+        self.file_telemetry = {}
+        self.failed_files = {}
+        run_start = time.perf_counter()
+
+        def track(files):
+            for file_path in files:
+                attempted.append(file_path)
+                yield file_path
+
+        if max_workers == 0:
+            max_workers = os.cpu_count() or 1
+
+        if file_timeout:
+            results = self._process_files_with_deadline(track(files_to_process), max_workers or 1, file_timeout)
+        elif max_workers and max_workers > 1:
+            # Parse files in parallel; map() submits each file as it is discovered
+            # and yields results in submission order
+            logger.info(f"Processing with {max_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_mark_file_worker) as executor:
+                timed = executor.map(self._timed_process_document, track(files_to_process))
+                for file_path, (documents, telemetry) in zip(attempted, timed):
+                    self._record_telemetry(file_path, telemetry)
+                    logger.info(f"Processed {file_path.name} in {telemetry['total_seconds']:.2f}s")
+                    results.append((file_path, documents))
+        else:
+            # Process each file
+            for file_path in track(files_to_process):
+                logger.info(f"Processing: {file_path.name}")
+                documents, telemetry = self._timed_process_document(file_path)
+                self._record_telemetry(file_path, telemetry)
+                logger.info(f"Processed {file_path.name} in {telemetry['total_seconds']:.2f}s")
+                results.append((file_path, documents))
+
+        wall_seconds = time.perf_counter() - run_start
+        completed = len(results)
+        self.throughput = {
+            "files_attempted": len(attempted),
+            "files_completed": completed,
+            "files_failed": len(self.failed_files),
+            "timed_out": sum(1 for reason in self.failed_files.values() if reason.startswith("timeout")),
+            "wall_seconds": round(wall_seconds, 3),
+            "files_per_second": round(completed / wall_seconds, 3) if wall_seconds else 0.0,
+            "seconds_lost_to_failures": round(
+                sum(self.file_timings.get(self.relative_name(file_path), 0.0)
+                    for file_path in attempted if str(file_path) in self.failed_files), 3
+            )
+        }
+
+        if self.telemetry_path and self.file_telemetry:
+            write_telemetry(self.telemetry_path, self.file_telemetry.values())
+        return results
+
+    def _process_files_with_deadline(self, files_to_process: Iterable[DocumentSource], max_workers: int,
+                                     file_timeout: float) -> List[Tuple[DocumentSource, List[Document]]]:
+        """
+        Process files in child processes that are terminated after file_timeout seconds.
+
+        Args:
+            files_to_process: Files to process
+            max_workers: Number of files processed concurrently
+            file_timeout: Wall-clock deadline in seconds per file
+
+        Returns:
+            List of (file_path, documents) tuples for files that completed, in input order
+        """
+        completed: Dict[int, List[Document]] = {}
+        submitted: List[DocumentSource] = []
+        pending = iter(files_to_process)
+        exhausted = False
+        running: Dict[Any, Tuple[int, Any, float]] = {}
+
+        while not exhausted or running:
+            while not exhausted and len(running) < max_workers:
+                file_path = next(pending, None)
+                if file_path is None:
+                    exhausted = True
+                    break
+                index = len(submitted)
+                submitted.append(file_path)
+                parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=_deadline_worker, args=(self, file_path, child_conn))
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (index, process, time.perf_counter())
+                logger.info(f"Processing: {file_path.name}")
+
+            if not running:
+                continue
+
+            now = time.perf_counter()
+            next_deadline = min(start + file_timeout for _, _, start in running.values())
+            for conn in wait(list(running), timeout=max(0.0, next_deadline - now)):
+                index, process, start = running.pop(conn)
+                file_path = submitted[index]
+                try:
+                    documents, telemetry = conn.recv()
+                    completed[index] = documents
+                    self._record_telemetry(file_path, telemetry)
+                    logger.info(f"Processed {file_path.name} in {telemetry['total_seconds']:.2f}s")
+                except EOFError:
+                    process.join()
+                    self._record_failure(file_path, time.perf_counter() - start,
+                                         f"crashed (exit code {process.exitcode})")
+                    logger.error(f"Worker crashed on {file_path} with exit code {process.exitcode}")
+                conn.close()
+                process.join()
+
+            now = time.perf_counter()
+            for conn, (index, process, start) in list(running.items()):
+                if now - start >= file_timeout:
+                    file_path = submitted[index]
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    del running[conn]
+                    self._record_failure(file_path, now - start, f"timeout after {file_timeout:.0f}s")
+                    logger.error(f"Abandoned {file_path} after {file_timeout:.0f}s")
+
+        return [(submitted[index], completed[index]) for index in sorted(completed)]
+
+    def process_all_documents(self, max_workers: Optional[int] = None,
+                              file_timeout: Optional[float] = None) -> List[Document]:
+        """
+        Process all documents in the data folder.
+
+        Files are sorted by path so the returned list has a stable order. When
+        ``max_workers`` is greater than 1 the files are spread across a process
+        pool; results are still collected in file order.
+
+        Args:
+            max_workers: Number of worker processes (None or 1 runs sequentially,
+                0 uses one worker per CPU core)
+            file_timeout: Optional per-file wall-clock deadline in seconds; files
+                that exceed it are skipped and listed in failed_files
+
+        Returns:
+            List of all Document objects from all processed files
+        """
+        all_documents = []
+        for file_path, documents in self._process_files(self.iter_files(), max_workers, file_timeout):
             all_documents.extend(documents)
 
+        logger.info(f"Processed {self.throughput.get('files_attempted', 0)} files")
+
         logger.info(f"Total documents created: {len(all_documents)}")
         return all_documents
 
+    def process_changed_documents(self, manifest_path: str = "ingestion_manifest.json",
+                                  max_workers: Optional[int] = None,
+                                  file_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Incrementally process the data folder using a persistent ingestion manifest.
+
+        Only new and modified files are extracted and chunked. Files that
+        yield no chunks are recorded with chunk_count 0 so they are not
+        re-extracted until they change; files whose processing raised are left
+        out of the manifest and retried next run. Deleted files are
+        dropped from the manifest and their chunk IDs are reported so the
+        corresponding vectors can be removed. Files that time out or crash a
+        worker are quarantined in the manifest and skipped until they change.
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+            max_workers: Number of worker processes (see process_all_documents)
+            file_timeout: Optional per-file wall-clock deadline in seconds
+
+        Returns:
+            Dictionary with "documents" (new chunks), "new", "modified",
+            "unchanged", "deleted", "quarantined" and "failed" file lists,
+            "stale_vector_ids" and "throughput" figures
+        """
+        manifest = IngestionManifest(manifest_path, extractor_version=EXTRACTOR_VERSION)
+        changes = manifest.diff(self._discover_files())
+        to_process = changes["new"] + changes["modified"]
+
+        logger.info(
+            f"Manifest diff: {len(changes['new'])} new, {len(changes['modified'])} modified, "
+            f"{len(changes['unchanged'])} unchanged, {len(changes['deleted'])} deleted, "
+            f"{len(changes['quarantined'])} quarantined"
+        )
+
+        stale_vector_ids = []
+        all_documents = []
+        snapshots: Dict[str, Dict[str, Any]] = {}
+
+        def snapshot_each(files):
+            # Capture each file's state just before it is handed to a worker
+            for file_path in files:
+                try:
+                    snapshots[str(file_path)] = IngestionManifest.snapshot(file_path)
+                except OSError as e:
+                    logger.warning(f"Could not stat {file_path}: {e}")
+                yield file_path
+
+        for file_path, documents in self._process_files(snapshot_each(to_process), max_workers, file_timeout):
+            key = str(file_path)
+            previous = manifest.entries.get(key, {})
+            old_ids = set(IngestionManifest.chunk_ids_for(previous))
+            status = self.file_telemetry.get(key, {}).get("status")
+
+            if not documents and status == "failed":
+                # Processing raised; retry on the next run
+                manifest.remove(key)
+                new_ids = set()
+            else:
+                doc_id = documents[0].metadata["document_id"] if documents else self.document_id_for(file_path)
+                manifest.record(file_path, doc_id, len(documents), snapshot=snapshots.get(key))
+                new_ids = {doc.metadata["chunk_id"] for doc in documents}
+
+            stale_vector_ids.extend(sorted(old_ids - new_ids))
+            all_documents.extend(documents)
+
+        for key in changes["deleted"]:
+            stale_vector_ids.extend(IngestionManifest.chunk_ids_for(manifest.remove(key)))
+
+        for file_path in to_process:
+            if str(file_path) in self.failed_files:
+                manifest.add_to_quarantine(file_path, self.failed_files[str(file_path)])
+
+        manifest.save()
+
+        return {
+            "documents": all_documents,
+            "new": changes["new"],
+            "modified": changes["modified"],
+            "unchanged": changes["unchanged"],
+            "deleted": changes["deleted"],
+            "quarantined": changes["quarantined"],
+            "failed": sorted(self.failed_files),
+            "stale_vector_ids": stale_vector_ids,
+            "throughput": self.throughput
+        }
+
+    def process_sharded(self, coordination_dir: str, node_id: Optional[str] = None,
+                        lease_seconds: float = 300.0, max_workers: Optional[int] = None,
+                        file_timeout: Optional[float] = None, poll_seconds: float = 5.0,
+                        max_attempts: int = 3) -> Dict[str, Any]:
+        """
+        Process the data folder cooperatively with other nodes sharing it.
+
+        Every node runs this with the same coordination_dir on a shared
+        filesystem. Files are claimed through leases (see LeaseCoordinator)
+        in batches of max_workers, processed with the usual pool/deadline
+        options, and written to per-file result files. Leases of nodes that
+        die expire after lease_seconds and are picked up by the others.
+        Files that fail are released and retried, by any node, up to
+        max_attempts times in total. The call returns once every file has
+        been completed by some node.
+
+        Args:
+            coordination_dir: Shared directory for leases and results
+            node_id: Unique name for this node (defaults to hostname-pid)
+            lease_seconds: Lease validity without a heartbeat
+            max_workers: Number of worker processes (see process_all_documents)
+            file_timeout: Optional per-file wall-clock deadline in seconds
+            poll_seconds: Wait between passes while other nodes hold the remaining leases
+            max_attempts: Failed attempts per file, across all nodes, before it is given up
+
+        Returns:
+            Dictionary with the combined "documents" from all nodes,
+            "processed_by_node" (files this node completed) and "failed"
+            (files this node gave up on, with their last error)
+        """
+        coordinator = LeaseCoordinator(coordination_dir, node_id, lease_seconds, self.data_folder, max_attempts)
+        batch_size = max(1, max_workers or 1)
+        processed = []
+        failed = {}
+
+        def run_batch(claimed: Dict[str, DocumentSource]):
+            keys = {str(file_path): key for key, file_path in claimed.items()}
+            results = self._process_files(list(claimed.values()), max_workers, file_timeout)
+            for file_path, documents in results:
+                telemetry = self.file_telemetry.get(str(file_path), {})
+                if not documents and telemetry.get("status") == "failed":
+                    # Processing raised; let any node retry it
+                    if coordinator.fail(keys.pop(str(file_path)), file_path, telemetry.get("error", "failed")):
+                        failed[str(file_path)] = telemetry.get("error", "failed")
+                    continue
+                coordinator.complete(keys.pop(str(file_path)), file_path, documents)
+                processed.append(str(file_path))
+            # Anything left timed out or crashed
+            for file_name, key in keys.items():
+                reason = self.failed_files.get(file_name, "failed")
+                if coordinator.fail(key, claimed[key], reason):
+                    failed[file_name] = reason
+
+        coordinator.start_heartbeat()
+        try:
+            while True:
+                pending = coordinator.pending_keys(self.iter_files())
+                if not pending:
+                    break
+
+                claimed = {}
+                progressed = False
+                for file_path in pending.values():
+                    key = coordinator.try_claim(file_path)
+                    if key is None:
+                        continue
+                    claimed[key] = file_path
+                    if len(claimed) >= batch_size:
+                        run_batch(claimed)
+                        claimed = {}
+                        progressed = True
+                if claimed:
+                    run_batch(claimed)
+                    progressed = True
+
+                if not progressed:
+                    logger.info(f"Waiting on {len(pending)} files leased by other nodes")
+                    time.sleep(poll_seconds)
+        finally:
+            coordinator.stop_heartbeat()
+
+        logger.info(f"Node {coordinator.node_id} processed {len(processed)} files")
+        return {
+            "documents": coordinator.collect_results(self.iter_files()),
+            "processed_by_node": processed,
+            "failed": failed
+        }
+
+    def deduplicate_documents(self, documents: List[Document], threshold: float = 0.9,
+                              scope: str = "document") -> List[Document]:
+        """
+        Drop near-duplicate chunks before they are embedded.
+
+        Chunks are only compared with chunks of the same document, or of the
+        same company with scope="company" (see ChunkDeduplicator), so one
+        company's content is never dropped in favour of another's.
+
+        The deduplicator keeps its index between calls, so chunks are also
+        compared with those from earlier batches processed by this instance.
+        The index is not persisted: chunks from changed files in an
+        incremental run are not compared with chunks ingested by earlier runs.
+
+        Args:
+            documents: Chunks from process_document/process_all_documents
+            threshold: Estimated Jaccard similarity for a chunk to count as a duplicate
+            scope: "document" or "company"
+
+        Returns:
+            Chunks that still need to be embedded
+        """
+        if self.deduplicator is None:
+            self.deduplicator = ChunkDeduplicator(threshold=threshold, scope=scope)
+
+        unique, self.dedup_report = self.deduplicator.deduplicate(documents)
+        return unique
+
+    def _document_token_counts(self, documents: List[Document]) -> List[int]:
+        """
+        Get token counts for documents, tokenizing only those without a recorded count.
+
+        Args:
+            documents: List of Document objects
+
+        Returns:
+            Token counts in document order
+        """
+        missing = [i for i, doc in enumerate(documents) if "token_count" not in doc.metadata]
+        counts = [doc.metadata.get("token_count", 0) for doc in documents]
+
+        if missing:
+            computed = count_tokens_batch([documents[i].page_content for i in missing], self.encoding_name)
+            for i, tokens in zip(missing, computed):
+                counts[i] = tokens
+
+        return counts
+
+    def pack_embedding_batches(self, documents: List[Document], max_batch_tokens: int = 300000,
+                               max_batch_size: int = 2048) -> List[List[Document]]:
+        """
+        Group chunks into consecutive batches that fill an embedding request budget.
+
+        Args:
+            documents: List of Document objects in upsert order
+            max_batch_tokens: Token budget per embedding request
+            max_batch_size: Maximum inputs per embedding request
+
+        Returns:
+            List of document batches, preserving order
+        """
+        return pack_token_batches(
+            documents, self._document_token_counts(documents), max_batch_tokens, max_batch_size
+        )
+
     def get_processing_summary(self, documents: List[Document]) -> Dict[str, Any]:
         """
         Generate a summary of the processing results.
 
+        Token statistics are only reported when chunks are sized in tokens
+        (their counts are already recorded); otherwise, or when the encoding
+        is unavailable, they are None rather than 0.
+
         Args:
             documents: List of processed documents
 
@@ -330,21 +1572,39 @@ class DocumentProcessor:
         # Group by file
         files = {}
         companies = set()
+        token_counts = None
+        if self.length_unit == "tokens":
+            try:
+                token_counts = self._document_token_counts(documents)
+            except Exception as e:
+                # Token counts need the tiktoken encoding, which may be unavailable offline
+                logger.warning(f"Could not count tokens for summary: {e}")
 
-        for doc in documents:
-            file_name = doc.metadata.get("file_name", "unknown")
+        for i, doc in enumerate(documents):
+            # Keyed by relative path so same-named files in different folders stay apart
+            file_path = doc.metadata.get("file_path")
+            file_name = self.relative_name(file_path) if file_path else doc.metadata.get("file_name", "unknown")
             company_name = doc.metadata.get("company_name", "")
 
             if file_name not in files:
+                telemetry = self.file_telemetry.get(file_path or "", {})
                 files[file_name] = {
                     "chunks": 0,
                     "total_chars": 0,
+                    "total_tokens": 0 if token_counts is not None else None,
                     "company": company_name,
-                    "file_type": doc.metadata.get("file_type", "unknown")
+                    "file_type": doc.metadata.get("file_type", "unknown"),
+                    "processing_seconds": round(self.file_timings.get(file_name, 0.0), 3),
+                    "page_extractors": telemetry.get("page_extractors", {}),
+                    "extractor": telemetry.get("extractor", ""),
+                    "pages_per_second": telemetry.get("pages_per_second", 0.0),
+                    "peak_rss_mb": telemetry.get("peak_rss_mb", 0.0)
                 }
 
             files[file_name]["chunks"] += 1
             files[file_name]["total_chars"] += len(doc.page_content)
+            if token_counts is not None:
+                files[file_name]["total_tokens"] += token_counts[i]
 
             if company_name:
                 companies.add(company_name.lower())
@@ -355,7 +1615,22 @@ class DocumentProcessor:
             "unique_companies": len(companies),
             "companies": sorted(list(companies)),
             "files": files,
-            "average_chunk_size": sum(len(doc.page_content) for doc in documents) / len(documents)
+            "average_chunk_size": sum(len(doc.page_content) for doc in documents) / len(documents),
+            "total_chars": sum(len(doc.page_content) for doc in documents),
+            "total_tokens": sum(token_counts) if token_counts is not None else None,
+            "average_chunk_tokens": sum(token_counts) / len(documents) if token_counts is not None else None,
+            "max_chunk_tokens": max(token_counts) if token_counts is not None else None,
+            "total_processing_seconds": round(sum(self.file_timings.values()), 3),
+            "failed_files": dict(self.failed_files),
+            "throughput": dict(self.throughput)
         }
 
+        if self.file_telemetry:
+            summary["telemetry"] = summarize_telemetry(self.file_telemetry.values())
+
+        if self.dedup_report:
+            summary["deduplication"] = {
+                key: value for key, value in self.dedup_report.items() if key != "duplicates"
+            }
+
         return summary
@@ -0,0 +1,227 @@
+"""
+Embedding Cache Module
+Persists embeddings in SQLite keyed by content hash, model and dimension so unchanged chunks and repeated queries are not re-embedded.
+"""
+
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding store shared by ingestion and search.
+
+    Vectors are stored as float64 blobs, so cached embeddings are
+    bit-identical to the floats the API returned. The database runs in WAL
+    mode with a busy timeout so several processes can read and write it at
+    once. Entries carry a last-used timestamp; once the stored vectors
+    exceed max_bytes the least recently used entries are deleted.
+    """
+
+    def __init__(self, db_path: str = ".embedding_cache.sqlite", model: str = "", dimension: int = 0,
+                 max_bytes: int = 1024 ** 3, touch_interval: float = 60.0):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            db_path: SQLite database file
+            model: Embedding model name, part of every key
+            dimension: Embedding dimension, part of every key
+            max_bytes: Size cap for stored vectors; least recently used entries are evicted beyond this
+            touch_interval: Seconds before a hit refreshes an entry's last-used time
+                again (avoids a write on every hit)
+        """
+        self.db_path = Path(db_path)
+        self.model = model
+        self.dimension = dimension
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+
+    def key(self, text: str) -> str:
+        """
+        Build the cache key for a text.
+
+        Args:
+            text: Text that was embedded
+
+        Returns:
+            SHA-256 hex digest of model, dimension and text
+        """
+        return hashlib.sha256(f"{self.model}\0{self.dimension}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for many texts.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Embeddings in the same order, with None for misses
+        """
+        keys = [self.key(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        stale = []
+        now = time.time()
+
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = list(set(keys[start:start + _LOOKUP_BATCH]))
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector, last_used FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, vector, last_used in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float64).tolist()
+                    if now - last_used > self.touch_interval:
+                        stale.append((now, key))
+
+            if stale:
+                try:
+                    self._conn.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", stale)
+                except sqlite3.OperationalError as e:
+                    # Recency is best effort; a busy database must not fail the lookup
+                    logger.debug(f"Could not refresh embedding cache recency: {e}")
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for result in results if result is not None)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]):
+        """
+        Store embeddings for many texts.
+
+        Args:
+            texts: Texts that were embedded
+            vectors: Their embeddings, in the same order
+        """
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            blob = np.asarray(vector, dtype=np.float64).tobytes()
+            rows.append((self.key(text), blob, len(blob), now))
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector, size, last_used) VALUES (?, ?, ?, ?)", rows
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._writes_since_evict += len(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write {len(rows)} embeddings to cache: {e}")
+            return
+
+        if self._writes_since_evict >= 1000:
+            self.evict()
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Look up the embedding for one text."""
+        return self.get_many([text])[0]
+
+    def put(self, text: str, vector: Sequence[float]):
+        """Store the embedding for one text."""
+        self.put_many([text], [vector])
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until stored vectors fit within max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self._writes_since_evict = 0
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            # Free a little extra so eviction doesn't run on every write
+            target = int(self.max_bytes * 0.9)
+            removed = 0
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                rows = self._conn.execute("SELECT key, size FROM embeddings ORDER BY last_used").fetchall()
+                doomed = []
+                for key, size in rows:
+                    if total <= target:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM embeddings WHERE key = ?", doomed)
+                self._conn.execute("COMMIT")
+                removed = len(doomed)
+            except sqlite3.Error as e:
+                self._conn.execute("ROLLBACK")
+                logger.warning(f"Embedding cache eviction failed: {e}")
+
+        if removed:
+            logger.info(f"Evicted {removed} embedding cache entries")
+        return removed
+
+    def clear(self):
+        """Delete every cached embedding."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, stored bytes, hits, misses and hit ratio
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM embeddings"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "total_bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
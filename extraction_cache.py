@@ -0,0 +1,191 @@
+"""
+Extraction Cache Module
+Persists cleaned per-page/per-slide text on disk so re-chunking and re-ingests skip parsing.
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ExtractionCache:
+    """
+    On-disk cache of extracted pages keyed by file content hash and extractor version.
+
+    The directory size is scanned once and then tracked as entries are
+    written, so a put only lists the directory when the cache has grown past
+    max_bytes. Eviction then frees down to 90% of max_bytes so it does not
+    run again on the next put. Other processes writing the same directory
+    are picked up at the next eviction scan.
+    """
+
+    def __init__(self, cache_dir: str = ".extraction_cache", extractor_version: str = "",
+                 max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize the extraction cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            extractor_version: Version of the extraction pipeline, part of every key
+            max_bytes: Size cap for the cache directory; least recently used
+                entries are evicted beyond this
+        """
+        self.cache_dir = Path(cache_dir)
+        self.extractor_version = extractor_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes: Optional[int] = None
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, content_hash: str) -> Path:
+        """Return the entry file path for a content hash."""
+        return self.cache_dir / f"{content_hash}_v{self.extractor_version}.json"
+
+    def get(self, content_hash: str) -> Optional[Tuple[List[Tuple[int, str]], Dict[str, Any]]]:
+        """
+        Look up cached pages for a file.
+
+        Args:
+            content_hash: Content hash of the file
+
+        Returns:
+            Tuple of (pages, metadata) or None on a miss
+        """
+        entry_path = self._entry_path(content_hash)
+
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction is least-recently-used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return [tuple(page) for page in entry["pages"]], entry["metadata"]
+
+    def put(self, content_hash: str, pages: List[Tuple[int, str]], metadata: Dict[str, Any]):
+        """
+        Store extracted pages for a file.
+
+        Args:
+            content_hash: Content hash of the file
+            pages: List of (page_number, cleaned_page_text)
+            metadata: Extraction metadata (page/slide count)
+        """
+        entry_path = self._entry_path(content_hash)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+
+        if self._total_bytes is None:
+            self._total_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"metadata": metadata, "pages": pages}, f)
+            size = tmp_path.stat().st_size
+            try:
+                replaced = entry_path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {entry_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._total_bytes += size - replaced
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        """List cache entry files."""
+        with os.scandir(self.cache_dir) as it:
+            return [entry for entry in it if entry.is_file() and entry.name.endswith(".json")]
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries once the cache exceeds max_bytes.
+
+        Entries are removed until the cache is down to 90% of max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = [(entry, entry.stat()) for entry in self._entries()]
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+
+        target = self.max_bytes if total <= self.max_bytes else int(self.max_bytes * 0.9)
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if total <= target:
+                break
+            try:
+                os.unlink(entry.path)
+                total -= stat.st_size
+                removed += 1
+            except OSError:
+                pass
+
+        self._total_bytes = total
+        if removed:
+            logger.info(f"Evicted {removed} extraction cache entries")
+        return removed
+
+    def prune(self, valid_hashes: Iterable[str]) -> int:
+        """
+        Remove entries for files no longer in the corpus or from older extractor versions.
+
+        Args:
+            valid_hashes: Content hashes of files currently in the corpus
+
+        Returns:
+            Number of entries removed
+        """
+        keep = {self._entry_path(content_hash).name for content_hash in valid_hashes}
+        removed = 0
+
+        for entry in self._entries():
+            if entry.name not in keep:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+
+        # Rescanned on the next put
+        self._total_bytes = None
+        logger.info(f"Pruned {removed} extraction cache entries")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with entry count, size and hit ratio
+        """
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(entries),
+            "total_bytes": sum(entry.stat().st_size for entry in entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,372 @@
+"""
+Folder Watcher Module
+Keeps the vector database in sync with the Data folder by polling directory snapshots.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+from document_processor import DocumentProcessor, EXTRACTOR_VERSION
+from ingestion_manifest import IngestionManifest
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Baseline signature for manifest entries whose file is gone when the watcher starts
+_MISSING = (-1, -1.0)
+
+class FolderWatcher:
+    """
+    Long-running watch mode for ingestion.
+
+    Each poll lists the corpus and compares (size, mtime) signatures with
+    the last synced snapshot, so an idle folder costs one directory scan per
+    poll and no file reads. A changed file is only reprocessed once its
+    signature has been stable for debounce_seconds, which skips half-copied
+    files and bursts of saves. Synced state is kept in the ingestion
+    manifest, so a restarted watcher only picks up what changed while it was
+    down.
+
+    Files are processed through the same deadline runner as batch
+    ingestion, so a malformed document cannot hang the watcher. Files that
+    time out or crash the worker, or that fail max_attempts times in a row,
+    are quarantined in the manifest and skipped until they change.
+    """
+
+    def __init__(self, processor: DocumentProcessor, vector_db, manifest_path: str = "ingestion_manifest.json",
+                 poll_interval: float = 2.0, debounce_seconds: float = 2.0, lag_window: int = 1000,
+                 file_timeout: Optional[float] = 300.0, max_attempts: int = 3):
+        """
+        Initialize the watcher.
+
+        Args:
+            processor: DocumentProcessor configured for the Data folder
+            vector_db: VectorDatabase used to upsert and delete chunk vectors
+            manifest_path: Path to the ingestion manifest JSON file
+            poll_interval: Seconds between directory scans
+            debounce_seconds: How long a file must stay unchanged before it is processed
+            lag_window: Number of recent files kept for lag statistics
+            file_timeout: Wall-clock deadline in seconds per file (None processes
+                in-process without a deadline)
+            max_attempts: Consecutive processing errors before a file is quarantined
+        """
+        self.processor = processor
+        self.vector_db = vector_db
+        self.manifest = IngestionManifest(manifest_path, extractor_version=EXTRACTOR_VERSION)
+        self.poll_interval = poll_interval
+        self.debounce_seconds = debounce_seconds
+        self.file_timeout = file_timeout
+        self.max_attempts = max_attempts
+        self._attempts: Dict[str, int] = {}
+
+        self._baseline: Optional[Dict[str, Tuple[int, float]]] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._stop = threading.Event()
+
+        self._started_at = time.time()
+        self._busy_seconds = 0.0
+        self._lags = deque(maxlen=lag_window)
+        self.metrics = {
+            "scans": 0,
+            "files_processed": 0,
+            "files_unchanged": 0,
+            "files_deleted": 0,
+            "chunks_upserted": 0,
+            "vectors_deleted": 0,
+            "failures": 0,
+            "files_quarantined": 0,
+            "last_scan_seconds": 0.0
+        }
+
+    def snapshot(self) -> Dict[str, Tuple[Any, Tuple[int, float]]]:
+        """
+        List the corpus with a cheap change signature per file.
+
+        Returns:
+            Dictionary of path string -> (file, (size, mtime))
+        """
+        current = {}
+        for file_path in self.processor.iter_files():
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            current[str(file_path)] = (file_path, (stat.st_size, stat.st_mtime))
+        return current
+
+    def _initial_baseline(self, current: Dict[str, Tuple[Any, Tuple[int, float]]]) -> Dict[str, Tuple[int, float]]:
+        """
+        Build the first synced snapshot from the manifest.
+
+        Files recorded with their current contents, and quarantined files that
+        have not changed, count as synced; manifest entries whose file is gone
+        get a placeholder so they show up as deleted.
+
+        Args:
+            current: Snapshot from the first scan
+
+        Returns:
+            Dictionary of path string -> synced signature
+        """
+        baseline = {}
+        for key, (file_path, signature) in current.items():
+            if self.manifest.is_current(file_path) or self.manifest.is_quarantined(file_path):
+                baseline[key] = signature
+        for key in self.manifest.entries:
+            if key not in current:
+                baseline[key] = _MISSING
+        return baseline
+
+    def scan(self, now: Optional[float] = None):
+        """
+        Compare the folder with the synced snapshot and queue changes.
+
+        Args:
+            now: Scan timestamp (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        start = time.perf_counter()
+        current = self.snapshot()
+
+        if self._baseline is None:
+            self._baseline = self._initial_baseline(current)
+
+        changes = {}
+        for key, (file_path, signature) in current.items():
+            if self._baseline.get(key) != signature:
+                changes[key] = (file_path, signature)
+        for key in self._baseline:
+            if key not in current:
+                changes[key] = (None, None)
+
+        # Files that went back to their synced state no longer need work
+        for key in [key for key in self._pending if key not in changes]:
+            del self._pending[key]
+
+        for key, (file_path, signature) in changes.items():
+            item = self._pending.get(key)
+            if item is None:
+                self._pending[key] = {"file": file_path, "signature": signature,
+                                      "detected_at": now, "changed_at": now}
+            elif item["signature"] != signature:
+                item.update(file=file_path, signature=signature, changed_at=now)
+
+        self.metrics["scans"] += 1
+        self.metrics["last_scan_seconds"] = time.perf_counter() - start
+
+    def process_ready(self, now: Optional[float] = None) -> int:
+        """
+        Reprocess, upsert or delete every queued file that has settled.
+
+        Args:
+            now: Current timestamp (defaults to time.time())
+
+        Returns:
+            Number of files handled
+        """
+        now = time.time() if now is None else now
+        ready = [key for key, item in self._pending.items() if now - item["changed_at"] >= self.debounce_seconds]
+        if not ready:
+            return 0
+
+        start = time.perf_counter()
+        handled = 0
+
+        for key in sorted(ready):
+            item = self._pending[key]
+            try:
+                if item["file"] is None:
+                    synced = self._remove_file(key)
+                else:
+                    synced = self._sync_file(key, item["file"])
+            except Exception as e:
+                logger.error(f"Watch mode failed to sync {key}: {e}")
+                synced = False
+
+            if not synced:
+                # Retry after another debounce period
+                self.metrics["failures"] += 1
+                item["changed_at"] = time.time()
+                continue
+
+            if item["file"] is None:
+                self._baseline.pop(key, None)
+            else:
+                self._baseline[key] = item["signature"]
+            del self._pending[key]
+            self._lags.append(time.time() - item["detected_at"])
+            handled += 1
+
+        self.manifest.save()
+        self._busy_seconds += time.perf_counter() - start
+        logger.info(f"Watch mode synced {handled}/{len(ready)} files, {len(self._pending)} pending")
+        return handled
+
+    def _sync_file(self, key: str, file_path) -> bool:
+        """
+        Reprocess a new or changed file and replace its vectors.
+
+        Args:
+            key: Manifest key (file path string)
+            file_path: Path or ArchiveMember
+
+        Returns:
+            True if the vector database now reflects the file, or the file was quarantined
+        """
+        if self.manifest.is_current(file_path):
+            # Touched but not modified
+            self.metrics["files_unchanged"] += 1
+            return True
+        if self.manifest.is_quarantined(file_path):
+            return True
+        if self.manifest.quarantine.pop(key, None):
+            logger.info(f"Releasing {file_path} from quarantine: file changed")
+
+        old_ids = set(IngestionManifest.chunk_ids_for(self.manifest.entries.get(key, {})))
+        # Snapshot before extraction so an edit during processing is seen on the next scan
+        snapshot = IngestionManifest.snapshot(file_path)
+        results = self.processor._process_files([file_path], file_timeout=self.file_timeout)
+
+        failure = self.processor.failed_files.get(key)
+        if failure:
+            # Timed out or crashed the worker; keep the old vectors and skip until the file changes
+            self._quarantine(key, file_path, failure)
+            return True
+        documents = results[0][1] if results else []
+        if not documents and self.processor.file_telemetry.get(key, {}).get("status") == "failed":
+            self._attempts[key] = self._attempts.get(key, 0) + 1
+            logger.error(f"Watch mode could not process {file_path} "
+                         f"(attempt {self._attempts[key]}/{self.max_attempts})")
+            if self._attempts[key] >= self.max_attempts:
+                error = self.processor.file_telemetry[key].get("error", "")
+                self._quarantine(key, file_path, f"failed {self._attempts[key]} times: {error}")
+                return True
+            return False
+        self._attempts.pop(key, None)
+
+        if documents:
+            if not self.vector_db.add_documents(documents):
+                return False
+            new_ids = {doc.metadata["chunk_id"] for doc in documents}
+        else:
+            new_ids = set()
+
+        stale_ids = sorted(old_ids - new_ids)
+        if stale_ids and not self.vector_db.delete_vectors(stale_ids):
+            return False
+
+        # Files without chunks are recorded too, so they are not re-extracted on restart
+        doc_id = documents[0].metadata["document_id"] if documents else self.processor.document_id_for(file_path)
+        self.manifest.record(file_path, doc_id, len(documents), snapshot=snapshot)
+
+        self.metrics["files_processed"] += 1
+        self.metrics["chunks_upserted"] += len(documents)
+        self.metrics["vectors_deleted"] += len(stale_ids)
+        return True
+
+    def _quarantine(self, key: str, file_path, reason: str):
+        """
+        Quarantine a file that cannot be processed.
+
+        Args:
+            key: Manifest key (file path string)
+            file_path: Path or ArchiveMember
+            reason: Why the file was quarantined
+        """
+        self.manifest.add_to_quarantine(file_path, reason)
+        self._attempts.pop(key, None)
+        self.metrics["files_quarantined"] += 1
+
+    def _remove_file(self, key: str) -> bool:
+        """
+        Delete the vectors of a file that disappeared from the folder.
+
+        Args:
+            key: Manifest key (file path string)
+
+        Returns:
+            True if the vectors were removed
+        """
+        stale_ids = IngestionManifest.chunk_ids_for(self.manifest.entries.get(key, {}))
+        if stale_ids and not self.vector_db.delete_vectors(stale_ids):
+            return False
+
+        self.manifest.remove(key)
+        self.manifest.quarantine.pop(key, None)
+        self._attempts.pop(key, None)
+        self.metrics["files_deleted"] += 1
+        self.metrics["vectors_deleted"] += len(stale_ids)
+        return True
+
+    def poll_once(self) -> int:
+        """
+        Run one scan and sync cycle.
+
+        Returns:
+            Number of files handled
+        """
+        self.scan()
+        return self.process_ready()
+
+    def run(self, max_cycles: Optional[int] = None):
+        """
+        Watch the folder until stop() is called or max_cycles polls have run.
+
+        Args:
+            max_cycles: Optional number of polls before returning
+        """
+        logger.info(
+            f"Watching {self.processor.data_folder} every {self.poll_interval}s "
+            f"(debounce {self.debounce_seconds}s)"
+        )
+        self._stop.clear()
+        cycles = 0
+
+        try:
+            while not self._stop.is_set():
+                self.poll_once()
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                self._stop.wait(self.poll_interval)
+        except KeyboardInterrupt:
+            logger.info("Watch mode interrupted")
+
+        logger.info(f"Watch mode stopped: {self.get_metrics()}")
+
+    def stop(self):
+        """Ask a running watcher to return after its current cycle."""
+        self._stop.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Report lag and throughput of the watch loop.
+
+        Lag is measured from the scan that first saw a change to the moment
+        its vectors were upserted or deleted, so it includes the debounce.
+
+        Returns:
+            Dictionary of counters, lag statistics and throughput
+        """
+        lags = sorted(self._lags)
+        metrics = dict(self.metrics)
+        metrics.update({
+            "pending_files": len(self._pending),
+            "uptime_seconds": time.time() - self._started_at,
+            "busy_seconds": self._busy_seconds,
+            "last_lag_seconds": self._lags[-1] if self._lags else 0.0,
+            "average_lag_seconds": sum(lags) / len(lags) if lags else 0.0,
+            "p95_lag_seconds": lags[int(0.95 * (len(lags) - 1))] if lags else 0.0,
+            "max_lag_seconds": lags[-1] if lags else 0.0,
+            "files_per_second": metrics["files_processed"] / self._busy_seconds if self._busy_seconds else 0.0,
+            "chunks_per_second": metrics["chunks_upserted"] / self._busy_seconds if self._busy_seconds else 0.0
+        })
+        return metrics
+
+if __name__ == "__main__":
+    from vector_database import VectorDatabase
+
+    FolderWatcher(DocumentProcessor(), VectorDatabase()).run()
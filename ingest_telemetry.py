@@ -0,0 +1,171 @@
+"""
+Ingestion Telemetry Module
+Per-file timing, throughput and memory records for ingestion runs, with summaries and a JSON-lines log.
+"""
+
+import os
+import re
+import sys
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Sequence
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_HWM_PATTERN = re.compile(r'VmHWM:\s+(\d+)\s+kB')
+
+def reset_peak_rss() -> bool:
+    """
+    Reset this process's peak RSS counter so the next reading covers only what follows.
+
+    Uses /proc/self/clear_refs (Linux); elsewhere the peak cannot be reset.
+
+    Returns:
+        True if the counter was reset
+    """
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def get_peak_rss_bytes() -> int:
+    """
+    Get this process's peak resident set size.
+
+    Returns:
+        Peak RSS in bytes since start or the last reset_peak_rss()
+    """
+    try:
+        with open("/proc/self/status") as f:
+            match = _HWM_PATTERN.search(f.read())
+        if match:
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource  # Unix only; imported lazily so Windows can still load this module
+    except ImportError:
+        return 0
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return usage if sys.platform == "darwin" else usage * 1024
+
+def percentiles(values: Sequence[float], points: Sequence[int] = (50, 90, 99)) -> Dict[str, float]:
+    """
+    Compute nearest-rank percentiles plus the maximum.
+
+    Args:
+        values: Sample values
+        points: Percentiles to report
+
+    Returns:
+        Dictionary like {"p50": ..., "p90": ..., "p99": ..., "max": ...}
+    """
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {f"p{point}": round(ordered[max(0, -(-point * len(ordered) // 100) - 1)], 4) for point in points}
+    result["max"] = round(ordered[-1], 4)
+    return result
+
+def summarize_telemetry(records: Iterable[Dict[str, Any]], slowest: int = 10) -> Dict[str, Any]:
+    """
+    Aggregate per-file telemetry records.
+
+    Args:
+        records: Records produced by DocumentProcessor (see file_telemetry)
+        slowest: Number of entries in the slowest-files list
+
+    Returns:
+        Dictionary with percentiles of total and per-stage seconds, pages/sec,
+        MB/sec and peak memory, totals per extractor, and the slowest files
+    """
+    records = list(records)
+    if not records:
+        return {"files": 0}
+
+    ok = [record for record in records if record.get("status") == "ok"]
+    stages = sorted({stage for record in records for stage in record.get("stage_seconds", {})})
+
+    by_extractor: Dict[str, Dict[str, Any]] = {}
+    for record in ok:
+        totals = by_extractor.setdefault(record.get("extractor") or "unknown",
+                                         {"files": 0, "pages": 0, "bytes_read": 0, "seconds": 0.0})
+        totals["files"] += 1
+        totals["pages"] += record.get("pages", 0)
+        totals["bytes_read"] += record.get("bytes_read", 0)
+        totals["seconds"] += record.get("total_seconds", 0.0)
+    for totals in by_extractor.values():
+        totals["pages_per_second"] = round(totals["pages"] / totals["seconds"], 2) if totals["seconds"] else 0.0
+        totals["seconds"] = round(totals["seconds"], 3)
+
+    slowest_files = sorted(records, key=lambda record: record.get("total_seconds", 0.0), reverse=True)[:slowest]
+
+    return {
+        "files": len(records),
+        "status": {status: sum(1 for record in records if record.get("status") == status)
+                   for status in sorted({record.get("status", "unknown") for record in records})},
+        "total_seconds": percentiles([record.get("total_seconds", 0.0) for record in records]),
+        "stage_seconds": {
+            stage: percentiles([record["stage_seconds"][stage] for record in records
+                                if stage in record.get("stage_seconds", {})])
+            for stage in stages
+        },
+        "pages_per_second": percentiles([record["pages_per_second"] for record in ok if record.get("pages")]),
+        "mb_per_second": percentiles([record["mb_per_second"] for record in ok]),
+        "peak_rss_mb": percentiles([record["peak_rss_mb"] for record in records if "peak_rss_mb" in record]),
+        "by_extractor": by_extractor,
+        "slowest_files": [
+            {key: record.get(key) for key in ("file", "total_seconds", "extractor", "pages", "status")}
+            for record in slowest_files
+        ]
+    }
+
+def write_telemetry(path: str, records: Iterable[Dict[str, Any]], run_id: str = "") -> int:
+    """
+    Append telemetry records to a JSON-lines file.
+
+    Args:
+        path: Output .jsonl path
+        records: Per-file records
+        run_id: Identifier stored with every record (defaults to a timestamp)
+
+    Returns:
+        Number of records written
+    """
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps({"run_id": run_id, **record}, default=str) + "\n")
+            count += 1
+    return count
+
+def load_telemetry(path: str) -> pd.DataFrame:
+    """
+    Load a telemetry log for querying, with stage timings as stage_<name> columns.
+
+    Args:
+        path: JSON-lines file written by write_telemetry
+
+    Returns:
+        DataFrame with one row per file per run
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    frame = pd.read_json(path, lines=True)
+    if "stage_seconds" in frame.columns:
+        stages = pd.json_normalize(frame.pop("stage_seconds").tolist()).add_prefix("stage_")
+        frame = pd.concat([frame, stages.set_index(frame.index)], axis=1)
+    return frame
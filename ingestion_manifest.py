@@ -0,0 +1,298 @@
+"""
+Ingestion Manifest Module
+Tracks which files have been ingested so re-runs only process new or modified documents.
+"""
+
+import os
+import json
+import logging
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional
+from corpus_discovery import open_binary
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class IngestionManifest:
+    """Persistent record of ingested files keyed by path, with content hashes for change detection."""
+
+    def __init__(self, manifest_path: str = "ingestion_manifest.json", extractor_version: str = ""):
+        """
+        Initialize the manifest, loading any existing state from disk.
+
+        Args:
+            manifest_path: Path to the JSON manifest file
+            extractor_version: Version of the extraction pipeline; entries recorded
+                with a different version are treated as modified
+        """
+        self.manifest_path = Path(manifest_path)
+        self.extractor_version = extractor_version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.quarantine: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """Load manifest entries from disk if the file exists."""
+        if not self.manifest_path.exists():
+            return
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get("files", {})
+            self.quarantine = data.get("quarantine", {})
+            logger.info(
+                f"Loaded ingestion manifest with {len(self.entries)} files "
+                f"and {len(self.quarantine)} quarantined"
+            )
+        except Exception as e:
+            logger.error(f"Failed to load ingestion manifest {self.manifest_path}: {e}")
+            self.entries = {}
+            self.quarantine = {}
+
+    def save(self):
+        """Write the manifest to disk atomically."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "extractor_version": self.extractor_version,
+                "updated_at": datetime.now().isoformat(),
+                "files": self.entries,
+                "quarantine": self.quarantine
+            }, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def compute_file_hash(file_path: Path, block_size: int = 1 << 20) -> str:
+        """
+        Compute the SHA-256 hash of a file's contents.
+
+        Args:
+            file_path: Path to the file
+            block_size: Read size in bytes
+
+        Returns:
+            Hex digest of the file contents
+        """
+        sha = hashlib.sha256()
+        with open_binary(file_path) as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                sha.update(block)
+        return sha.hexdigest()
+
+    @classmethod
+    def snapshot(cls, file_path: Path) -> Dict[str, Any]:
+        """
+        Capture a file's size, mtime and content hash.
+
+        Take the snapshot before extracting the file and pass it to record(),
+        so a file edited mid-run is recorded with the state its chunks came
+        from and is picked up again on the next run.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Dictionary with "size", "mtime" and "content_hash"
+        """
+        stat = file_path.stat()
+        return {"size": stat.st_size, "mtime": stat.st_mtime, "content_hash": cls.compute_file_hash(file_path)}
+
+    def diff(self, files: Iterable[Path]) -> Dict[str, List]:
+        """
+        Compare files on disk with the manifest.
+
+        Files whose size and mtime match the manifest are assumed unchanged
+        without being hashed; otherwise the content hash decides.
+
+        Args:
+            files: Files currently in the corpus
+
+        Returns:
+            Dictionary with "new", "modified", "unchanged" and "quarantined"
+            lists of Paths and a "deleted" list of manifest keys no longer
+            present on disk. Quarantined files are only released once their
+            contents change.
+        """
+        result = {"new": [], "modified": [], "unchanged": [], "quarantined": [], "deleted": []}
+        seen = set()
+
+        for file_path in files:
+            key = str(file_path)
+            seen.add(key)
+
+            if key in self.quarantine:
+                if self._is_unchanged(file_path, self.quarantine[key]):
+                    result["quarantined"].append(file_path)
+                    continue
+                logger.info(f"Releasing {file_path} from quarantine: file changed")
+                del self.quarantine[key]
+
+            entry = self.entries.get(key)
+
+            if entry is None:
+                result["new"].append(file_path)
+                continue
+
+            if entry.get("extractor_version") != self.extractor_version:
+                result["modified"].append(file_path)
+                continue
+
+            try:
+                stat = file_path.stat()
+            except OSError:
+                result["deleted"].append(key)
+                continue
+
+            if stat.st_size == entry.get("size") and stat.st_mtime == entry.get("mtime"):
+                result["unchanged"].append(file_path)
+                continue
+
+            # Metadata changed; only reprocess if the content really differs
+            if stat.st_size == entry.get("size") and self.compute_file_hash(file_path) == entry.get("content_hash"):
+                entry["mtime"] = stat.st_mtime
+                result["unchanged"].append(file_path)
+            else:
+                result["modified"].append(file_path)
+
+        result["deleted"].extend(key for key in self.entries if key not in seen)
+        for key in [key for key in self.quarantine if key not in seen]:
+            del self.quarantine[key]
+        return result
+
+    def is_current(self, file_path: Path) -> bool:
+        """
+        Check whether a file is recorded with its current contents and extractor version.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            True if the file does not need to be reprocessed
+        """
+        entry = self.entries.get(str(file_path))
+        if entry is None or entry.get("extractor_version") != self.extractor_version:
+            return False
+        return self._is_unchanged(file_path, entry)
+
+    def is_quarantined(self, file_path: Path) -> bool:
+        """
+        Check whether a file is quarantined and unchanged since it was quarantined.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            True if the file should still be skipped
+        """
+        entry = self.quarantine.get(str(file_path))
+        return entry is not None and self._is_unchanged(file_path, entry)
+
+    def _is_unchanged(self, file_path: Path, entry: Dict[str, Any]) -> bool:
+        """
+        Check whether a file still matches a recorded size/mtime/hash.
+
+        Args:
+            file_path: Path to the file
+            entry: Manifest or quarantine entry
+
+        Returns:
+            True if the file has not changed since the entry was recorded
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+
+        if stat.st_size != entry.get("size"):
+            return False
+        if stat.st_mtime == entry.get("mtime"):
+            return True
+        return self.compute_file_hash(file_path) == entry.get("content_hash")
+
+    def add_to_quarantine(self, file_path: Path, reason: str):
+        """
+        Quarantine a file so later runs skip it until it changes.
+
+        Args:
+            file_path: Path to the file
+            reason: Why the file was quarantined (e.g. "timeout after 300s")
+        """
+        try:
+            stat = file_path.stat()
+            size, mtime = stat.st_size, stat.st_mtime
+            content_hash = self.compute_file_hash(file_path)
+        except OSError:
+            size, mtime, content_hash = None, None, ""
+
+        previous = self.quarantine.get(str(file_path), {})
+        self.quarantine[str(file_path)] = {
+            "content_hash": content_hash,
+            "size": size,
+            "mtime": mtime,
+            "reason": reason,
+            "attempts": previous.get("attempts", 0) + 1,
+            "quarantined_at": datetime.now().isoformat()
+        }
+        logger.warning(f"Quarantined {file_path}: {reason}")
+
+    def record(self, file_path: Path, document_id: str, chunk_count: int, content_hash: str = "",
+               snapshot: Optional[Dict[str, Any]] = None):
+        """
+        Record a successfully ingested file.
+
+        Files that produced no chunks (empty or image-only decks) are recorded
+        with chunk_count 0 so they are not re-extracted until they change.
+
+        Args:
+            file_path: Path to the file
+            document_id: Document ID assigned to the file's chunks
+            chunk_count: Number of chunks produced
+            content_hash: Precomputed content hash (computed if empty)
+            snapshot: State captured by snapshot() before extraction; when
+                omitted the file is stat-ed and hashed now
+        """
+        if snapshot is None:
+            stat = file_path.stat()
+            snapshot = {"size": stat.st_size, "mtime": stat.st_mtime,
+                        "content_hash": content_hash or self.compute_file_hash(file_path)}
+        self.entries[str(file_path)] = {
+            "content_hash": snapshot["content_hash"],
+            "size": snapshot["size"],
+            "mtime": snapshot["mtime"],
+            "extractor_version": self.extractor_version,
+            "document_id": document_id,
+            "chunk_count": chunk_count,
+            "ingested_at": datetime.now().isoformat()
+        }
+
+    def remove(self, key: str) -> Dict[str, Any]:
+        """
+        Remove a file from the manifest.
+
+        Args:
+            key: Manifest key (file path string)
+
+        Returns:
+            The removed entry, or an empty dict if it was not present
+        """
+        return self.entries.pop(key, {})
+
+    @staticmethod
+    def chunk_ids_for(entry: Dict[str, Any]) -> List[str]:
+        """
+        List the vector IDs that were created for a manifest entry.
+
+        Args:
+            entry: Manifest entry
+
+        Returns:
+            List of chunk IDs
+        """
+        doc_id = entry.get("document_id", "")
+        return [f"{doc_id}_{i}" for i in range(entry.get("chunk_count", 0))]
@@ -0,0 +1,360 @@
+"""
+Local Vector Index Module
+In-process cosine similarity index on a contiguous NumPy matrix, usable in place of a Pinecone index.
+"""
+
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, NamedTuple
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class LocalMatch(NamedTuple):
+    """One query match, shaped like a Pinecone match."""
+    id: str
+    score: float
+    metadata: Dict[str, Any]
+
+class LocalQueryResult(NamedTuple):
+    """Query response, shaped like a Pinecone query response."""
+    matches: List[LocalMatch]
+
+class LocalVectorIndex:
+    """
+    Exact cosine top-k search over vectors held in memory.
+
+    Implements the subset of the Pinecone Index API that VectorDatabase
+    uses (upsert, query, delete, describe_index_stats), so it can be used
+    as a drop-in backend. Vectors are L2-normalized on insert and kept in
+    one contiguous float32 matrix, so a query is a single matrix-vector
+    product followed by argpartition. Deletes move the last row into the
+    freed slot to keep the matrix dense.
+
+    Metadata filters support equality ({"field": value} or {"$eq": value}),
+    "$ne", "$in" and "$nin" on top-level fields.
+
+    persist() appends the rows upserted and IDs deleted since the last call
+    as a numbered shard file next to the base .npz, so its cost follows the
+    size of the change, not of the index. Shards are replayed in order on
+    load and folded into a rewritten base once there are max_shards of them
+    or they hold more rows than half the index.
+    """
+
+    def __init__(self, dimension: int, path: Optional[str] = None, max_shards: int = 16):
+        """
+        Initialize the index, loading it from path if it exists.
+
+        Args:
+            dimension: Vector dimension
+            path: .npz file to persist to (None keeps the index in memory only)
+            max_shards: Number of change shards kept before they are compacted into the base file
+        """
+        self.dimension = dimension
+        self.path = Path(path) if path else None
+        self.max_shards = max_shards
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, np.ndarray] = {}
+        self._lock = threading.RLock()
+
+        # Changes since the last persist, and the shards written since the last compaction
+        self._upserted: Dict[str, None] = {}
+        self._deleted: set = set()
+        self._rewrite = False
+        self._seq = 0
+        self._shards: List[Path] = []
+        self._shard_rows = 0
+
+        if self.path and (self.path.exists() or self._shard_paths()):
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self._size
+
+    def _shard_paths(self) -> List[Path]:
+        """List change shards of self.path in sequence order."""
+        return sorted(self.path.parent.glob(f"{self.path.name}.*.shard"))
+
+    def _read_npz(self, path: Path) -> Dict[str, Any]:
+        """Read a base or shard file written by _write_npz."""
+        with np.load(path, allow_pickle=False) as data:
+            record = {
+                "vectors": data["vectors"],
+                "ids": json.loads(str(data["ids"])),
+                "metadata": json.loads(str(data["metadata"])),
+                "deleted": json.loads(str(data["deleted"])) if "deleted" in data else [],
+                "seq": int(data["seq"]) if "seq" in data else 0
+            }
+        if record["vectors"].shape[1:] != (self.dimension,) or len(record["ids"]) != len(record["vectors"]):
+            raise ValueError(f"Local index {path} does not match dimension {self.dimension}")
+        return record
+
+    def _load(self):
+        """Load the base file at self.path, then replay its change shards."""
+        base_seq = 0
+        if self.path.exists():
+            base = self._read_npz(self.path)
+            base_seq = base["seq"]
+            self._vectors = np.ascontiguousarray(base["vectors"], dtype=np.float32)
+            self._size = len(base["ids"])
+            self._ids = base["ids"]
+            self._metadata = base["metadata"]
+            self._rows = {vector_id: row for row, vector_id in enumerate(self._ids)}
+        self._seq = base_seq
+
+        for shard_path in self._shard_paths():
+            seq = int(shard_path.name[len(self.path.name) + 1:].split(".")[0])
+            if seq <= base_seq:
+                # Already folded into the base by a compaction that stopped before cleanup
+                shard_path.unlink(missing_ok=True)
+                continue
+            shard = self._read_npz(shard_path)
+            self._remove(shard["deleted"])
+            self._put(shard["ids"], shard["vectors"], shard["metadata"])
+            self._seq = seq
+            self._shards.append(shard_path)
+            self._shard_rows += len(shard["ids"]) + len(shard["deleted"])
+
+        logger.info(f"Loaded {self._size} vectors from {self.path} ({len(self._shards)} change shards)")
+
+    def _write_npz(self, path: Path, vectors: np.ndarray, ids: List[str], metadata: List[Dict[str, Any]],
+                   deleted: List[str]):
+        """Write a base or shard file atomically."""
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'wb') as f:
+            np.savez(f, vectors=vectors, ids=np.array(json.dumps(ids)), metadata=np.array(json.dumps(metadata)),
+                     deleted=np.array(json.dumps(deleted)), seq=np.array(self._seq))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def persist(self):
+        """
+        Save changes since the last persist (no-op for in-memory indexes).
+
+        Writes one change shard, or rewrites the base file and removes the
+        shards when compaction is due or after delete_all.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            if not (self._upserted or self._deleted or self._rewrite or not self.path.exists()):
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._seq += 1
+            changed_rows = len(self._upserted) + len(self._deleted)
+
+            if (self._rewrite or not self.path.exists() or len(self._shards) >= self.max_shards
+                    or self._shard_rows + changed_rows > self._size // 2):
+                self._write_npz(self.path, self._vectors[:self._size], self._ids, self._metadata, [])
+                for shard_path in self._shards:
+                    shard_path.unlink(missing_ok=True)
+                self._shards, self._shard_rows = [], 0
+            else:
+                rows = [self._rows[vector_id] for vector_id in self._upserted]
+                shard_path = self.path.with_name(f"{self.path.name}.{self._seq:08d}.shard")
+                self._write_npz(shard_path, self._vectors[rows], list(self._upserted),
+                                [self._metadata[row] for row in rows], sorted(self._deleted))
+                self._shards.append(shard_path)
+                self._shard_rows += changed_rows
+
+            self._upserted, self._deleted, self._rewrite = {}, set(), False
+
+    def _reserve(self, rows: int):
+        """Grow the matrix (doubling) so it can hold at least rows vectors."""
+        if rows <= len(self._vectors):
+            return
+        capacity = max(rows, 2 * len(self._vectors), 1024)
+        grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+        grown[:self._size] = self._vectors[:self._size]
+        self._vectors = grown
+
+    def upsert(self, vectors: List[Dict[str, Any]], **kwargs) -> Dict[str, int]:
+        """
+        Insert or overwrite vectors.
+
+        Args:
+            vectors: Records with id, values and optional metadata
+
+        Returns:
+            Dictionary with upserted_count
+        """
+        if not vectors:
+            return {"upserted_count": 0}
+        values = np.asarray([record["values"] for record in vectors], dtype=np.float32)
+        if values.shape[1] != self.dimension:
+            raise ValueError(f"Vector dimension {values.shape[1]} does not match index dimension {self.dimension}")
+        norms = np.linalg.norm(values, axis=1, keepdims=True)
+        values /= np.where(norms == 0, 1, norms)
+
+        with self._lock:
+            ids = [record["id"] for record in vectors]
+            self._put(ids, values, [record.get("metadata") or {} for record in vectors])
+            for vector_id in ids:
+                self._deleted.discard(vector_id)
+                self._upserted[vector_id] = None
+        return {"upserted_count": len(vectors)}
+
+    def _put(self, ids: List[str], values: np.ndarray, metadata: List[Dict[str, Any]]):
+        """Insert or overwrite normalized rows (caller holds the lock)."""
+        self._reserve(self._size + len(ids))
+        for vector_id, vector, meta in zip(ids, values, metadata):
+            row = self._rows.get(vector_id)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self._rows[vector_id] = row
+                self._ids.append(vector_id)
+                self._metadata.append(meta)
+            else:
+                self._metadata[row] = meta
+            self._vectors[row] = vector
+        self._columns.clear()
+
+    def delete(self, ids: Optional[List[str]] = None, delete_all: bool = False, **kwargs):
+        """
+        Delete vectors by ID, or all vectors.
+
+        Args:
+            ids: Vector IDs to delete (unknown IDs are ignored)
+            delete_all: Delete every vector
+        """
+        with self._lock:
+            if delete_all:
+                self._vectors = np.zeros((0, self.dimension), dtype=np.float32)
+                self._size = 0
+                self._ids, self._metadata, self._rows = [], [], {}
+                self._upserted, self._deleted, self._rewrite = {}, set(), True
+            else:
+                for vector_id in self._remove(ids or []):
+                    self._upserted.pop(vector_id, None)
+                    self._deleted.add(vector_id)
+            self._columns.clear()
+
+    def _remove(self, ids: List[str]) -> List[str]:
+        """
+        Delete rows by ID, keeping the matrix contiguous (caller holds the lock).
+
+        Returns:
+            IDs that were present and removed
+        """
+        removed = []
+        for vector_id in ids:
+            row = self._rows.pop(vector_id, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                # Move the last row into the gap to keep the matrix contiguous
+                self._vectors[row] = self._vectors[last]
+                self._ids[row] = self._ids[last]
+                self._metadata[row] = self._metadata[last]
+                self._rows[self._ids[row]] = row
+            self._ids.pop()
+            self._metadata.pop()
+            self._size = last
+            removed.append(vector_id)
+        self._columns.clear()
+        return removed
+
+    def _column(self, field: str) -> np.ndarray:
+        """Get a metadata field as an object array, cached until the next write."""
+        column = self._columns.get(field)
+        if column is None:
+            column = np.empty(self._size, dtype=object)
+            column[:] = [metadata.get(field) for metadata in self._metadata]
+            self._columns[field] = column
+        return column
+
+    def _filter_mask(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        """
+        Build a row mask for a Pinecone-style metadata filter.
+
+        Args:
+            filter_dict: Field conditions, all of which must hold
+
+        Returns:
+            Boolean array over stored rows
+        """
+        mask = np.ones(self._size, dtype=bool)
+        for field, condition in filter_dict.items():
+            column = self._column(field)
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for operator, value in condition.items():
+                if operator == "$eq":
+                    mask &= column == value
+                elif operator == "$ne":
+                    mask &= column != value
+                elif operator == "$in":
+                    mask &= np.isin(column, list(value))
+                elif operator == "$nin":
+                    mask &= ~np.isin(column, list(value))
+                else:
+                    raise ValueError(f"Unsupported filter operator: {operator}")
+        return mask
+
+    def query(self, vector: List[float], top_k: int = 10, include_metadata: bool = True,
+              filter: Optional[Dict[str, Any]] = None, **kwargs) -> LocalQueryResult:
+        """
+        Find the stored vectors most similar to a query vector.
+
+        Args:
+            vector: Query embedding
+            top_k: Number of matches to return
+            include_metadata: Include stored metadata in matches
+            filter: Optional metadata filter
+
+        Returns:
+            LocalQueryResult with matches ordered by descending cosine similarity
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        with self._lock:
+            candidates = np.flatnonzero(self._filter_mask(filter)) if filter else None
+            if candidates is not None and len(candidates) < self._size // 4:
+                # Selective filter: gathering the few matching rows beats scoring them all
+                scores = self._vectors[candidates] @ query
+            else:
+                scores = self._vectors[:self._size] @ query
+                if candidates is not None:
+                    scores = scores[candidates]
+
+            k = min(top_k, len(scores))
+            if k <= 0:
+                return LocalQueryResult([])
+            top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            rows = candidates[top] if candidates is not None else top
+
+            return LocalQueryResult([
+                LocalMatch(self._ids[row], float(score), self._metadata[row] if include_metadata else {})
+                for row, score in zip(rows.tolist(), scores[top].tolist())
+            ])
+
+    def describe_index_stats(self, **kwargs) -> Dict[str, Any]:
+        """
+        Get index statistics in the same shape as Pinecone's.
+
+        Returns:
+            Dictionary with total_vector_count, dimension, index_fullness and namespaces
+        """
+        return {
+            "total_vector_count": self._size,
+            "dimension": self.dimension,
+            "index_fullness": 0.0,
+            "namespaces": {}
+        }
@@ -0,0 +1,186 @@
+"""
+Fast PPTX Text Extraction
+Streams slide XML straight out of the .pptx zip and reproduces python-pptx shape and table text.
+"""
+
+import zipfile
+import logging
+import posixpath
+from pathlib import Path
+from typing import List, Iterator, Tuple, Union, BinaryIO
+import xml.etree.ElementTree as ET
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_SLIDE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+
+class UnsupportedPresentation(Exception):
+    """Raised when a file cannot be handled by the streaming XML extractor."""
+
+def _slide_part_names(archive: zipfile.ZipFile) -> List[str]:
+    """
+    Resolve slide part names in presentation order.
+
+    Args:
+        archive: Open .pptx zip archive
+
+    Returns:
+        List of zip member names for the slides, in deck order
+    """
+    try:
+        presentation = ET.fromstring(archive.read("ppt/presentation.xml"))
+        rels = ET.fromstring(archive.read("ppt/_rels/presentation.xml.rels"))
+    except (KeyError, ET.ParseError) as e:
+        raise UnsupportedPresentation(f"Missing or invalid presentation part: {e}")
+
+    targets = {
+        rel.get("Id"): posixpath.normpath(posixpath.join("ppt", rel.get("Target", "")))
+        for rel in rels.iter(f"{_REL}Relationship")
+        if rel.get("Type") == _SLIDE_REL_TYPE
+    }
+
+    slide_list = presentation.find(f"{_P}sldIdLst")
+    if slide_list is None:
+        return []
+
+    part_names = []
+    for slide_id in slide_list.findall(f"{_P}sldId"):
+        target = targets.get(slide_id.get(f"{_R}id"))
+        if target is None:
+            raise UnsupportedPresentation(f"Unresolved slide relationship {slide_id.get(f'{_R}id')}")
+        part_names.append(target)
+    return part_names
+
+def _text_frame_text(tx_body: ET.Element) -> str:
+    """
+    Reproduce python-pptx TextFrame.text for a txBody element.
+
+    Args:
+        tx_body: p:txBody or a:txBody element
+
+    Returns:
+        Paragraph texts joined by newlines, with line breaks as vertical tabs
+    """
+    paragraphs = []
+    for paragraph in tx_body.findall(f"{_A}p"):
+        parts = []
+        for child in paragraph:
+            if child.tag in (f"{_A}r", f"{_A}fld"):
+                text = child.find(f"{_A}t")
+                if text is not None and text.text:
+                    parts.append(text.text)
+            elif child.tag == f"{_A}br":
+                parts.append("\v")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+def _shape_lines(shape: ET.Element) -> Iterator[str]:
+    """
+    Yield the text lines python-pptx extraction produces for a top-level shape.
+
+    Args:
+        shape: Child element of p:spTree
+
+    Yields:
+        Shape text, or one " | "-joined line per non-empty table row
+    """
+    if shape.tag == f"{_P}sp":
+        tx_body = shape.find(f"{_P}txBody")
+        if tx_body is not None:
+            text = _text_frame_text(tx_body)
+            if text:
+                yield text + "\n"
+
+    elif shape.tag == f"{_P}graphicFrame":
+        table = shape.find(f"{_A}graphic/{_A}graphicData/{_A}tbl")
+        if table is None:
+            return
+        for row in table.findall(f"{_A}tr"):
+            row_text = []
+            for cell in row.findall(f"{_A}tc"):
+                tx_body = cell.find(f"{_A}txBody")
+                cell_text = _text_frame_text(tx_body) if tx_body is not None else ""
+                if cell_text:
+                    row_text.append(cell_text.strip())
+            if row_text:
+                yield " | ".join(row_text) + "\n"
+
+def _iter_slide_shapes(stream) -> Iterator[ET.Element]:
+    """
+    Incrementally parse a slide part and yield each top-level shape once complete.
+
+    Finished shapes are cleared so memory is bounded by the largest shape.
+
+    Args:
+        stream: File-like object for the slide XML
+
+    Yields:
+        Direct children of p:spTree
+    """
+    depth = 0
+    tree_depth = None
+
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if element.tag == f"{_P}spTree" and tree_depth is None:
+                tree_depth = depth
+            continue
+
+        if tree_depth is not None and depth == tree_depth + 1:
+            yield element
+            element.clear()
+        elif element.tag == f"{_P}spTree" and depth == tree_depth:
+            tree_depth = -1
+        depth -= 1
+
+def count_slides(file_path: Union[Path, BinaryIO]) -> int:
+    """
+    Count the slides in a .pptx file without parsing the slides.
+
+    Args:
+        file_path: Path to the PPTX file or a binary stream
+
+    Returns:
+        Number of slides
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return len(_slide_part_names(archive))
+    except zipfile.BadZipFile as e:
+        raise UnsupportedPresentation(f"Not a zip package: {e}")
+
+def iter_slide_texts(file_path: Union[Path, BinaryIO]) -> Iterator[Tuple[int, str]]:
+    """
+    Stream raw slide text in the same format as the python-pptx extractor.
+
+    Args:
+        file_path: Path to the PPTX file or a binary stream
+
+    Yields:
+        Tuples of (slide_number, raw_slide_text) with "--- Slide N ---" headers
+
+    Raises:
+        UnsupportedPresentation: If the package structure cannot be handled
+    """
+    try:
+        archive = zipfile.ZipFile(file_path)
+    except zipfile.BadZipFile as e:
+        raise UnsupportedPresentation(f"Not a zip package: {e}")
+
+    with archive:
+        for slide_num, part_name in enumerate(_slide_part_names(archive), 1):
+            parts = [f"\n--- Slide {slide_num} ---\n"]
+            try:
+                with archive.open(part_name) as stream:
+                    for shape in _iter_slide_shapes(stream):
+                        parts.extend(_shape_lines(shape))
+            except (KeyError, ET.ParseError) as e:
+                raise UnsupportedPresentation(f"Cannot read {part_name}: {e}")
+            yield slide_num, "".join(parts)
@@ -0,0 +1,243 @@
+"""
+Rate Limiter Module
+Token-bucket limits for embedding and vector database requests, with 429 / Retry-After aware retries.
+"""
+
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Any, Optional, TypeVar
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate_per_second: Refill rate
+            capacity: Maximum burst (defaults to one second of refill)
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity or rate_per_second
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take tokens from the bucket, going into debt if needed.
+
+        Callers sleep for the returned delay; reserving up front keeps
+        concurrent callers in FIFO order instead of racing for the refill.
+        The full amount is always charged: a request larger than capacity
+        drives the bucket negative, so it and every later caller wait until
+        the refill has paid it off.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the server's requested delay from a rate-limit error.
+
+    Understands Retry-After (seconds or HTTP date) and retry-after-ms headers
+    on OpenAI (error.response.headers) and Pinecone (error.headers) errors.
+
+    Args:
+        error: Exception raised by a client
+
+    Returns:
+        Delay in seconds, or None if the error carries no hint
+    """
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    headers = {str(key).lower(): value for key, value in dict(headers).items()}
+
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            value = headers["retry-after"]
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        pass
+    return None
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an exception is an HTTP 429 from OpenAI or Pinecone.
+
+    Args:
+        error: Exception raised by a client
+
+    Returns:
+        True if the request was rejected for exceeding a rate limit
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return status == 429 or "RateLimit" in type(error).__name__
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Check whether an exception is a server error, timeout or dropped connection worth retrying.
+
+    Args:
+        error: Exception raised by a client
+
+    Returns:
+        True for HTTP 5xx responses, timeouts and connection errors
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if isinstance(status, int) and status >= 500:
+        return True
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    name = type(error).__name__
+    return "Timeout" in name or "Connection" in name or "InternalServer" in name
+
+class RateLimiter:
+    """
+    Client-side request and token rate limiting for one API.
+
+    Every call first reserves one request and its token cost from token
+    buckets sized to the provider's published limits, so work proceeds at
+    the maximum allowed rate. If the server still answers 429, all callers
+    sharing the limiter pause for the Retry-After delay (or a jittered
+    exponential backoff when none is given) and the call is retried.
+    Transient failures (5xx, timeouts, connection errors) are retried with
+    the same backoff, pausing only the failing caller, since clients are
+    run with their own retries disabled.
+    """
+
+    def __init__(self, name: str, requests_per_minute: Optional[float], tokens_per_minute: Optional[float] = None,
+                 max_retries: int = 6, base_delay: float = 1.0, max_delay: float = 60.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Label used in log messages
+            requests_per_minute: Request rate limit (None for no client-side limit)
+            tokens_per_minute: Token rate limit (None for request-only limits)
+            max_retries: Retries after a 429 or transient error before the error is raised
+            base_delay: First backoff delay when the server gives no Retry-After
+            max_delay: Cap on a single backoff delay
+        """
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute / 60.0) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute / 60.0) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"requests": 0, "rate_limited": 0, "transient_errors": 0, "throttled_seconds": 0.0}
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request with the given token cost may be sent.
+
+        Args:
+            tokens: Token cost of the request
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If tokens exceeds the whole per-minute token budget
+        """
+        if self.tokens and tokens > self.tokens.rate * 60:
+            raise ValueError(f"{self.name} request of {tokens} tokens exceeds the "
+                             f"{self.tokens.rate * 60:.0f} tokens per minute limit")
+        delay = self.requests.reserve(1) if self.requests else 0.0
+        if self.tokens and tokens:
+            delay = max(delay, self.tokens.reserve(tokens))
+        with self._lock:
+            delay = max(delay, self._paused_until - time.monotonic())
+            self.stats["requests"] += 1
+            if delay > 0:
+                self.stats["throttled_seconds"] += delay
+        if delay > 0:
+            time.sleep(delay)
+        return max(delay, 0.0)
+
+    def pause(self, seconds: float):
+        """
+        Hold every caller of this limiter for the given time.
+
+        Args:
+            seconds: Pause length
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def call(self, func: Callable[..., T], *args, tokens: int = 0, **kwargs) -> T:
+        """
+        Call func under the rate limit, retrying on 429 responses and transient errors.
+
+        Args:
+            func: Client method to call
+            *args: Positional arguments for func
+            tokens: Token cost of the request
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire(tokens)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                rate_limited = is_rate_limit_error(e)
+                if not (rate_limited or is_transient_error(e)) or attempt == self.max_retries:
+                    raise
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    # Full jitter keeps concurrent callers from retrying in lockstep
+                    delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                delay = min(delay, self.max_delay)
+                with self._lock:
+                    self.stats["rate_limited" if rate_limited else "transient_errors"] += 1
+                if rate_limited:
+                    self.pause(delay)
+                    logger.warning(f"{self.name} rate limited, retrying in {delay:.1f}s "
+                                   f"(attempt {attempt + 1}/{self.max_retries})")
+                else:
+                    logger.warning(f"{self.name} request failed ({e}), retrying in {delay:.1f}s "
+                                   f"(attempt {attempt + 1}/{self.max_retries})")
+                    time.sleep(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with requests sent, 429 responses and seconds spent throttled
+        """
+        with self._lock:
+            return {**self.stats, "throttled_seconds": round(self.stats["throttled_seconds"], 3)}
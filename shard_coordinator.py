@@ -0,0 +1,393 @@
+"""
+Shard Coordination Module
+Lease-based file claiming over a shared filesystem so several ingestion nodes can split one Data folder.
+"""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable
+from langchain.schema import Document
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class LeaseCoordinator:
+    """
+    Coordinates ingestion nodes through lease, result and done files in a shared directory.
+
+    Claims use O_CREAT|O_EXCL so only one node can create a lease. An
+    expired lease is taken over by renaming it to a unique tombstone first.
+    The rename itself does not check what it moves: if another node took
+    the lease over and wrote a fresh one in between, that fresh lease is what
+    gets moved. The tombstone is therefore re-read, and the takeover only
+    proceeds if it still holds the lease that was judged expired; otherwise
+    the fresh lease is put back and this node backs off. Leases held by this
+    node are renewed by a heartbeat thread while they are still valid, so a
+    lease only expires when its holder stops.
+
+    Files are identified by their path relative to the data folder, so
+    nodes that mount the shared folder at different paths agree on keys.
+    A file that fails is released for another attempt and only marked done
+    (with its error) after max_attempts failures across all nodes.
+    """
+
+    def __init__(self, coordination_dir: str, node_id: Optional[str] = None, lease_seconds: float = 300.0,
+                 data_folder: Optional[str] = None, max_attempts: int = 3):
+        """
+        Initialize the coordinator.
+
+        Args:
+            coordination_dir: Shared directory visible to every node
+            node_id: Unique name for this node (defaults to hostname-pid)
+            lease_seconds: How long a lease stays valid without a heartbeat
+            data_folder: Folder that file keys are made relative to (None keys on the full path)
+            max_attempts: Failed attempts before a file is given up and marked done
+        """
+        self.root = Path(coordination_dir)
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.data_folder = str(data_folder) if data_folder is not None else None
+        self.max_attempts = max_attempts
+
+        self.lease_dir = self.root / "leases"
+        self.result_dir = self.root / "results"
+        self.done_dir = self.root / "done"
+        self.failure_dir = self.root / "failures"
+        for directory in (self.lease_dir, self.result_dir, self.done_dir, self.failure_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self._held: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def relative_name(self, file_path) -> str:
+        """
+        Name a file by its path relative to the data folder.
+
+        Args:
+            file_path: Path or ArchiveMember
+
+        Returns:
+            Relative path string, or the full path if no data folder was given
+        """
+        if self.data_folder is None:
+            return str(file_path)
+        return Path(os.path.relpath(str(file_path), self.data_folder)).as_posix()
+
+    def file_key(self, file_path) -> str:
+        """
+        Build the coordination key for a file version.
+
+        The key covers the relative path, size and mtime, so a changed file
+        is treated as new work in later runs.
+
+        Args:
+            file_path: Path or ArchiveMember
+
+        Returns:
+            Hex key used for lease, result and done file names
+        """
+        stat = file_path.stat()
+        identity = f"{self.relative_name(file_path)}|{stat.st_size}|{stat.st_mtime}"
+        return hashlib.sha1(identity.encode()).hexdigest()
+
+    def _lease_path(self, key: str) -> Path:
+        return self.lease_dir / f"{key}.lease"
+
+    def _write_lease(self, fd: int, file_name: str):
+        """Write this node's lease record to an open file descriptor."""
+        record = {"node_id": self.node_id, "file": file_name, "expires_at": time.time() + self.lease_seconds}
+        with os.fdopen(fd, 'w') as f:
+            json.dump(record, f)
+
+    def _read_lease(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a lease record, or None if it is missing or half-written."""
+        try:
+            with open(self._lease_path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_done(self, key: str) -> bool:
+        """Check whether any node has finished a file version."""
+        return (self.done_dir / key).exists()
+
+    def try_claim(self, file_path) -> Optional[str]:
+        """
+        Try to take the lease on a file.
+
+        Args:
+            file_path: Path or ArchiveMember
+
+        Returns:
+            The file key if this node now holds the lease, otherwise None
+        """
+        key = self.file_key(file_path)
+        if self.is_done(key):
+            return None
+
+        lease_path = self._lease_path(key)
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+
+        try:
+            fd = os.open(lease_path, flags)
+        except FileExistsError:
+            lease = self._read_lease(key)
+            if lease is None:
+                try:
+                    # Unreadable lease: treat as expired once it is older than a lease period
+                    expired = time.time() - lease_path.stat().st_mtime > self.lease_seconds
+                except OSError:
+                    expired = True
+            else:
+                expired = lease.get("expires_at", 0) < time.time()
+            if not expired:
+                return None
+
+            # Take over the expired lease by moving it aside, then check what was moved
+            tombstone = lease_path.with_name(f"{lease_path.name}.{self.node_id}.{time.time_ns()}.expired")
+            try:
+                os.rename(lease_path, tombstone)
+            except OSError:
+                return None
+            if not self._is_expired_lease(tombstone, lease):
+                # Another node renewed or took over the lease after we read it; put it back
+                try:
+                    os.link(tombstone, lease_path)
+                except OSError as e:
+                    logger.warning(f"Could not restore lease on {file_path} moved during takeover: {e}")
+                tombstone.unlink(missing_ok=True)
+                return None
+            tombstone.unlink(missing_ok=True)
+            holder = lease.get("node_id") if lease else "unknown"
+            logger.warning(f"Recovering {file_path} from expired lease held by {holder}")
+            try:
+                fd = os.open(lease_path, flags)
+            except FileExistsError:
+                return None
+
+        self._write_lease(fd, str(file_path))
+
+        # Another node may have finished this file version just before we claimed it
+        if self.is_done(key):
+            self.release(key)
+            return None
+
+        with self._lock:
+            self._held[key] = str(file_path)
+        return key
+
+    def _is_expired_lease(self, tombstone: Path, judged: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check that a lease moved aside during takeover is the expired one that was judged.
+
+        Args:
+            tombstone: Where the lease file was renamed to
+            judged: Lease record read before the rename (None if it was unreadable)
+
+        Returns:
+            True if the moved file is the same expired lease, False if it is a newer one
+        """
+        try:
+            with open(tombstone, 'r') as f:
+                moved = json.load(f)
+        except (OSError, ValueError):
+            moved = None
+
+        if judged is None:
+            # An unreadable lease only counts as expired once it is a lease period old
+            try:
+                stale = time.time() - tombstone.stat().st_mtime > self.lease_seconds
+            except OSError:
+                return False
+            return stale and (moved is None or moved.get("expires_at", 0) < time.time())
+
+        return (moved is not None and moved.get("node_id") == judged.get("node_id")
+                and moved.get("expires_at") == judged.get("expires_at"))
+
+    def renew(self):
+        """
+        Extend every lease this node still owns.
+
+        A lease is only rewritten while it is ours and has not expired (with a
+        margin for clock skew and the time the write takes). Other nodes only
+        take over expired leases, so a valid lease of ours cannot have changed
+        hands, and the rewrite cannot clobber another node's lease. A lease
+        that has already expired is given up instead.
+        """
+        with self._lock:
+            held = dict(self._held)
+
+        margin = self.lease_seconds / 10
+        for key, file_name in held.items():
+            lease = self._read_lease(key)
+            if lease is None or lease.get("node_id") != self.node_id or \
+                    lease.get("expires_at", 0) - time.time() < margin:
+                logger.warning(f"Lost lease on {file_name}")
+                with self._lock:
+                    self._held.pop(key, None)
+                continue
+
+            tmp_path = self._lease_path(key).with_suffix(f".{self.node_id}.tmp")
+            fd = os.open(tmp_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY)
+            self._write_lease(fd, file_name)
+            os.replace(tmp_path, self._lease_path(key))
+
+    def release(self, key: str):
+        """Drop a lease this node holds."""
+        with self._lock:
+            self._held.pop(key, None)
+        lease = self._read_lease(key)
+        if lease is None or lease.get("node_id") == self.node_id:
+            self._lease_path(key).unlink(missing_ok=True)
+
+    def complete(self, key: str, file_path, documents: List[Document], error: str = ""):
+        """
+        Write a file's chunks and mark it done, then release its lease.
+
+        Results are keyed by file version, so a late write from a node that
+        lost its lease replaces identical content instead of duplicating it.
+
+        Args:
+            key: File key returned by try_claim
+            file_path: Path or ArchiveMember
+            documents: Chunks produced for the file
+            error: Failure reason when fail() gives up on the file (it is
+                still marked done so other nodes don't retry it)
+        """
+        result_path = self.result_dir / f"{key}.jsonl"
+        tmp_path = result_path.with_suffix(f".{self.node_id}.tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for doc in documents:
+                f.write(json.dumps({"page_content": doc.page_content, "metadata": doc.metadata}) + "\n")
+        os.replace(tmp_path, result_path)
+
+        with open(self.done_dir / key, 'w', encoding='utf-8') as f:
+            json.dump({"file": str(file_path), "node_id": self.node_id, "chunks": len(documents),
+                       "error": error, "completed_at": time.time()}, f)
+        self.release(key)
+
+    def fail(self, key: str, file_path, error: str) -> bool:
+        """
+        Record a failed attempt on a file and release its lease.
+
+        The attempt count is kept in the shared directory, so every node
+        sees it. Below max_attempts the file stays pending and any node may
+        claim it again; at max_attempts it is completed with the error.
+
+        Args:
+            key: File key returned by try_claim
+            file_path: Path or ArchiveMember
+            error: Failure reason
+
+        Returns:
+            True if the file was given up and marked done
+        """
+        failure_path = self.failure_dir / key
+        try:
+            with open(failure_path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            record = {"file": self.relative_name(file_path), "attempts": 0, "errors": []}
+
+        record["attempts"] += 1
+        record["errors"].append({"node_id": self.node_id, "error": error, "failed_at": time.time()})
+        # Only the lease holder writes, so a plain atomic replace is enough
+        tmp_path = failure_path.with_name(f"{key}.{self.node_id}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, failure_path)
+
+        if record["attempts"] >= self.max_attempts:
+            logger.error(f"Giving up on {file_path} after {record['attempts']} attempts: {error}")
+            self.complete(key, file_path, [], error=error)
+            return True
+
+        logger.warning(f"Attempt {record['attempts']}/{self.max_attempts} on {file_path} failed, "
+                       f"releasing it for retry: {error}")
+        self.release(key)
+        return False
+
+    def pending_keys(self, files: Iterable) -> Dict[str, Any]:
+        """
+        Map keys of files that no node has finished yet to their files.
+
+        Args:
+            files: Files in the corpus
+
+        Returns:
+            Dictionary of key -> file for unfinished files
+        """
+        pending = {}
+        for file_path in files:
+            try:
+                key = self.file_key(file_path)
+            except OSError:
+                # Deleted since discovery
+                continue
+            if not self.is_done(key):
+                pending[key] = file_path
+        return pending
+
+    def start_heartbeat(self):
+        """Start renewing held leases in the background every third of a lease period."""
+        if self._heartbeat is not None:
+            return
+        self._stop.clear()
+
+        def beat():
+            while not self._stop.wait(self.lease_seconds / 3):
+                try:
+                    self.renew()
+                except Exception as e:
+                    logger.error(f"Lease heartbeat failed: {e}")
+
+        self._heartbeat = threading.Thread(target=beat, name="lease-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        """Stop the heartbeat thread and release any leases still held."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        for key in list(self._held):
+            self.release(key)
+
+    def collect_results(self, files: Iterable) -> List[Document]:
+        """
+        Combine the chunks written by all nodes, in corpus order, without duplicates.
+
+        Args:
+            files: Files in the corpus, in the desired order
+
+        Returns:
+            Combined list of Document objects
+        """
+        documents = []
+        seen_chunk_ids = set()
+
+        for file_path in files:
+            result_path = self.result_dir / f"{self.file_key(file_path)}.jsonl"
+            if not result_path.exists():
+                continue
+            with open(result_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    chunk_id = record["metadata"].get("chunk_id")
+                    if chunk_id is not None:
+                        if chunk_id in seen_chunk_ids:
+                            continue
+                        seen_chunk_ids.add(chunk_id)
+                    documents.append(Document(page_content=record["page_content"], metadata=record["metadata"]))
+
+        return documents
@@ -0,0 +1,378 @@
+"""
+Spool Pipeline Module
+Decouples extraction from embedding through a durable chunk spool so either stage can resume after a crash.
+"""
+
+import os
+import json
+import time
+import queue
+import shutil
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from langchain.schema import Document
+from document_processor import DocumentProcessor
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class SpoolPipeline:
+    """
+    Two-stage ingestion: extract -> spool -> embed/upsert.
+
+    The extract stage appends each file's chunks to an append-only JSON-lines
+    log, fsyncs it, and then commits the new log length and the file's
+    (size, mtime) and chunk IDs to extract_state.json. Chunk IDs a modified
+    file no longer produces, and all chunk IDs of removed files, are
+    appended as delete records. The embed stage reads the log from its own
+    committed byte offset, upserts batches through VectorDatabase, applies
+    delete records, and commits the offset after each step in
+    embed_state.json. After a crash each stage resumes from its last commit:
+    a torn tail of the log is truncated away and finished files are skipped.
+    Embedding is at-least-once; a batch upserted just before a crash is
+    upserted again under the same chunk IDs, which overwrites rather than
+    duplicates. Once everything in the log has been embedded, compact()
+    truncates it.
+
+    When both stages run together, a bounded queue between them applies
+    back-pressure: extraction blocks once queue_size files are waiting to
+    be embedded.
+    """
+
+    def __init__(self, processor: DocumentProcessor, vector_db, spool_dir: str = "ingestion_spool",
+                 queue_size: int = 8, embed_batch_size: int = 100):
+        """
+        Initialize the pipeline.
+
+        Args:
+            processor: DocumentProcessor configured for the Data folder
+            vector_db: VectorDatabase used by the embed stage
+            spool_dir: Directory for the chunk log and stage offsets
+            queue_size: Maximum number of extracted files waiting for the embed stage
+            embed_batch_size: Chunks passed to add_documents per committed batch
+        """
+        self.processor = processor
+        self.vector_db = vector_db
+        self.spool_dir = Path(spool_dir)
+        self.queue_size = queue_size
+        self.embed_batch_size = embed_batch_size
+
+        self.log_path = self.spool_dir / "chunks.jsonl"
+        self.extract_state_path = self.spool_dir / "extract_state.json"
+        self.embed_state_path = self.spool_dir / "embed_state.json"
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _load_state(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
+        """Load a stage's committed state, or its default if none was committed."""
+        if not path.exists():
+            return default
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _commit_state(path: Path, state: Dict[str, Any]):
+        """Atomically replace a stage's committed state."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _extract_state(self) -> Dict[str, Any]:
+        state = self._load_state(self.extract_state_path, {"log_bytes": 0, "chunks": 0, "files": {}})
+        for key, entry in state["files"].items():
+            if isinstance(entry, list):
+                # Written before chunk IDs were recorded
+                state["files"][key] = {"signature": entry, "chunk_ids": []}
+        return state
+
+    def _embed_state(self) -> Dict[str, Any]:
+        return self._load_state(self.embed_state_path, {"offset": 0, "chunks": 0})
+
+    def extract_stage(self, max_workers: Optional[int] = None, file_timeout: Optional[float] = None,
+                      notify: Optional[queue.Queue] = None, stop: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Extract every new or changed file and append its chunks to the log.
+
+        Files are processed in batches of max_workers so results are spooled
+        as they complete. Files that time out, crash or fail stay unspooled
+        and are retried on the next run. Files that disappeared since they
+        were spooled get a delete record for their chunk IDs.
+
+        Args:
+            max_workers: Number of worker processes (see process_all_documents)
+            file_timeout: Optional per-file wall-clock deadline in seconds
+            notify: Queue that receives the committed log length after each
+                file and None when the stage ends (blocks when full)
+            stop: Event that aborts the stage between files
+
+        Returns:
+            Dictionary with files and chunks spooled, chunk IDs queued for
+            deletion, failed files and seconds spent blocked by back-pressure
+        """
+        state = self._extract_state()
+        stats = {"files": 0, "chunks": 0, "deleted": 0, "failed": [], "blocked_seconds": 0.0}
+
+        # Drop anything written after the last commit (torn by a crash)
+        if self.log_path.exists() and self.log_path.stat().st_size > state["log_bytes"]:
+            logger.warning(f"Truncating uncommitted tail of {self.log_path}")
+            with open(self.log_path, 'r+b') as log:
+                log.truncate(state["log_bytes"])
+
+        # (size, mtime) per file, taken before extraction so edits made meanwhile are seen next run
+        signatures: Dict[str, List[float]] = {}
+        todo = []
+        for file_path in self.processor.iter_files():
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                # Removed or renamed since discovery
+                logger.warning(f"Skipping {file_path}: {e}")
+                continue
+            key = str(file_path)
+            signatures[key] = [stat.st_size, stat.st_mtime]
+            if state["files"].get(key, {}).get("signature") != signatures[key]:
+                todo.append(file_path)
+        removed = [key for key in state["files"] if key not in signatures]
+        logger.info(f"Extract stage: {len(todo)} files to spool, {len(removed)} removed, "
+                    f"{len(state['files'])} already spooled")
+        batch_size = max(1, max_workers or 1)
+
+        def commit(log):
+            log.flush()
+            os.fsync(log.fileno())
+            state["log_bytes"] = log.tell()
+            self._commit_state(self.extract_state_path, state)
+            if notify is not None:
+                stats["blocked_seconds"] += self._put(notify, state["log_bytes"], stop)
+
+        try:
+            with open(self.log_path, 'ab') as log:
+                for key in removed:
+                    chunk_ids = state["files"].pop(key)["chunk_ids"]
+                    if chunk_ids:
+                        log.write(json.dumps({"delete": chunk_ids}).encode('utf-8') + b"\n")
+                        stats["deleted"] += len(chunk_ids)
+                    commit(log)
+
+                for start in range(0, len(todo), batch_size):
+                    if stop is not None and stop.is_set():
+                        break
+                    batch = todo[start:start + batch_size]
+                    results = self.processor._process_files(batch, max_workers, file_timeout)
+                    stats["failed"].extend(self.processor.failed_files)
+
+                    for file_path, documents in results:
+                        key = str(file_path)
+                        if not documents and self.processor.file_telemetry.get(key, {}).get("status") == "failed":
+                            # Processing raised; keep the old chunks and retry on the next run
+                            stats["failed"].append(key)
+                            continue
+
+                        for doc in documents:
+                            record = {"page_content": doc.page_content, "metadata": doc.metadata}
+                            log.write(json.dumps(record, default=str).encode('utf-8') + b"\n")
+
+                        chunk_ids = [doc.metadata["chunk_id"] for doc in documents]
+                        stale_ids = sorted(set(state["files"].get(key, {}).get("chunk_ids", [])) - set(chunk_ids))
+                        if stale_ids:
+                            log.write(json.dumps({"delete": stale_ids}).encode('utf-8') + b"\n")
+                            stats["deleted"] += len(stale_ids)
+
+                        state["chunks"] += len(documents)
+                        state["files"][key] = {"signature": signatures[key], "chunk_ids": chunk_ids}
+                        commit(log)
+                        stats["files"] += 1
+                        stats["chunks"] += len(documents)
+        finally:
+            if notify is not None:
+                self._put(notify, None, stop)
+
+        logger.info(f"Extract stage spooled {stats['files']} files ({stats['chunks']} chunks)")
+        return stats
+
+    @staticmethod
+    def _put(notify: queue.Queue, item, stop: Optional[threading.Event]) -> float:
+        """
+        Put an item on the stage queue, blocking while it is full.
+
+        Returns:
+            Seconds spent blocked
+        """
+        start = time.perf_counter()
+        while True:
+            try:
+                notify.put(item, timeout=0.5)
+                return time.perf_counter() - start
+            except queue.Full:
+                if stop is not None and stop.is_set():
+                    return time.perf_counter() - start
+
+    def embed_stage(self, notify: Optional[queue.Queue] = None) -> Dict[str, Any]:
+        """
+        Upsert spooled chunks from the last committed offset.
+
+        Without a queue the stage embeds everything committed by the extract
+        stage so far and returns, so it can run as a separate process.
+
+        Args:
+            notify: Queue fed by extract_stage; the stage follows it until None
+
+        Returns:
+            Dictionary with chunks and batches upserted and vectors deleted
+        """
+        state = self._embed_state()
+        stats = {"chunks": 0, "batches": 0, "deleted": 0}
+        logger.info(f"Embed stage resuming at byte {state['offset']} ({state['chunks']} chunks done)")
+
+        # Catch up on chunks spooled by earlier runs
+        self._embed_range(state, self._extract_state()["log_bytes"], stats)
+
+        if notify is not None:
+            while True:
+                target = notify.get()
+                if target is None:
+                    break
+                self._embed_range(state, target, stats)
+            self._embed_range(state, self._extract_state()["log_bytes"], stats)
+
+        logger.info(f"Embed stage upserted {stats['chunks']} chunks in {stats['batches']} batches")
+        return stats
+
+    def _embed_range(self, state: Dict[str, Any], end: int, stats: Dict[str, Any]):
+        """
+        Upsert and delete log records between the committed offset and end, committing after each step.
+
+        Chunks are upserted in batches of embed_batch_size; a delete record
+        first flushes the chunks before it so log order is kept.
+
+        Args:
+            state: Embed state, updated in place
+            end: Committed log length to stop at
+            stats: Run counters, updated in place
+        """
+        if state["offset"] >= end:
+            return
+
+        with open(self.log_path, 'rb') as log:
+            log.seek(state["offset"])
+            batch: List[Document] = []
+            while log.tell() < end:
+                line = log.readline()
+                record = json.loads(line)
+                if "delete" in record:
+                    self._upsert_batch(state, batch, log.tell() - len(line), stats)
+                    batch = []
+                    if not self.vector_db.delete_vectors(record["delete"]):
+                        raise RuntimeError(f"Delete failed at spool offset {state['offset']}")
+                    state["offset"] = log.tell()
+                    self._commit_state(self.embed_state_path, state)
+                    stats["deleted"] += len(record["delete"])
+                    continue
+
+                batch.append(Document(page_content=record["page_content"], metadata=record["metadata"]))
+                if len(batch) >= self.embed_batch_size:
+                    self._upsert_batch(state, batch, log.tell(), stats)
+                    batch = []
+            self._upsert_batch(state, batch, log.tell(), stats)
+
+    def _upsert_batch(self, state: Dict[str, Any], batch: List[Document], offset: int, stats: Dict[str, Any]):
+        """
+        Upsert a batch of spooled chunks and commit the offset just past them.
+
+        Args:
+            state: Embed state, updated in place
+            batch: Chunks to upsert (nothing happens if empty)
+            offset: Log offset after the batch's last record
+            stats: Run counters, updated in place
+        """
+        if not batch:
+            return
+        if not self.vector_db.add_documents(batch):
+            raise RuntimeError(f"Upsert failed at spool offset {state['offset']}")
+
+        state["offset"] = offset
+        state["chunks"] += len(batch)
+        self._commit_state(self.embed_state_path, state)
+        stats["chunks"] += len(batch)
+        stats["batches"] += 1
+
+    def compact(self) -> bool:
+        """
+        Truncate the log once every committed record has been embedded.
+
+        Only call this while neither stage is running. The embed offset is
+        reset first, so a crash part-way through at worst re-embeds the log
+        rather than skipping new records.
+
+        Returns:
+            True if the log was truncated
+        """
+        extract_state = self._extract_state()
+        embed_state = self._embed_state()
+        if not extract_state["log_bytes"] or embed_state["offset"] < extract_state["log_bytes"]:
+            return False
+
+        embed_state["offset"] = 0
+        self._commit_state(self.embed_state_path, embed_state)
+        extract_state["log_bytes"] = 0
+        self._commit_state(self.extract_state_path, extract_state)
+        with open(self.log_path, 'r+b') as log:
+            log.truncate(0)
+        logger.info(f"Compacted {self.log_path}")
+        return True
+
+    def run(self, max_workers: Optional[int] = None, file_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run both stages concurrently with back-pressure between them.
+
+        Args:
+            max_workers: Number of extraction worker processes
+            file_timeout: Optional per-file wall-clock deadline in seconds
+
+        Returns:
+            Dictionary with "extract" and "embed" stage statistics and the
+            "pending_chunks" still spooled but not embedded
+        """
+        self.compact()
+        notify = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        embed_result: Dict[str, Any] = {}
+
+        def embed():
+            try:
+                embed_result["stats"] = self.embed_stage(notify)
+            except Exception as e:
+                embed_result["error"] = e
+                stop.set()
+                # Unblock the extract stage if it is waiting on a full queue
+                while not notify.empty():
+                    notify.get_nowait()
+
+        embed_thread = threading.Thread(target=embed, name="embed-stage")
+        embed_thread.start()
+        try:
+            extract_stats = self.extract_stage(max_workers, file_timeout, notify, stop)
+        finally:
+            embed_thread.join()
+
+        if "error" in embed_result:
+            logger.error(f"Embed stage failed; rerun to resume: {embed_result['error']}")
+            raise embed_result["error"]
+        self.compact()
+
+        return {
+            "extract": extract_stats,
+            "embed": embed_result["stats"],
+            "pending_chunks": self._extract_state()["chunks"] - self._embed_state()["chunks"]
+        }
+
+    def reset(self):
+        """Delete the spool and both stage offsets."""
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
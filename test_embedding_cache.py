@@ -0,0 +1,40 @@
+"""
+Embedding Cache Tests
+Checks hits, misses, key isolation by model and LRU eviction of the SQLite embedding cache.
+"""
+
+from embedding_cache import EmbeddingCache
+
+def test_hits_and_misses(tmp_path):
+    """Stored vectors come back bit-identical; unknown texts miss."""
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model-a", 3)
+    vector = [0.1, 0.2, 1 / 3]
+    cache.put("hello", vector)
+
+    assert cache.get_many(["hello", "other"]) == [vector, None]
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    cache.close()
+
+def test_entries_survive_reopen_and_are_keyed_by_model(tmp_path):
+    """A new connection sees earlier entries, but only for the same model and dimension."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = EmbeddingCache(path, "model-a", 3)
+    cache.put("hello", [1.0, 2.0, 3.0])
+    cache.close()
+
+    assert EmbeddingCache(path, "model-a", 3).get("hello") == [1.0, 2.0, 3.0]
+    assert EmbeddingCache(path, "model-b", 3).get("hello") is None
+    assert EmbeddingCache(path, "model-a", 4).get("hello") is None
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    """Past max_bytes the oldest entries go first."""
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), "model-a", 4, max_bytes=3 * 32, touch_interval=0)
+    for i in range(4):
+        cache.put(f"text {i}", [float(i)] * 4)
+        cache._conn.execute("UPDATE embeddings SET last_used = ? WHERE key = ?", (i, cache.key(f"text {i}")))
+
+    assert cache.evict() > 0
+    assert cache.get("text 0") is None
+    assert cache.get("text 3") == [3.0] * 4
+    cache.close()
@@ -0,0 +1,50 @@
+"""
+Ingestion Manifest Tests
+Checks that the manifest diff sorts files into new, modified, unchanged and deleted.
+"""
+
+import os
+from ingestion_manifest import IngestionManifest
+
+def write(path, content: bytes):
+    path.write_bytes(content)
+    return path
+
+def test_diff_classifies_files(tmp_path):
+    """Each kind of change since the last run lands in its own list."""
+    manifest_path = str(tmp_path / "manifest.json")
+    kept = write(tmp_path / "kept.pdf", b"kept")
+    touched = write(tmp_path / "touched.pdf", b"touched")
+    edited = write(tmp_path / "edited.pdf", b"edited")
+    gone = write(tmp_path / "gone.pdf", b"gone")
+
+    manifest = IngestionManifest(manifest_path, extractor_version="1")
+    for file_path in (kept, touched, edited, gone):
+        manifest.record(file_path, file_path.stem, 2)
+    manifest.save()
+
+    # Same bytes with a new mtime, new bytes, a removed file and a new one
+    stat = touched.stat()
+    os.utime(touched, (stat.st_atime, stat.st_mtime + 10))
+    write(edited, b"edited again")
+    gone.unlink()
+    added = write(tmp_path / "added.pdf", b"added")
+
+    changes = IngestionManifest(manifest_path, extractor_version="1").diff([kept, touched, edited, added])
+
+    assert changes["new"] == [added]
+    assert changes["modified"] == [edited]
+    assert changes["unchanged"] == [kept, touched]
+    assert changes["deleted"] == [str(gone)]
+    assert IngestionManifest.chunk_ids_for({"document_id": "gone", "chunk_count": 2}) == ["gone_0", "gone_1"]
+
+def test_extractor_version_change_reprocesses(tmp_path):
+    """Bumping the extractor version marks every recorded file as modified."""
+    manifest_path = str(tmp_path / "manifest.json")
+    deck = write(tmp_path / "deck.pdf", b"deck")
+    manifest = IngestionManifest(manifest_path, extractor_version="1")
+    manifest.record(deck, "deck", 0)
+    manifest.save()
+
+    assert IngestionManifest(manifest_path, extractor_version="1").diff([deck])["unchanged"] == [deck]
+    assert IngestionManifest(manifest_path, extractor_version="2").diff([deck])["modified"] == [deck]
@@ -0,0 +1,68 @@
+"""
+Local Vector Index Tests
+Checks search, metadata filters, deletes and persistence through change shards and compaction.
+"""
+
+import numpy as np
+from local_vector_index import LocalVectorIndex
+
+def records(count: int, dimension: int = 8, seed: int = 0):
+    rng = np.random.RandomState(seed)
+    return [{"id": f"v{i}", "values": rng.rand(dimension).tolist(),
+             "metadata": {"company_name": "Acme" if i % 2 else "Nova", "chunk_index": i}}
+            for i in range(count)]
+
+def test_query_returns_nearest_with_filter():
+    """Top-k is ordered by cosine similarity and honours metadata filters."""
+    index = LocalVectorIndex(8)
+    vectors = records(50)
+    index.upsert(vectors)
+
+    best = index.query(vectors[7]["values"], top_k=3)
+    assert best.matches[0].id == "v7"
+    assert best.matches[0].score > best.matches[1].score
+
+    filtered = index.query(vectors[7]["values"], top_k=5, filter={"company_name": "Nova"})
+    assert len(filtered.matches) == 5
+    assert all(match.metadata["company_name"] == "Nova" for match in filtered.matches)
+
+    in_list = index.query(vectors[7]["values"], top_k=50, filter={"chunk_index": {"$in": [1, 2, 3]}})
+    assert sorted(match.id for match in in_list.matches) == ["v1", "v2", "v3"]
+
+def test_delete_keeps_remaining_vectors_searchable():
+    """Deleted IDs disappear and the rows moved into their slots still match."""
+    index = LocalVectorIndex(8)
+    vectors = records(20)
+    index.upsert(vectors)
+    index.delete(ids=["v0", "v5", "missing"])
+
+    assert len(index) == 18
+    assert index.query(vectors[19]["values"], top_k=1).matches[0].id == "v19"
+    assert "v5" not in {match.id for match in index.query(vectors[5]["values"], top_k=20).matches}
+
+def test_persist_and_reload(tmp_path):
+    """Changes saved as shards and after compaction reload to the same contents."""
+    path = str(tmp_path / "index.npz")
+    index = LocalVectorIndex(8, path, max_shards=2)
+    index.upsert(records(40))
+    index.persist()
+
+    index.upsert(records(3, seed=1))
+    index.delete(ids=["v10"])
+    index.persist()
+    assert len(list(tmp_path.glob("index.npz.*.shard"))) == 1
+
+    reloaded = LocalVectorIndex(8, path)
+    assert len(reloaded) == 39
+    assert "v10" not in reloaded._rows
+    assert np.allclose(reloaded.query(records(3, seed=1)[0]["values"], top_k=1).matches[0].score, 1.0)
+
+    for batch in range(3):
+        index.delete(ids=[f"v{20 + batch}"])
+        index.persist()
+    assert len(list(tmp_path.glob("index.npz.*.shard"))) < 3
+    assert sorted(LocalVectorIndex(8, path)._ids) == sorted(index._ids)
+
+    index.delete(delete_all=True)
+    index.persist()
+    assert len(LocalVectorIndex(8, path)) == 0
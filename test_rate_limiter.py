@@ -0,0 +1,79 @@
+"""
+Rate Limiter Tests
+Checks that the token bucket holds request throughput to the configured tokens-per-minute limit.
+"""
+
+import pytest
+import rate_limiter
+from rate_limiter import RateLimiter, TokenBucket
+
+class FakeClock:
+    """Stands in for the time module so waits advance a virtual clock instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+def test_large_reservations_are_charged_in_full(clock):
+    """A request above the bucket's burst capacity still pays its whole cost."""
+    bucket = TokenBucket(rate_per_second=1000.0)
+    assert bucket.reserve(1000) == 0.0
+    assert bucket.reserve(5000) == pytest.approx(5.0)
+
+def test_throughput_stays_within_tokens_per_minute(clock):
+    """No 60 second window sees more tokens than the limit plus one second of burst."""
+    tokens_per_minute = 60000
+    limiter = RateLimiter("test", None, tokens_per_minute=tokens_per_minute)
+
+    sent = []
+    for _ in range(60):
+        limiter.acquire(5000)
+        sent.append(clock.now)
+
+    burst = tokens_per_minute / 60
+    for start in sent:
+        in_window = sum(5000 for when in sent if start <= when < start + 60)
+        assert in_window <= tokens_per_minute + burst
+
+    # Sustained rate between the first and last request is the refill rate
+    elapsed = sent[-1] - sent[0]
+    assert 59 * 5000 / elapsed <= tokens_per_minute / 60 + 1e-9
+
+def test_requests_above_the_minute_budget_are_rejected(clock):
+    """A single request that can never fit within a minute fails instead of waiting forever."""
+    limiter = RateLimiter("test", None, tokens_per_minute=60000)
+    with pytest.raises(ValueError):
+        limiter.acquire(60001)
+
+def test_transient_errors_are_retried(clock):
+    """Server errors and dropped connections are retried; other errors are raised at once."""
+    limiter = RateLimiter("test", None, max_retries=3)
+    failures = [ConnectionResetError("reset"), TimeoutError("timed out")]
+
+    def flaky():
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    assert limiter.call(flaky) == "ok"
+    assert limiter.get_stats()["transient_errors"] == 2
+
+    def broken():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call(broken)
@@ -0,0 +1,75 @@
+"""
+Shard Coordinator Tests
+Checks lease claiming, takeover of expired leases, mount-independent keys and failure retries.
+"""
+
+import time
+import pytest
+from shard_coordinator import LeaseCoordinator
+
+@pytest.fixture
+def deck(tmp_path):
+    data = tmp_path / "Data"
+    data.mkdir()
+    file_path = data / "Acme2019.pdf"
+    file_path.write_bytes(b"%PDF-1.4")
+    return file_path
+
+def test_lease_is_exclusive_until_it_expires(tmp_path, deck):
+    """A live lease blocks other nodes; once it expires one of them takes it over."""
+    shared = str(tmp_path / "coord")
+    first = LeaseCoordinator(shared, "node-a", lease_seconds=0.2)
+    second = LeaseCoordinator(shared, "node-b", lease_seconds=0.2)
+
+    key = first.try_claim(deck)
+    assert key is not None
+    assert second.try_claim(deck) is None
+
+    time.sleep(0.3)
+    assert second.try_claim(deck) == key
+    assert second._read_lease(key)["node_id"] == "node-b"
+
+    # The stalled holder must not renew over the new owner's lease
+    first.renew()
+    assert key not in first._held
+    assert second._read_lease(key)["node_id"] == "node-b"
+
+def test_takeover_backs_off_from_a_fresh_lease(tmp_path, deck):
+    """A node that judged an old lease expired does not steal the one written since."""
+    shared = str(tmp_path / "coord")
+    first = LeaseCoordinator(shared, "node-a", lease_seconds=0.2)
+    late = LeaseCoordinator(shared, "node-b", lease_seconds=0.2)
+    winner = LeaseCoordinator(shared, "node-c", lease_seconds=0.2)
+
+    key = first.try_claim(deck)
+    time.sleep(0.3)
+    expired = late._read_lease(key)
+    assert winner.try_claim(deck) == key
+
+    # node-b still sees the expired record it read before node-c's takeover
+    late._read_lease = lambda _key: expired
+    assert late.try_claim(deck) is None
+    assert winner._read_lease(key)["node_id"] == "node-c"
+
+def test_keys_do_not_depend_on_the_mount_point(tmp_path, deck):
+    """Nodes mounting the data folder at different paths build the same key."""
+    mount = tmp_path / "mnt"
+    mount.symlink_to(deck.parent)
+    shared = str(tmp_path / "coord")
+    here = LeaseCoordinator(shared, "node-a", data_folder=str(deck.parent))
+    there = LeaseCoordinator(shared, "node-b", data_folder=str(mount))
+
+    assert here.file_key(deck) == there.file_key(mount / deck.name)
+
+def test_failed_files_are_retried_before_giving_up(tmp_path, deck):
+    """A failure releases the file; only the last allowed attempt marks it done."""
+    coordinator = LeaseCoordinator(str(tmp_path / "coord"), "node-a", data_folder=str(deck.parent), max_attempts=2)
+
+    key = coordinator.try_claim(deck)
+    assert coordinator.fail(key, deck, "timeout") is False
+    assert key in coordinator.pending_keys([deck])
+
+    assert coordinator.try_claim(deck) == key
+    assert coordinator.fail(key, deck, "timeout") is True
+    assert coordinator.is_done(key)
+    assert coordinator.pending_keys([deck]) == {}
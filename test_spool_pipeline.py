@@ -0,0 +1,97 @@
+"""
+Spool Pipeline Tests
+Checks resume from committed offsets, stale chunk deletes and log compaction with in-memory stand-ins.
+"""
+
+import pytest
+from pathlib import Path
+from langchain.schema import Document
+from spool_pipeline import SpoolPipeline
+
+class FakeProcessor:
+    """Turns each line of a text file into one chunk."""
+
+    def __init__(self, data_folder: Path):
+        self.data_folder = data_folder
+        self.failed_files = {}
+        self.file_telemetry = {}
+
+    def iter_files(self):
+        return sorted(self.data_folder.glob("*.txt"))
+
+    def _process_files(self, files, max_workers=None, file_timeout=None):
+        results = []
+        for file_path in files:
+            lines = file_path.read_text().splitlines()
+            self.file_telemetry[str(file_path)] = {"status": "ok"}
+            results.append((file_path, [
+                Document(page_content=line, metadata={"chunk_id": f"{file_path.stem}_{i}"})
+                for i, line in enumerate(lines)
+            ]))
+        return results
+
+class FakeVectorDB:
+    """Stores upserted chunks by ID; can be told to fail after a number of batches."""
+
+    def __init__(self, fail_after=None):
+        self.vectors = {}
+        self.batches = 0
+        self.fail_after = fail_after
+
+    def add_documents(self, documents):
+        if self.fail_after is not None and self.batches >= self.fail_after:
+            return False
+        self.batches += 1
+        for doc in documents:
+            self.vectors[doc.metadata["chunk_id"]] = doc.page_content
+        return True
+
+    def delete_vectors(self, ids):
+        for vector_id in ids:
+            self.vectors.pop(vector_id, None)
+        return True
+
+@pytest.fixture
+def corpus(tmp_path):
+    data = tmp_path / "Data"
+    data.mkdir()
+    (data / "a.txt").write_text("\n".join(f"a{i}" for i in range(5)))
+    (data / "b.txt").write_text("\n".join(f"b{i}" for i in range(5)))
+    return data
+
+def test_embed_resumes_from_committed_offset(corpus, tmp_path):
+    """A failed embed run keeps its committed batches, and the next run upserts only the rest."""
+    spool = tmp_path / "spool"
+    pipeline = SpoolPipeline(FakeProcessor(corpus), FakeVectorDB(fail_after=2), str(spool), embed_batch_size=3)
+    pipeline.extract_stage()
+    with pytest.raises(RuntimeError):
+        pipeline.embed_stage()
+    assert pipeline._embed_state()["chunks"] == 6
+
+    vector_db = FakeVectorDB()
+    resumed = SpoolPipeline(FakeProcessor(corpus), vector_db, str(spool), embed_batch_size=3)
+    stats = resumed.embed_stage()
+    assert stats["chunks"] == 4
+    assert sorted(vector_db.vectors) == [f"b_{i}" for i in range(1, 5)]
+    assert resumed._embed_state()["offset"] == resumed._extract_state()["log_bytes"]
+
+def test_shrunk_and_removed_files_delete_their_chunks(corpus, tmp_path):
+    """Chunks a modified file no longer produces, and chunks of removed files, leave the index."""
+    vector_db = FakeVectorDB()
+    pipeline = SpoolPipeline(FakeProcessor(corpus), vector_db, str(tmp_path / "spool"))
+    pipeline.run()
+    assert len(vector_db.vectors) == 10
+
+    (corpus / "a.txt").write_text("a0\na1")
+    (corpus / "b.txt").unlink()
+    pipeline.run()
+    assert sorted(vector_db.vectors) == ["a_0", "a_1"]
+
+def test_log_is_compacted_once_embedded(corpus, tmp_path):
+    """After a full run the log is truncated and both offsets start over."""
+    pipeline = SpoolPipeline(FakeProcessor(corpus), FakeVectorDB(), str(tmp_path / "spool"))
+    pipeline.run()
+    assert pipeline.log_path.stat().st_size == 0
+    assert pipeline._extract_state()["log_bytes"] == 0
+    assert pipeline._embed_state()["offset"] == 0
+    assert pipeline.extract_stage()["files"] == 0
@@ -0,0 +1,100 @@
+"""
+Tokenization Utilities
+Token counting and batch packing for OpenAI embedding budgets, built on tiktoken.
+"""
+
+import logging
+from functools import lru_cache
+from typing import List, Sequence, TypeVar
+import tiktoken
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Encoding used by text-embedding-3-small
+EMBEDDING_ENCODING = "cl100k_base"
+
+# OpenAI embeddings API limits
+MAX_TOKENS_PER_INPUT = 8191
+MAX_TOKENS_PER_REQUEST = 300000
+MAX_INPUTS_PER_REQUEST = 2048
+
+T = TypeVar("T")
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str = EMBEDDING_ENCODING) -> tiktoken.Encoding:
+    """
+    Return a cached tiktoken encoding.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Encoding object (loaded once per process)
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+def count_tokens(text: str, encoding_name: str = EMBEDDING_ENCODING) -> int:
+    """
+    Count tokens in a single text.
+
+    Args:
+        text: Text to tokenize
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Number of tokens
+    """
+    return len(get_encoding(encoding_name).encode(text, disallowed_special=()))
+
+def count_tokens_batch(texts: Sequence[str], encoding_name: str = EMBEDDING_ENCODING) -> List[int]:
+    """
+    Count tokens for many texts with one batched (multi-threaded) encode call.
+
+    Args:
+        texts: Texts to tokenize
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Token counts in the same order as texts
+    """
+    if not texts:
+        return []
+    encoded = get_encoding(encoding_name).encode_batch(list(texts), disallowed_special=())
+    return [len(tokens) for tokens in encoded]
+
+def pack_token_batches(items: Sequence[T], token_counts: Sequence[int],
+                       max_batch_tokens: int = MAX_TOKENS_PER_REQUEST,
+                       max_batch_size: int = MAX_INPUTS_PER_REQUEST) -> List[List[T]]:
+    """
+    Group items into consecutive batches that fill a token budget.
+
+    Order is preserved, so concatenating the batches gives back the input.
+    An item larger than max_batch_tokens gets a batch of its own.
+
+    Args:
+        items: Items to batch (e.g. Documents or chunk texts)
+        token_counts: Token count of each item
+        max_batch_tokens: Token budget per batch
+        max_batch_size: Maximum number of items per batch
+
+    Returns:
+        List of batches
+    """
+    batches = []
+    current = []
+    current_tokens = 0
+
+    for item, tokens in zip(items, token_counts):
+        if current and (current_tokens + tokens > max_batch_tokens or len(current) >= max_batch_size):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
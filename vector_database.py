@@ -4,14 +4,22 @@ Handles vector storage, retrieval, and similarity search for pitch deck document
 """
 
 import os
+import json
+import random
 import logging
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 from pinecone import Pinecone
 from langchain.schema import Document
 from langchain_openai import OpenAIEmbeddings
-import numpy as np
 from dotenv import load_dotenv
+from tokenization import count_tokens_batch, pack_token_batches, MAX_INPUTS_PER_REQUEST
+from embedding_cache import EmbeddingCache
+from rate_limiter import RateLimiter
+from local_vector_index import LocalVectorIndex
 
 # Load environment variables
 load_dotenv()
@@ -20,34 +28,112 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_CACHE_PATH = ".embedding_cache.sqlite"
+
+# Default limits (override per account tier with the matching environment variables)
+DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE = 3000
+DEFAULT_EMBEDDING_TOKENS_PER_MINUTE = 1000000
+DEFAULT_PINECONE_REQUESTS_PER_SECOND = 100
+
+# Pinecone upsert request limits
+MAX_VECTORS_PER_UPSERT = 1000
+MAX_UPSERT_BYTES = 2 * 1024 * 1024
+# Longest JSON form of a float64 plus separator, e.g. "-1.2345678901234567e-308, "
+MAX_FLOAT_JSON_BYTES = 26
+# Fallback vector IDs were numbered in upsert batches of 100; kept so IDs stay stable
+LEGACY_ID_BATCH_SIZE = 100
+DEFAULT_DEAD_LETTER_PATH = "upsert_dead_letter.jsonl"
+
+VECTOR_BACKENDS = ("pinecone", "numpy")
+DEFAULT_LOCAL_INDEX_PATH = "local_vector_index.npz"
+
 class VectorDatabase:
-    """Handles Pinecone vector database operations for pitch deck analysis."""
+    """
+    Handles vector database operations for pitch deck analysis.
+
+    The index backend is chosen by configuration: "pinecone" (default) uses
+    a hosted Pinecone index; "numpy" uses an in-process LocalVectorIndex
+    persisted to LOCAL_INDEX_PATH, for offline use and low-latency search
+    when the corpus fits on one machine. Embeddings come from OpenAI for
+    both backends.
+    """
     
-    def __init__(self):
-        """Initialize the vector database with Pinecone and OpenAI embeddings."""
+    def __init__(self, embedding_cache_path: Optional[str] = None, embedding_cache_max_mb: int = 1024,
+                 backend: Optional[str] = None):
+        """
+        Initialize the vector database with the configured backend and OpenAI embeddings.
+
+        Args:
+            embedding_cache_path: SQLite file for the persistent embedding cache
+                (defaults to EMBEDDING_CACHE_PATH or .embedding_cache.sqlite; "" disables caching)
+            embedding_cache_max_mb: Size cap for cached vectors before LRU eviction
+            backend: "pinecone" or "numpy" (defaults to VECTOR_BACKEND or "pinecone")
+        """
+        self.backend = (backend or os.getenv("VECTOR_BACKEND", "pinecone")).lower()
+        if self.backend not in VECTOR_BACKENDS:
+            raise ValueError(f"Unknown vector backend '{self.backend}', expected one of {VECTOR_BACKENDS}")
+
         self.api_key = os.getenv("PINECONE_API_KEY")
         self.environment = os.getenv("PINECONE_ENVIRONMENT", "us-east-1")
         self.index_name = os.getenv("PINECONE_INDEX_NAME", "1pitchdeck")
-        
-        if not self.api_key:
-            raise ValueError("PINECONE_API_KEY not found in environment variables")
-        
-        # Initialize Pinecone
-        self.pc = Pinecone(api_key=self.api_key)
+        self.pc = None
+
+        if self.backend == "pinecone":
+            if not self.api_key:
+                raise ValueError("PINECONE_API_KEY not found in environment variables")
+
+            # Initialize Pinecone
+            self.pc = Pinecone(api_key=self.api_key)
         
         # Initialize OpenAI embeddings
+        self.embedding_model = "text-embedding-3-small"  # More cost-effective option
+        self.embedding_dimension = 1536  # OpenAI text-embedding-3-small dimension
         self.embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small",  # More cost-effective option
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+            model=self.embedding_model,
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=0  # 429s and transient errors are retried by embedding_limiter
         )
+
+        # Client-side rate limits so requests go out at the maximum allowed rate
+        self.embedding_limiter = RateLimiter(
+            "OpenAI embeddings",
+            float(os.getenv("EMBEDDING_REQUESTS_PER_MINUTE", DEFAULT_EMBEDDING_REQUESTS_PER_MINUTE)),
+            float(os.getenv("EMBEDDING_TOKENS_PER_MINUTE", DEFAULT_EMBEDDING_TOKENS_PER_MINUTE))
+        )
+        if self.backend == "pinecone":
+            self.index_limiter = RateLimiter(
+                "Pinecone",
+                float(os.getenv("PINECONE_REQUESTS_PER_SECOND", DEFAULT_PINECONE_REQUESTS_PER_SECOND)) * 60
+            )
+        else:
+            self.index_limiter = RateLimiter("Local index", None)
+
+        # Persistent embedding cache shared by ingestion and search
+        if embedding_cache_path is None:
+            embedding_cache_path = os.getenv("EMBEDDING_CACHE_PATH", DEFAULT_EMBEDDING_CACHE_PATH)
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        if embedding_cache_path:
+            try:
+                self.embedding_cache = EmbeddingCache(embedding_cache_path, self.embedding_model,
+                                                      self.embedding_dimension, embedding_cache_max_mb * 1024 * 1024)
+            except Exception as e:
+                logger.warning(f"Embedding cache unavailable, embedding without it: {e}")
         
+        self.dead_letter_path = os.getenv("UPSERT_DEAD_LETTER_PATH", DEFAULT_DEAD_LETTER_PATH)
         self.index = None
+        self.last_ingest_stats: Dict[str, Any] = {}
 
         # Initialize the index
         self._setup_index()
     
     def _setup_index(self):
-        """Set up the Pinecone index with proper configuration."""
+        """Set up the Pinecone index (or the local index) with proper configuration."""
+        if self.backend == "numpy":
+            self.index = LocalVectorIndex(self.embedding_dimension,
+                                          os.getenv("LOCAL_INDEX_PATH", DEFAULT_LOCAL_INDEX_PATH))
+            logger.info(f"Local vector index initialized with {len(self.index)} vectors")
+            return
+
         try:
             # Check if index exists
             existing_indexes = [index.name for index in self.pc.list_indexes()]
@@ -58,13 +144,11 @@ class VectorDatabase:
                 # Create index
                 self.pc.create_index(
                     name=self.index_name,
-                    dimension=1536,  # OpenAI text-embedding-3-small dimension
+                    dimension=self.embedding_dimension,
                     metric="cosine"
                 )
 
-                # Wait for index to be ready
-                logger.info("Waiting for index to be ready...")
-                time.sleep(10)
+                self._wait_for_index_ready()
             else:
                 logger.info(f"Using existing index: {self.index_name}")
 
@@ -77,16 +161,68 @@ class VectorDatabase:
             logger.error(f"Failed to setup Pinecone index: {e}")
             raise
     
-    def add_documents(self, documents: List[Document], batch_size: int = 100) -> bool:
+    def _wait_for_index_ready(self, timeout: float = 300.0, max_interval: float = 5.0):
+        """
+        Poll the index description until Pinecone reports it ready.
+
+        Args:
+            timeout: Seconds to wait before giving up
+            max_interval: Longest delay between polls (polling starts at 0.5s and backs off)
+
+        Raises:
+            TimeoutError: If the index is not ready within timeout
+        """
+        logger.info("Waiting for index to be ready...")
+        start = time.monotonic()
+        interval = 0.5
+
+        while True:
+            try:
+                status = self.pc.describe_index(self.index_name).status
+                ready = status.get("ready") if isinstance(status, dict) else getattr(status, "ready", False)
+                if ready:
+                    logger.info(f"Index ready after {time.monotonic() - start:.1f}s")
+                    return
+            except Exception as e:
+                logger.warning(f"Error checking index status: {e}")
+
+            if time.monotonic() - start + interval > timeout:
+                raise TimeoutError(f"Index {self.index_name} not ready after {timeout:.0f}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+    def add_documents(self, documents: List[Document], batch_size: int = MAX_VECTORS_PER_UPSERT,
+                      max_batch_tokens: int = 100000, max_concurrency: int = 4,
+                      max_batch_bytes: int = MAX_UPSERT_BYTES, upsert_concurrency: int = 4,
+                      upsert_retries: int = 3, dead_letter_path: Optional[str] = None) -> bool:
         """
         Add documents to the vector database in batches.
 
+        Chunks found in the embedding cache are not re-embedded. The rest are
+        embedded with batched embed_documents requests packed up to
+        max_batch_tokens tokens each, with up to max_concurrency requests in
+        flight. Embeddings are consumed in document order, so vectors and IDs
+        match one-by-one embedding.
+
+        Upserts run on their own pool of up to upsert_concurrency requests,
+        overlapping with embedding of the following batches. Upsert batches
+        are cut at max_batch_bytes of estimated request payload or batch_size
+        vectors, whichever comes first. A batch that still fails after
+        upsert_retries attempts is appended to the dead-letter file for
+        replay_dead_letters instead of being dropped.
+
         Args:
             documents: List of Document objects to add
-            batch_size: Number of documents to process in each batch
+            batch_size: Maximum vectors per upsert request
+            max_batch_tokens: Token budget per embedding request
+            max_concurrency: Maximum concurrent embedding requests
+            max_batch_bytes: Maximum estimated payload bytes per upsert request
+            upsert_concurrency: Maximum concurrent upsert requests
+            upsert_retries: Attempts per upsert batch before it is dead-lettered
+            dead_letter_path: JSON-lines file for failed batches (defaults to self.dead_letter_path)
 
         Returns:
-            True if successful, False otherwise
+            True if every chunk was embedded and upserted, False otherwise
         """
         try:
             if not documents:
@@ -94,46 +230,134 @@ class VectorDatabase:
                 return False
 
             logger.info(f"Adding {len(documents)} documents to vector database...")
+            start = time.perf_counter()
+            dead_letter_path = dead_letter_path or self.dead_letter_path
+
+            # Embeddings ready to upsert, by document position (None marks a failed chunk)
+            ready: Dict[int, Optional[List[float]]] = {}
+            if self.embedding_cache:
+                cached = self.embedding_cache.get_many([doc.page_content for doc in documents])
+                ready = {index: embedding for index, embedding in enumerate(cached) if embedding is not None}
+            to_embed = [index for index in range(len(documents)) if index not in ready]
+
+            token_counts = self._token_counts(documents)
+            max_inputs = min(MAX_INPUTS_PER_REQUEST, getattr(self.embeddings, "chunk_size", MAX_INPUTS_PER_REQUEST))
+            if self.embedding_limiter.tokens:
+                # A request may not exceed the whole per-minute token budget
+                max_batch_tokens = min(max_batch_tokens, int(self.embedding_limiter.tokens.rate * 60))
+            embed_batches = pack_token_batches(to_embed, [token_counts[index] for index in to_embed],
+                                               max_batch_tokens, max_inputs)
+
+            stats = {"chunks": 0, "tokens": 0, "embedding_requests": 0, "failed_chunks": 0, "upserts": 0,
+                     "dead_lettered": 0, "cache_hits": len(ready)}
+            pending_vectors = []
+            pending_bytes = 0
+            next_position = 0
+            upserts_in_flight = deque()
+
+            def finish_upsert():
+                vectors, future = upserts_in_flight.popleft()
+                error = future.result()
+                if error is None:
+                    stats["upserts"] += 1
+                    stats["chunks"] += len(vectors)
+                    logger.info(f"Added batch {stats['upserts']} ({stats['chunks']}/{len(documents)} chunks)")
+                else:
+                    stats["failed_chunks"] += len(vectors)
+                    if self._dead_letter(dead_letter_path, vectors, error):
+                        stats["dead_lettered"] += len(vectors)
+
+            def submit_upsert():
+                nonlocal pending_vectors, pending_bytes
+                # Bounded in-flight upserts keep memory flat when the index is slower than embedding
+                while len(upserts_in_flight) >= max(1, upsert_concurrency):
+                    finish_upsert()
+                upserts_in_flight.append((pending_vectors, upsert_executor.submit(
+                    self._upsert_with_retry, pending_vectors, upsert_retries
+                )))
+                pending_vectors = []
+                pending_bytes = 0
+
+            def flush_ready():
+                nonlocal next_position, pending_bytes
+                # Emit in document order; cache hits wait for the misses before them
+                while next_position in ready:
+                    embedding = ready.pop(next_position)
+                    if embedding is not None:
+                        record = self._vector_record(documents[next_position], embedding, next_position)
+                        record_bytes = self._estimate_record_bytes(record)
+                        if pending_vectors and pending_bytes + record_bytes > max_batch_bytes:
+                            submit_upsert()
+                        pending_vectors.append(record)
+                        pending_bytes += record_bytes
+                        if len(pending_vectors) >= batch_size:
+                            submit_upsert()
+                    next_position += 1
+
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor, \
+                    ThreadPoolExecutor(max_workers=max(1, upsert_concurrency)) as upsert_executor:
+                in_flight = deque()
+                remaining = iter(embed_batches)
+
+                def submit_next():
+                    indices = next(remaining, None)
+                    if indices is not None:
+                        texts = [documents[index].page_content for index in indices]
+                        tokens = sum(token_counts[index] for index in indices)
+                        in_flight.append((indices, executor.submit(
+                            self.embedding_limiter.call, self.embeddings.embed_documents, texts, tokens=tokens
+                        )))
+
+                for _ in range(max(1, max_concurrency)):
+                    submit_next()
+                flush_ready()
+
+                # Consume in submission order so vectors stay in document order
+                while in_flight:
+                    indices, future = in_flight.popleft()
+                    try:
+                        embeddings = future.result()
+                        stats["embedding_requests"] += 1
+                        stats["tokens"] += sum(token_counts[index] for index in indices)
+                    except Exception as e:
+                        logger.error(f"Error embedding {len(indices)} chunks starting at {indices[0]}: {e}")
+                        stats["failed_chunks"] += len(indices)
+                        embeddings = [None] * len(indices)
+                    submit_next()
+
+                    if self.embedding_cache and embeddings[0] is not None:
+                        self.embedding_cache.put_many([documents[index].page_content for index in indices], embeddings)
+                    ready.update(zip(indices, embeddings))
+                    flush_ready()
+
+                if pending_vectors:
+                    submit_upsert()
+                while upserts_in_flight:
+                    finish_upsert()
+
+            self._persist_index()
+
+            elapsed = time.perf_counter() - start
+            stats["seconds"] = round(elapsed, 3)
+            stats["chunks_per_second"] = round(stats["chunks"] / elapsed, 2) if elapsed else 0.0
+            stats["tokens_per_second"] = round(stats["tokens"] / elapsed, 1) if elapsed else 0.0
+            stats["cache_hit_ratio"] = round(stats["cache_hits"] / len(documents), 3)
+            stats["rate_limits"] = {"embedding": self.embedding_limiter.get_stats(),
+                                    "index": self.index_limiter.get_stats()}
+            self.last_ingest_stats = stats
+
+            logger.info(
+                f"Upserted {stats['chunks']}/{len(documents)} chunks in {elapsed:.1f}s "
+                f"({stats['chunks_per_second']} chunks/sec, {stats['tokens_per_second']} tokens/sec, "
+                f"{stats['embedding_requests']} embedding requests, {stats['upserts']} upserts, "
+                f"{stats['cache_hit_ratio']:.0%} embedding cache hits)"
+            )
 
-            # Process documents in batches
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                vectors_to_upsert = []
-
-                try:
-                    # Prepare vectors for this batch
-                    for j, doc in enumerate(batch):
-                        # Generate embedding for the document
-                        embedding = self.embeddings.embed_query(doc.page_content)
-
-                        # Create unique ID
-                        doc_id = f"{doc.metadata.get('document_id', f'doc_{i}_{j}')}"
-
-                        # Prepare metadata (Pinecone has limits on metadata size)
-                        metadata = {
-                            "text": doc.page_content[:1000],  # Limit text size
-                            "company_name": doc.metadata.get('company_name', ''),
-                            "file_name": doc.metadata.get('file_name', ''),
-                            "file_type": doc.metadata.get('file_type', ''),
-                            "chunk_index": doc.metadata.get('chunk_index', 0)
-                        }
-
-                        vectors_to_upsert.append({
-                            "id": doc_id,
-                            "values": embedding,
-                            "metadata": metadata
-                        })
-
-                    # Upsert to Pinecone
-                    self.index.upsert(vectors=vectors_to_upsert)
-                    logger.info(f"Added batch {i//batch_size + 1}/{(len(documents)-1)//batch_size + 1}")
-
-                    # Small delay to avoid rate limits
-                    time.sleep(2)
-
-                except Exception as e:
-                    logger.error(f"Error adding batch {i//batch_size + 1}: {e}")
-                    continue
+            if stats["failed_chunks"]:
+                logger.error(f"{stats['failed_chunks']} chunks were not added"
+                             + (f" ({stats['dead_lettered']} written to {dead_letter_path})"
+                                if stats["dead_lettered"] else ""))
+                return False
 
             logger.info("Successfully added all documents to vector database")
             return True
@@ -141,7 +365,206 @@ class VectorDatabase:
         except Exception as e:
             logger.error(f"Failed to add documents: {e}")
             return False
+
+    def _persist_index(self):
+        """Append the local index's changes to disk after writes (Pinecone persists server-side)."""
+        if isinstance(self.index, LocalVectorIndex):
+            self.index.persist()
+
+    def _upsert_with_retry(self, vectors: List[Dict[str, Any]], attempts: int = 3,
+                           base_delay: float = 1.0) -> Optional[Exception]:
+        """
+        Upsert one batch, retrying errors other than rate limits (the limiter handles those).
+
+        Args:
+            vectors: Upsert records
+            attempts: Total attempts before giving up
+            base_delay: First backoff delay; doubles (with jitter) per attempt
+
+        Returns:
+            None on success, otherwise the last error
+        """
+        for attempt in range(max(1, attempts)):
+            try:
+                self.index_limiter.call(self.index.upsert, vectors=vectors)
+                return None
+            except Exception as e:
+                if attempt + 1 >= attempts:
+                    logger.error(f"Upsert of {len(vectors)} vectors failed after {attempts} attempts: {e}")
+                    return e
+                delay = random.uniform(0, base_delay * 2 ** attempt)
+                logger.warning(f"Upsert of {len(vectors)} vectors failed, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+
+    def _dead_letter(self, path: str, vectors: List[Dict[str, Any]], error: Exception) -> bool:
+        """
+        Append a failed upsert batch to the dead-letter file.
+
+        Args:
+            path: JSON-lines dead-letter file
+            vectors: Upsert records that could not be written
+            error: Last error for the batch
+
+        Returns:
+            True if the batch was recorded
+        """
+        try:
+            line = json.dumps({"failed_at": datetime.now().isoformat(), "error": str(error), "vectors": vectors})
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            return True
+        except Exception as e:
+            logger.error(f"Could not write {len(vectors)} vectors to dead-letter file {path}: {e}")
+            return False
+
+    def replay_dead_letters(self, dead_letter_path: Optional[str] = None, upsert_retries: int = 3) -> Dict[str, int]:
+        """
+        Retry upsert batches from the dead-letter file.
+
+        Batches that succeed are removed; batches that fail again stay in the
+        file (rewritten atomically).
+
+        Args:
+            dead_letter_path: JSON-lines dead-letter file (defaults to self.dead_letter_path)
+            upsert_retries: Attempts per batch
+
+        Returns:
+            Dictionary with replayed and remaining vector counts
+        """
+        path = dead_letter_path or self.dead_letter_path
+        result = {"replayed": 0, "remaining": 0}
+        if not os.path.exists(path):
+            return result
+
+        remaining_lines = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    vectors = json.loads(line)["vectors"]
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping unreadable dead-letter entry: {e}")
+                    remaining_lines.append(line)
+                    continue
+                if self._upsert_with_retry(vectors, upsert_retries) is None:
+                    result["replayed"] += len(vectors)
+                else:
+                    result["remaining"] += len(vectors)
+                    remaining_lines.append(line)
+
+        self._persist_index()
+        if remaining_lines:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(remaining_lines)
+            os.replace(temp_path, path)
+        else:
+            os.remove(path)
+
+        logger.info(f"Replayed {result['replayed']} dead-lettered vectors, {result['remaining']} remaining")
+        return result
+
+    @staticmethod
+    def _estimate_record_bytes(record: Dict[str, Any]) -> int:
+        """
+        Estimate the serialized size of an upsert record.
+
+        Metadata and ID are measured exactly. Values are costed at the
+        longest JSON form of a float64, which is cheaper than serializing
+        every vector and never underestimates.
+
+        Args:
+            record: Upsert record from _vector_record
+
+        Returns:
+            Upper bound of the record's JSON size in bytes
+        """
+        return (len(json.dumps(record["metadata"])) + len(record["id"].encode('utf-8'))
+                + len(record["values"]) * MAX_FLOAT_JSON_BYTES + 64)
+
+    def _token_counts(self, documents: List[Document]) -> List[int]:
+        """
+        Get token counts for batch packing, reusing counts recorded at chunking time.
+
+        Args:
+            documents: List of Document objects
+
+        Returns:
+            Token counts in document order (estimated from length if tiktoken is unavailable)
+        """
+        missing = [i for i, doc in enumerate(documents) if "token_count" not in doc.metadata]
+        counts = [doc.metadata.get("token_count", 0) for doc in documents]
+        if not missing:
+            return counts
+
+        texts = [documents[i].page_content for i in missing]
+        try:
+            computed = count_tokens_batch(texts)
+        except Exception as e:
+            # Conservative estimate (about 3 characters per token) keeps batches under budget
+            logger.warning(f"Token counting unavailable, estimating from length: {e}")
+            computed = [len(text) // 3 + 1 for text in texts]
+
+        for i, tokens in zip(missing, computed):
+            counts[i] = tokens
+        return counts
+
+    @staticmethod
+    def _vector_record(doc: Document, embedding: List[float], position: int) -> Dict[str, Any]:
+        """
+        Build the Pinecone upsert record for a chunk.
+
+        Args:
+            doc: Chunk document
+            embedding: Chunk embedding
+            position: Index of the chunk in the add_documents call (used for the legacy fallback ID)
+
+        Returns:
+            Dictionary with id, values and metadata
+        """
+        # Create unique ID (one vector per chunk)
+        fallback_id = f"doc_{position - position % LEGACY_ID_BATCH_SIZE}_{position % LEGACY_ID_BATCH_SIZE}"
+        doc_id = doc.metadata.get('chunk_id') or f"{doc.metadata.get('document_id', fallback_id)}"
+
+        # Prepare metadata (Pinecone has limits on metadata size)
+        metadata = {
+            "text": doc.page_content[:1000],  # Limit text size
+            "company_name": doc.metadata.get('company_name', ''),
+            "file_name": doc.metadata.get('file_name', ''),
+            "file_type": doc.metadata.get('file_type', ''),
+            "chunk_index": doc.metadata.get('chunk_index', 0)
+        }
+
+        return {
+            "id": doc_id,
+            "values": embedding,
+            "metadata": metadata
+        }
     
+    def _embed_query(self, query: str) -> List[float]:
+        """
+        Embed a search query, reusing the cached embedding when available.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            Query embedding
+        """
+        if self.embedding_cache:
+            cached = self.embedding_cache.get(query)
+            if cached is not None:
+                return cached
+
+        # Rough token estimate (about 3 characters per token); queries are short
+        embedding = self.embedding_limiter.call(self.embeddings.embed_query, query, tokens=len(query) // 3 + 1)
+        if self.embedding_cache:
+            self.embedding_cache.put(query, embedding)
+        return embedding
+
     def search_similar_documents(self, query: str, k: int = 5, filter_dict: Optional[Dict] = None) -> List[Document]:
         """
         Search for similar documents using semantic similarity.
@@ -156,10 +579,11 @@ class VectorDatabase:
         """
         try:
             # Generate embedding for the query
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self._embed_query(query)
 
             # Perform similarity search
-            search_results = self.index.query(
+            search_results = self.index_limiter.call(
+                self.index.query,
                 vector=query_embedding,
                 top_k=k,
                 include_metadata=True,
@@ -257,16 +681,40 @@ class VectorDatabase:
             stats = self.index.describe_index_stats()
             
             return {
+                "backend": self.backend,
                 "total_vectors": stats.get("total_vector_count", 0),
                 "index_fullness": stats.get("index_fullness", 0),
                 "dimension": stats.get("dimension", 0),
-                "namespaces": stats.get("namespaces", {})
+                "namespaces": stats.get("namespaces", {}),
+                "embedding_cache": self.embedding_cache.get_stats() if self.embedding_cache else {}
             }
             
         except Exception as e:
             logger.error(f"Error getting database stats: {e}")
             return {}
     
+    def delete_vectors(self, ids: List[str], batch_size: int = 1000) -> bool:
+        """
+        Delete specific vectors from the index by ID.
+
+        Args:
+            ids: Vector IDs to delete (e.g. stale chunk IDs from the ingestion manifest)
+            batch_size: Number of IDs per delete request
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            for i in range(0, len(ids), batch_size):
+                self.index_limiter.call(self.index.delete, ids=ids[i:i + batch_size])
+            self._persist_index()
+            logger.info(f"Deleted {len(ids)} vectors")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting vectors: {e}")
+            return False
+
     def delete_all_vectors(self) -> bool:
         """
         Delete all vectors from the index (use with caution).
@@ -277,6 +725,7 @@ class VectorDatabase:
         try:
             logger.warning("Deleting all vectors from the index...")
             self.index.delete(delete_all=True)
+            self._persist_index()
             logger.info("All vectors deleted successfully")
             return True
             